@@ -3,15 +3,29 @@
 Content Builder JSON을 subjects 폴더 구조로 변환
 
 Usage:
-    python3 builder_to_subjects.py <builder_json_file> [output_dir]
+    python3 builder_to_subjects.py <builder_json_file> [output_dir] [--stream] [--image-workers N]
+                                   [--image-store DIR] [--image-store-max-mb N] [--incremental]
+                                   [--lesson-workers N]
 """
 
+import io
 import json
 import sys
 import os
 import re
 import base64
 import hashlib
+import collections
+import shutil
+import threading
+import time
+import zipfile
+import functools
+import itertools
+import contextlib
+import contextvars
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -30,6 +44,57 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
+# JSON 문자열 이스케이프 (json 모듈의 C 구현, ensure_ascii=False와 같은 결과)
+_encode_json_string = json.encoder.encode_basestring
+
+# JSON을 파일에 쓸 때 모아서 한 번에 쓰는 최대 글자 수
+_JSON_WRITE_BATCH = 8 * 1024
+
+
+def _write_legacy_json(value, write, indent, separator, inline_list_max, level=0):
+    """
+    legacy_json_dumps 형식으로 value를 write(조각)에 순서대로 씀
+
+    자식의 직렬화 결과를 문자열로 이어 붙이지 않고 바로 쓰므로 전체 크기에 비례하는 시간이 걸림
+    """
+    if isinstance(value, str):
+        write(_encode_json_string(value))
+    elif isinstance(value, dict):
+        if not value:
+            write('{}')
+            return
+        next_indent = '\n' + indent * (level + 1)
+        item_prefix = '{' + next_indent
+        for key, val in value.items():
+            write(f'{item_prefix}"{key}"{separator}')
+            _write_legacy_json(val, write, indent, separator, inline_list_max, level + 1)
+            item_prefix = ',' + next_indent
+        write('\n' + indent * level + '}')
+    elif isinstance(value, list):
+        # sections 배열은 한 줄로 (문자열 배열이고 inline_list_max개 이하인 경우)
+        if len(value) <= inline_list_max and all(isinstance(item, str) for item in value):
+            write('[' + ', '.join(map(_encode_json_string, value)) + ']')
+            return
+        # 다른 배열은 여러 줄로
+        next_indent = '\n' + indent * (level + 1)
+        item_prefix = '[' + next_indent
+        for item in value:
+            write(item_prefix)
+            _write_legacy_json(item, write, indent, separator, inline_list_max, level + 1)
+            item_prefix = ',' + next_indent
+        write('\n' + indent * level + ']')
+    elif value is None:
+        write('null')
+    elif value is True:
+        write('true')
+    elif value is False:
+        write('false')
+    elif isinstance(value, (int, float)):
+        write(str(value))
+    else:
+        write('null')
+
+
 def legacy_json_dumps(obj, indent='\t', use_space_separator=True):
     """
     레거시 템플릿용 커스텀 JSON 직렬화
@@ -37,47 +102,342 @@ def legacy_json_dumps(obj, indent='\t', use_space_separator=True):
     - 탭 들여쓰기
     - use_space_separator=True: ' : ' (2018), False: ': ' (2019+)
     """
-    separator = ' : ' if use_space_separator else ': '
-
-    def serialize_value(value, level=0):
-        indent_str = indent * level
-        next_indent = indent * (level + 1)
-
-        if value is None:
-            return 'null'
-        elif isinstance(value, bool):
-            return 'true' if value else 'false'
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, str):
-            # JSON 이스케이프
-            escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-            return f'"{escaped}"'
-        elif isinstance(value, list):
-            # sections 배열은 한 줄로 (문자열 배열이고 4개 이하인 경우)
-            if all(isinstance(item, str) for item in value) and len(value) <= 4:
-                # 각 아이템도 제대로 escape 처리
-                items = ', '.join(serialize_value(item, 0) for item in value)
-                return f'[{items}]'
-            # 다른 배열은 여러 줄로
-            if not value:
-                return '[]'
-            items = []
-            for item in value:
-                items.append(f'{next_indent}{serialize_value(item, level + 1)}')
-            return '[\n' + ',\n'.join(items) + f'\n{indent_str}]'
-        elif isinstance(value, dict):
-            if not value:
-                return '{}'
-            items = []
-            for key, val in value.items():
-                serialized_val = serialize_value(val, level + 1)
-                items.append(f'{next_indent}"{key}"{separator}{serialized_val}')
-            return '{\n' + ',\n'.join(items) + f'\n{indent_str}}}'
+    parts = []
+    _write_legacy_json(obj, parts.append, indent, ' : ' if use_space_separator else ': ', 4)
+    return ''.join(parts)
+
+
+def _batched_writer(fp):
+    """조각을 _JSON_WRITE_BATCH 글자까지 모아 fp에 쓰는 (write, flush) 쌍"""
+    parts = []
+    size = 0
+
+    def write(text):
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        if size >= _JSON_WRITE_BATCH:
+            flush()
+
+    def flush():
+        nonlocal size
+        fp.write(''.join(parts))
+        parts.clear()
+        size = 0
+
+    return write, flush
+
+
+def legacy_json_dump(obj, fp, indent='\t', use_space_separator=True):
+    """legacy_json_dumps(obj)와 같은 내용을 fp에 씀 (전체 문자열을 만들지 않고 조각 단위로 씀)"""
+    write, flush = _batched_writer(fp)
+    _write_legacy_json(obj, write, indent, ' : ' if use_space_separator else ': ', 4)
+    flush()
+
+
+class DataJsonWriter:
+    """
+    차시 data.json을 페이지 단위로 쓰는 writer
+
+    header(pages 이외의 키)를 먼저 쓰고, emit(page)로 받은 페이지를 바로 직렬화해 fp에 씀
+    close()까지의 출력은 dict(header, pages=[...])를 한 번에 직렬화한 것과 같음 (페이지는 create_*_page의 dict)
+    - legacy=False: json.dump(ensure_ascii=False, indent=2)
+    - legacy=True: legacy_json_dump (use_space_separator에 따라 ' : ' 또는 ': ') + 마지막 줄바꿈
+    """
+
+    def __init__(self, fp, header, legacy=False, use_space_separator=True):
+        self.legacy = legacy
+        self.separator = ' : ' if use_space_separator else ': '
+        self.count = 0
+        self._write, self._flush = _batched_writer(fp)
+        if legacy:
+            text = legacy_json_dumps(dict(header, pages=[]), use_space_separator=use_space_separator)
+            self._page_indent = '\n\t\t'
+            self._close = '\n\t]\n}\n'
+        else:
+            text = json.dumps(dict(header, pages=[]), ensure_ascii=False, indent=2)
+            self._encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+            self._page_indent = '\n    '
+            self._close = '\n  ]\n}'
+        # '"pages": []\n}'에서 '[]' 앞까지 씀
+        self._empty_tail = text[text.rindex('[]'):] + ('\n' if legacy else '')
+        self._write(text[:text.rindex('[]')])
+
+    def emit(self, page):
+        """페이지 하나를 직렬화해 씀"""
+        self._write(('[' if self.count == 0 else ',') + self._page_indent)
+        self.count += 1
+        if self.legacy:
+            _write_legacy_json(page, self._write, '\t', self.separator, 4, level=2)
+        else:
+            # 페이지는 pages 배열 안(2단계)에 있으므로 줄마다 4칸 추가
+            # (문자열 안의 줄바꿈은 \\n으로 이스케이프되므로 구조의 줄바꿈만 바뀜)
+            for chunk in self._encoder.iterencode(page):
+                self._write(chunk.replace('\n', self._page_indent))
+
+    def close(self):
+        """pages 배열과 최상위 객체를 닫고 남은 조각을 씀"""
+        self._write(self._close if self.count else self._empty_tail)
+        self._flush()
+
+
+class HtmlTransform:
+    """
+    HTML 조각 변환 하나 (정규식은 모듈 로드 시 한 번만 컴파일)
+
+    needles 중 어느 문자열도 조각에 없으면 변환이 매칭될 수 없으므로 실행하지 않음.
+    실행/건너뜀 횟수는 html_transform_stats()로 확인 (단일 패스 토크나이저가 대신 처리한 조각은 count로 집계)
+    """
+
+    __slots__ = ("name", "function", "needles", "hits", "skips")
+
+    def __init__(self, name, function, needles=()):
+        self.name = name
+        self.function = function
+        self.needles = tuple(needles)
+        self.hits = 0
+        self.skips = 0
+
+    def __call__(self, text):
+        if self.needles:
+            for needle in self.needles:
+                if needle in text:
+                    break
+            else:
+                self.skips += 1
+                return text
+        self.hits += 1
+        return self.function(text)
+
+    def count(self, text):
+        """실행하지 않고 실행/건너뜀 횟수만 기록 (같은 변환을 단일 패스 토크나이저가 처리한 조각)"""
+        for needle in self.needles:
+            if needle in text:
+                break
         else:
-            return 'null'
+            if self.needles:
+                self.skips += 1
+                return
+        self.hits += 1
+
+
+# 이름 → HtmlTransform (등록 순서 유지)
+HTML_TRANSFORMS = {}
+
+
+def _html_transform(name, *needles):
+    """함수를 HTML 변환으로 등록하는 데코레이터 (needles: 실행 조건 문자열)"""
+    def register(function):
+        transform = HtmlTransform(name, function, needles)
+        HTML_TRANSFORMS[name] = transform
+        return transform
+    return register
+
+
+def _regex_transform(name, pattern, replacement, *needles, flags=0):
+    """정규식 치환을 HTML 변환으로 등록"""
+    return _html_transform(name, *needles)(functools.partial(re.compile(pattern, flags).sub, replacement))
+
+
+def html_transform_stats():
+    """
+    변환별 실행/건너뜀 횟수 (현재 프로세스 기준)
+
+    Returns:
+        {변환 이름: {"hits": 실행 횟수, "skips": 건너뜀 횟수}}
+    """
+    return {name: {"hits": t.hits, "skips": t.skips} for name, t in HTML_TRANSFORMS.items()}
+
+
+def reset_html_transform_stats():
+    for transform in HTML_TRANSFORMS.values():
+        transform.hits = transform.skips = 0
+
+
+def _merge_html_transform_stats(stats):
+    """다른 프로세스(차시 worker)의 html_transform_stats() 결과를 현재 프로세스 횟수에 더함"""
+    for name, counts in stats.items():
+        transform = HTML_TRANSFORMS[name]
+        transform.hits += counts["hits"]
+        transform.skips += counts["skips"]
+
+
+def format_html_transform_stats(stats=None):
+    """html_transform_stats() 결과를 표 형태 문자열로"""
+    stats = html_transform_stats() if stats is None else stats
+    lines = [f"{'transform':<22} {'hits':>8} {'skips':>8} {'skipped':>8}"]
+    for name, counts in stats.items():
+        total = counts["hits"] + counts["skips"]
+        ratio = f"{counts['skips'] / total:.0%}" if total else "-"
+        lines.append(f"{name:<22} {counts['hits']:>8} {counts['skips']:>8} {ratio:>8}")
+    return "\n".join(lines)
+
+
+# 정리 결과 메모 캐시 기본 최대 크기
+DEFAULT_HTML_FRAGMENT_CACHE_BYTES = 64 * 1024 * 1024
+# 이보다 큰 조각은 캐시하지 않음 (한 조각이 캐시를 밀어내지 않도록)
+DEFAULT_HTML_FRAGMENT_MAX_BYTES = 256 * 1024
+# 정리 변환이 바뀌면 올림 (이전 버전의 결과를 재사용하지 않도록 캐시 key에 포함)
+HTML_CLEAN_VERSION = 1
 
-    return serialize_value(obj)
+
+class HtmlFragmentCache:
+    """
+    HTML 조각 정리 결과 메모 캐시 (LRU, 전체 크기 제한)
+
+    같은 문구(학습목표, 해설, 정리 항목 등)는 차시와 export를 넘어 반복되므로,
+    조각 해시와 정리 변환 버전을 key로 정리 결과를 보관하고 프로세스가 살아 있는 동안
+    (API 서버, 여러 번의 convert_course_data 호출) 재사용함
+
+    base64 이미지(data:image/)가 있는 조각은 캐시하지 않음: 크기가 커서 다른 항목을 밀어내고,
+    이미지 번호/파일은 정리 이후 extract_and_save_images에서 매번 새로 정해지므로
+    정리 결과만 재사용해도 되는 조각이 아님
+    """
+
+    def __init__(self, max_bytes=DEFAULT_HTML_FRAGMENT_CACHE_BYTES, max_fragment_bytes=DEFAULT_HTML_FRAGMENT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.max_fragment_bytes = max_fragment_bytes
+        self._entries = collections.OrderedDict()  # key -> (정리 결과, 크기)
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+
+    def _cacheable(self, html_content):
+        return (
+            '<' in html_content
+            and len(html_content) <= self.max_fragment_bytes
+            and 'data:image/' not in html_content
+        )
+
+    def _key(self, html_content, variant):
+        digest = hashlib.blake2b(html_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return (variant, HTML_CLEAN_VERSION, digest)
+
+    def _store(self, cleaned_items):
+        """[(key, 정리 결과)] 저장 후 크기 제한을 넘으면 오래 사용하지 않은 항목부터 삭제 (lock 안에서 호출)"""
+        for key, cleaned in cleaned_items:
+            if key in self._entries:
+                continue
+            size = sys.getsizeof(cleaned) + len(key[2])
+            self._entries[key] = (cleaned, size)
+            self.size += size
+        while self.size > self.max_bytes and self._entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def clean(self, html_content, variant, function):
+        """
+        캐시된 정리 결과 반환 (없으면 function(html_content)로 정리 후 저장)
+
+        Args:
+            html_content: HTML 문자열
+            variant: 정리 방식 (HTML_VARIANT_BUILDER / HTML_VARIANT_EXPORTER)
+            function: 정리 함수
+        """
+        if not self.max_bytes or not self._cacheable(html_content):
+            self.bypassed += 1
+            return function(html_content)
+
+        key = self._key(html_content, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        cleaned = function(html_content)
+        with self._lock:
+            self._store([(key, cleaned)])
+        return cleaned
+
+    def clean_many(self, fragments, variant, function):
+        """
+        여러 조각을 한 번에 정리 (clean을 조각마다 호출한 것과 같은 결과, 순서 유지)
+
+        같은 조각은 한 번만 정리하고, 캐시 조회와 저장은 lock을 한 번씩만 잡음
+
+        Returns:
+            정리 결과 목록 (fragments와 같은 순서)
+        """
+        results = {}
+        keys = {}
+        for html_content in fragments:
+            if html_content in results or html_content in keys:
+                continue
+            if not self.max_bytes or not self._cacheable(html_content):
+                self.bypassed += 1
+                results[html_content] = function(html_content)
+            else:
+                keys[html_content] = self._key(html_content, variant)
+
+        missing = []
+        with self._lock:
+            for html_content, key in keys.items():
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results[html_content] = entry[0]
+                else:
+                    self.misses += 1
+                    missing.append((html_content, key))
+
+        cleaned_items = []
+        for html_content, key in missing:
+            cleaned = results[html_content] = function(html_content)
+            cleaned_items.append((key, cleaned))
+        if cleaned_items:
+            with self._lock:
+                self._store(cleaned_items)
+        return [results[html_content] for html_content in fragments]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = self.misses = self.bypassed = self.evictions = 0
+
+    def take_counters(self):
+        """
+        조회 횟수를 반환하고 0으로 되돌림 (차시 worker의 실행분을 메인 프로세스로 넘길 때)
+
+        Returns:
+            {"hits", "misses", "bypassed", "evictions"}
+        """
+        with self._lock:
+            counters = {"hits": self.hits, "misses": self.misses, "bypassed": self.bypassed,
+                        "evictions": self.evictions}
+            self.hits = self.misses = self.bypassed = self.evictions = 0
+        return counters
+
+    def add_counters(self, counters):
+        """take_counters() 결과를 조회 횟수에 더함"""
+        with self._lock:
+            self.hits += counters["hits"]
+            self.misses += counters["misses"]
+            self.bypassed += counters["bypassed"]
+            self.evictions += counters["evictions"]
+
+    def stats(self):
+        """{"entries", "bytes", "hits", "misses", "bypassed", "evictions"}"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+        }
+
+
+# 프로세스 전체에서 공유하는 정리 결과 캐시 (max_bytes=0이면 사용하지 않음)
+HTML_FRAGMENT_CACHE = HtmlFragmentCache()
 
 
 def clean_html_for_export(html_content):
@@ -93,119 +453,214 @@ def clean_html_for_export(html_content):
     """
     if not html_content:
         return html_content
+    return HTML_FRAGMENT_CACHE.clean(html_content, HTML_VARIANT_BUILDER, _clean_html)
 
-    # data-original-src가 있으면 src를 data-original-src로 교체하고 data-original-src 제거
-    # <img src="base64..." data-original-src="../images/file.png">
-    # → <img src="../images/file.png">
-    def replace_with_original_src(match):
-        full_tag = match.group(0)
-        original_src_match = re.search(r'data-original-src=["\']([^"\']+)["\']', full_tag)
-        if original_src_match:
-            original_src = original_src_match.group(1)
-            # src를 data-original-src로 교체 (작은따옴표 사용)
-            full_tag = re.sub(r'src=["\'][^"\']+["\']', f"src='{original_src}'", full_tag)
-            # data-original-src 제거
-            full_tag = re.sub(r'\s*data-original-src=["\'][^"\']*["\']', '', full_tag)
-            return full_tag
-        return full_tag
 
-    html_content = re.sub(r'<img[^>]*data-original-src=["\'][^"\']+["\'][^>]*>', replace_with_original_src, html_content)
+def clean_html_fragments(fragments):
+    """
+    여러 HTML 조각을 한 번에 정리 (clean_html_for_export의 batch 버전)
 
-    # class="notion-image" 제거 및 alt='' 추가, 태그 형식 정리
-    # <img class="notion-image" src="..."> → <img src='...' alt='' />
-    # 주의: class="check-bullet"은 ul 태그에 사용되므로 보존해야 함
-    def fix_img_tag(match):
-        full_tag = match.group(0)
-        # src 추출
-        src_match = re.search(r'src=["\']([^"\']*)["\']', full_tag)
-        if src_match:
-            src = src_match.group(1)
-            return f"<img src='{src}' alt='' />"
+    Args:
+        fragments: HTML 문자열 목록
+
+    Returns:
+        정리된 HTML 문자열 목록 (같은 순서)
+    """
+    fragments = list(fragments)
+    results = list(fragments)
+    indexes = [index for index, html_content in enumerate(fragments) if html_content]
+    cleaned = HTML_FRAGMENT_CACHE.clean_many([fragments[i] for i in indexes], HTML_VARIANT_BUILDER, _clean_html)
+    for index, html_content in zip(indexes, cleaned):
+        results[index] = html_content
+    return results
+
+
+# 현재 내보내는 차시의 정리 결과 {원본 조각: 정리된 조각} (_export_lesson에서 한 번에 정리)
+_current_lesson_fragments = contextvars.ContextVar("lesson_fragments", default=None)
+
+
+def _collect_html_fragments(value, fragments):
+    """차시 데이터를 순서대로 훑으면서 HTML 조각('<'가 있는 문자열) 수집"""
+    if isinstance(value, str):
+        if '<' in value:
+            fragments.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_html_fragments(item, fragments)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_html_fragments(item, fragments)
+    return fragments
+
+
+@contextlib.contextmanager
+def _lesson_fragments(lesson):
+    """차시의 HTML 조각을 미리 한 번에 정리해 두고, extract_and_save_images에서 결과를 꺼내 씀"""
+    fragments = _collect_html_fragments(lesson, [])
+    token = _current_lesson_fragments.set(dict(zip(fragments, clean_html_fragments(fragments))))
+    try:
+        yield
+    finally:
+        _current_lesson_fragments.reset(token)
+
+
+def _clean_lesson_fragment(html_content):
+    """미리 정리된 차시 조각이면 그 결과를, 아니면 clean_html_for_export 결과를 반환"""
+    cleaned = _current_lesson_fragments.get()
+    if cleaned is not None:
+        result = cleaned.get(html_content)
+        if result is not None:
+            return result
+    return clean_html_for_export(html_content)
+
+
+@_html_transform("clean_html", "<")
+def _clean_html(html_content):
+    # 한 번의 스캔으로 정리하고, 토크나이저가 같은 결과를 보장할 수 없는 조각만 정규식으로 처리
+    cleaned = clean_html_single_pass(html_content, HTML_VARIANT_BUILDER)
+    if cleaned is None:
+        return _regex_fallback(html_content)
+    # 토크나이저가 처리한 변환도 정규식 구현과 같은 조건(needles)으로 집계
+    _regex_fallback.skips += 1
+    for transform in _CLEAN_HTML_REGEX_TRANSFORMS:
+        transform.count(html_content)
+    return cleaned
+
+
+# data-original-src가 있으면 src를 data-original-src로 교체하고 data-original-src 제거
+# <img src="base64..." data-original-src="../images/file.png">
+# → <img src="../images/file.png">
+_DATA_ORIGINAL_SRC_TAG = re.compile(r'<img[^>]*data-original-src=["\'][^"\']+["\'][^>]*>')
+_DATA_ORIGINAL_SRC_VALUE = re.compile(r'data-original-src=["\']([^"\']+)["\']')
+_DATA_ORIGINAL_SRC_ATTRIBUTE = re.compile(r'\s*data-original-src=["\'][^"\']*["\']')
+_NONEMPTY_SRC_ATTRIBUTE = re.compile(r'src=["\'][^"\']+["\']')
+
+
+def _replace_with_original_src(match):
+    full_tag = match.group(0)
+    original_src_match = _DATA_ORIGINAL_SRC_VALUE.search(full_tag)
+    if original_src_match:
+        original_src = original_src_match.group(1)
+        # src를 data-original-src로 교체 (작은따옴표 사용)
+        full_tag = _NONEMPTY_SRC_ATTRIBUTE.sub(f"src='{original_src}'", full_tag)
+        # data-original-src 제거
+        full_tag = _DATA_ORIGINAL_SRC_ATTRIBUTE.sub('', full_tag)
         return full_tag
+    return full_tag
 
-    html_content = re.sub(r'<img[^>]*class=["\']notion-image["\'][^>]*>', fix_img_tag, html_content)
-
-    # 실습 항목 변환: <ul class='practice'><li><p>...</p></li></ul>
-    # → <div class='practice'><ul><li>...</li></ul></div>
-    def convert_practice_list(match):
-        ul_tag = match.group(0)
-        # <li><p>내용</p></li> → <li>내용</li> (p 태그 제거)
-        # li 태그들을 찾아서 p 태그 제거
-        def remove_p_from_li(li_match):
-            li_content = li_match.group(1)
-            # 반복적으로 모든 <p> 태그 제거
-            while '<p>' in li_content:
-                li_content = re.sub(r'<p>(.*?)</p>', r'\1', li_content, flags=re.DOTALL)
-            # 빈 <p></p> 태그 제거
-            li_content = re.sub(r'<p></p>', '', li_content)
-            li_content = li_content.strip()
-            return f'<li>{li_content}</li>'
-
-        ul_content = re.sub(r'<li[^>]*>(.*?)</li>', remove_p_from_li, ul_tag, flags=re.DOTALL)
-
-        # <ul class='practice'>...</ul> → <div class='practice'><ul>...</ul></div>
-        ul_content = re.sub(r"<ul[^>]*class=['\"]practice['\"][^>]*>", "<div class='practice'><ul>", ul_content)
-        ul_content = ul_content.replace('</ul>', '</ul></div>', 1)
-
-        return ul_content
-
-    # class='practice' 또는 class="practice"가 있는 ul 태그를 찾아서 변환
-    html_content = re.sub(
-        r"<ul[^>]*class=['\"]practice['\"][^>]*>.*?</ul>",
-        convert_practice_list,
-        html_content,
-        flags=re.DOTALL
-    )
 
-    # 체크 불릿 리스트를 <p>✓ 텍스트</p> 형태로 변환
-    # <ul class="check-bullet"><li>항목1</li><li>항목2</li></ul>
-    # → <p>✓ 항목1</p><p>✓ 항목2</p>
-    def convert_check_bullet(match):
-        ul_tag = match.group(0)
-        # li 태그들을 찾아서 변환
-        li_pattern = r'<li[^>]*>(.*?)</li>'
-        li_matches = re.findall(li_pattern, ul_tag, re.DOTALL)
-
-        if not li_matches:
-            return ul_tag
-
-        # 각 li를 <p>✓ 내용</p> 형태로 변환
-        p_tags = []
-        for li_content in li_matches:
-            # li 내용에서 앞뒤 공백 제거
-            content = li_content.strip()
-
-            # <p>내용</p> 형식이면 p 태그 내부 텍스트만 추출
-            content = re.sub(r'^\s*<p>(.*?)</p>\s*$', r'\1', content, flags=re.DOTALL)
-
-            # 이미 ✓가 있으면 중복 방지
-            if content.startswith('✓'):
-                # 이미 ✓가 있으면 그대로 사용
-                content = f'<p>{content}</p>'
-            else:
-                # <p>✓ 내용</p> 형태로 감싸기
-                content = f'<p>✓ {content}</p>'
+_regex_transform("data_original_src", _DATA_ORIGINAL_SRC_TAG, _replace_with_original_src, "data-original-src")
 
-            p_tags.append(content)
 
-        return ''.join(p_tags)
+# class="notion-image" 제거 및 alt='' 추가, 태그 형식 정리
+# <img class="notion-image" src="..."> → <img src='...' alt='' />
+# 주의: class="check-bullet"은 ul 태그에 사용되므로 보존해야 함
+_SRC_ATTRIBUTE = re.compile(r'src=["\']([^"\']*)["\']')
 
-    # class="check-bullet"이 있는 ul 태그를 찾아서 변환
-    html_content = re.sub(
-        r'<ul[^>]*class=["\']check-bullet["\'][^>]*>.*?</ul>',
-        convert_check_bullet,
-        html_content,
-        flags=re.DOTALL
-    )
 
-    # H3 태그를 ol 태그로 변환
-    # <h3>텍스트</h3> → <ol style='color:#000;margin-bottom: 4px;'>1) 텍스트</ol>
-    # 순서대로 번호 매기기
+def _fix_notion_img_tag(match):
+    full_tag = match.group(0)
+    # src 추출
+    src_match = _SRC_ATTRIBUTE.search(full_tag)
+    if src_match:
+        src = src_match.group(1)
+        return f"<img src='{src}' alt='' />"
+    return full_tag
+
+
+_regex_transform("notion_image", r'<img[^>]*class=["\']notion-image["\'][^>]*>', _fix_notion_img_tag, "notion-image")
+
+
+# 실습 항목 변환: <ul class='practice'><li><p>...</p></li></ul>
+# → <div class='practice'><ul><li>...</li></ul></div>
+_LIST_ITEM = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL)
+_PARAGRAPH = re.compile(r'<p>(.*?)</p>', re.DOTALL)
+_PRACTICE_LIST_TAG = re.compile(r"<ul[^>]*class=['\"]practice['\"][^>]*>")
+
+
+def _remove_p_from_li(li_match):
+    # <li><p>내용</p></li> → <li>내용</li> (p 태그 제거)
+    li_content = li_match.group(1)
+    # 반복적으로 모든 <p> 태그 제거
+    while '<p>' in li_content:
+        li_content = _PARAGRAPH.sub(r'\1', li_content)
+    # 빈 <p></p> 태그 제거
+    li_content = li_content.replace('<p></p>', '')
+    li_content = li_content.strip()
+    return f'<li>{li_content}</li>'
+
+
+def _convert_practice_list(match):
+    # li 태그들을 찾아서 p 태그 제거
+    ul_content = _LIST_ITEM.sub(_remove_p_from_li, match.group(0))
+
+    # <ul class='practice'>...</ul> → <div class='practice'><ul>...</ul></div>
+    ul_content = _PRACTICE_LIST_TAG.sub("<div class='practice'><ul>", ul_content)
+    ul_content = ul_content.replace('</ul>', '</ul></div>', 1)
+
+    return ul_content
+
+
+# class='practice' 또는 class="practice"가 있는 ul 태그를 찾아서 변환
+_regex_transform("practice_list", r"<ul[^>]*class=['\"]practice['\"][^>]*>.*?</ul>", _convert_practice_list,
+                 "practice", flags=re.DOTALL)
+
+
+# 체크 불릿 리스트를 <p>✓ 텍스트</p> 형태로 변환
+# <ul class="check-bullet"><li>항목1</li><li>항목2</li></ul>
+# → <p>✓ 항목1</p><p>✓ 항목2</p>
+_WRAPPING_PARAGRAPH = re.compile(r'^\s*<p>(.*?)</p>\s*$', re.DOTALL)
+
+
+def _convert_check_bullet(match):
+    ul_tag = match.group(0)
+    # li 태그들을 찾아서 변환
+    li_matches = _LIST_ITEM.findall(ul_tag)
+
+    if not li_matches:
+        return ul_tag
+
+    # 각 li를 <p>✓ 내용</p> 형태로 변환
+    p_tags = []
+    for li_content in li_matches:
+        # li 내용에서 앞뒤 공백 제거
+        content = li_content.strip()
+
+        # <p>내용</p> 형식이면 p 태그 내부 텍스트만 추출
+        content = _WRAPPING_PARAGRAPH.sub(r'\1', content)
+
+        # 이미 ✓가 있으면 중복 방지
+        if content.startswith('✓'):
+            # 이미 ✓가 있으면 그대로 사용
+            content = f'<p>{content}</p>'
+        else:
+            # <p>✓ 내용</p> 형태로 감싸기
+            content = f'<p>✓ {content}</p>'
+
+        p_tags.append(content)
+
+    return ''.join(p_tags)
+
+
+# class="check-bullet"이 있는 ul 태그를 찾아서 변환
+_regex_transform("check_bullet", r'<ul[^>]*class=["\']check-bullet["\'][^>]*>.*?</ul>', _convert_check_bullet,
+                 "check-bullet", flags=re.DOTALL)
+
+
+# H3 태그를 ol 태그로 변환
+# <h3>텍스트</h3> → <ol style='color:#000;margin-bottom: 4px;'>1) 텍스트</ol>
+# 순서대로 번호 매기기
+_H3_HEADING = re.compile(r'<h3>(.*?)</h3>', re.DOTALL)
+
+
+@_html_transform("h3_to_ol", "<h3>")
+def _convert_h3_headings(html_content):
     h3_counter = {'count': 0}
+
     def convert_h3_to_ol(match):
         h3_content = match.group(1).strip()
         # 이미 "1)", "2)" 같은 번호가 있는지 확인
-        if re.match(r'^\d+\)\s', h3_content):
+        if _NUMBERED_HEADING.match(h3_content):
             # 이미 번호가 있으면 그대로 사용
             return f"<ol style='color:#000;margin-bottom: 4px;'>{h3_content}</ol>"
         else:
@@ -213,20 +668,1021 @@ def clean_html_for_export(html_content):
             h3_counter['count'] += 1
             return f"<ol style='color:#000;margin-bottom: 4px;'>{h3_counter['count']}) {h3_content}</ol>"
 
-    html_content = re.sub(r'<h3>(.*?)</h3>', convert_h3_to_ol, html_content, flags=re.DOTALL)
+    return _H3_HEADING.sub(convert_h3_to_ol, html_content)
+
+
+# 모든 HTML 속성의 큰따옴표를 작은따옴표로 변환
+# JSON 직렬화 시 escape 문제를 방지하기 위함
+# 패턴: <태그 속성="값"> → <태그 속성='값'>
+_regex_transform("quote_attributes", r'(<[^>]*?)\s+([a-zA-Z-]+)="([^"]*?)"', r"\1 \2='\3'", '="')
+
+# 정규식 구현의 변환 순서
+_CLEAN_HTML_REGEX_TRANSFORMS = [
+    HTML_TRANSFORMS[name]
+    for name in ("data_original_src", "notion_image", "practice_list", "check_bullet", "h3_to_ol", "quote_attributes")
+]
 
-    # 모든 HTML 속성의 큰따옴표를 작은따옴표로 변환
-    # JSON 직렬화 시 escape 문제를 방지하기 위함
-    # 패턴: <태그 속성="값"> → <태그 속성='값'>
-    html_content = re.sub(
-        r'(<[^>]*?)\s+([a-zA-Z-]+)="([^"]*?)"',
-        r"\1 \2='\3'",
-        html_content
-    )
 
+def _clean_html_for_export_regex(html_content):
+    """clean_html_for_export의 정규식 구현 (단일 패스 토크나이저의 기준 동작)"""
+    if not html_content:
+        return html_content
+    for transform in _CLEAN_HTML_REGEX_TRANSFORMS:
+        html_content = transform(html_content)
     return html_content
 
 
+# 단일 패스로 정리하지 못해 정규식 구현으로 넘긴 조각 (hits: 정규식 구현, skips: 단일 패스)
+_regex_fallback = _html_transform("regex_fallback")(_clean_html_for_export_regex)
+
+
+# 페이지 생성에서 쓰는 변환
+# 선택지: <p>내용1</p><p>내용2</p> → 내용1<br />내용2
+join_paragraphs = _regex_transform("join_paragraphs", r'</p>\s*<p>', '<br />', '</p>')
+strip_paragraph_tags = _regex_transform("strip_paragraph_tags", r'</?p>', '', 'p>')
+strip_html_tags = _regex_transform("strip_html_tags", r'<[^>]+>', '', '<')
+# 주차 제목: <span>N주</span> 제목 → 제목
+strip_week_span = _regex_transform("strip_week_span", r'<span[^>]*>.*?</span>\s*', '', '<span')
+
+_DATA_URL_IMAGE_TYPE = re.compile(r'data:image/([^;]+)')
+_NUMBERED_ITEM = re.compile(r'\d+[\.\)]\s')
+_WEEK_PREFIX = re.compile(r'^\d+주\s*')
+
+
+# 단일 패스 HTML 정리 (clean_html_for_export)
+#
+# 조각을 한 번 훑어 태그/텍스트 토큰으로 나누면서 태그 단위 변환(data-original-src,
+# notion-image, 속성 따옴표)을 적용하고, 목록(practice, check-bullet)과 제목(h3, h1)
+# 변환은 토큰 목록 위에서 처리함. 결과는 정규식 구현과 바이트 단위로 같아야 하므로,
+# 정규식이 태그 경계를 넘어 다르게 매칭될 수 있는 조각(따옴표 없는 속성, 값 안의
+# 따옴표나 '<', 주석 등)은 None을 반환하여 정규식 구현으로 넘김
+HTML_VARIANT_BUILDER = "builder"    # builder_to_subjects: h3만 변환, 첫 큰따옴표 속성을 작은따옴표로
+HTML_VARIANT_EXPORTER = "exporter"  # exporters.base_exporter: 속성 있는 h3, h1 → main-title
+
+_HTML_TAG_NAME = re.compile(r'(/?)([A-Za-z][A-Za-z0-9]*)')
+_HTML_ATTRIBUTE_NAME = re.compile(r'(\s+)([^\s"\'<>/=]+)')
+_HTML_TAG_END = re.compile(r'\s*/?>')
+_OTHER_QUOTE = {'"': "'", "'": '"'}
+# '<'부터 첫 '>'까지를 태그 후보로 분리
+_HTML_TAG_SPLIT = re.compile(r'(<[^>]*>)')
+# 변환한 태그 문자열 캐시 (변형별): 같은 태그가 조각마다 반복되므로 파싱을 한 번만 함
+_HTML_TAG_CACHE = {HTML_VARIANT_BUILDER: {}, HTML_VARIANT_EXPORTER: {}}
+_HTML_TAG_CACHE_SIZE = 4096
+_HTML_TAG_CACHE_MAX_LENGTH = 256
+# 값이 이렇게 끝나면 닫는 따옴표와 합쳐져 정규식이 가짜 속성으로 매칭할 수 있음
+_RISKY_ATTRIBUTE_VALUE = re.compile(r'(?:src|class|\s[a-zA-Z-]+)=\Z')
+# 정규식 구현이 접두사로 찾는 태그 (<img[^>]*, <li[^>]* 등): 이름이 더 긴 태그는 정규식으로 처리
+_PREFIX_MATCHED_TAGS = ("img", "ul", "li", "h1", "h3")
+_QUOTABLE_ATTRIBUTE_NAME = re.compile(r'[a-zA-Z-]+')
+_NUMBERED_HEADING = re.compile(r'\d+\)\s')
+_H3_OL_OPEN = "<ol style='color:#000;margin-bottom: 4px;'>"
+
+
+class _NeedsRegexFallback(Exception):
+    """단일 패스로 정규식 구현과 같은 결과를 보장할 수 없는 조각"""
+
+
+def _parse_html_tag(html_content, start):
+    """
+    start 위치의 '<'부터 태그 하나를 읽음 (속성 값은 따옴표로 감싸고 따옴표/'<'/'>'를 포함하지 않아야 함)
+
+    Returns:
+        (닫는 태그면 '/', 태그 이름, [[공백, 속성 이름, 따옴표, 값], ...], 꼬리 시작 위치, 태그 끝 위치)
+    """
+    match = _HTML_TAG_NAME.match(html_content, start + 1)
+    if match is None:
+        raise _NeedsRegexFallback(html_content[start:start + 20])
+    closing, name = match.groups()
+    position = match.end()
+    attributes = []
+    while True:
+        end = _HTML_TAG_END.match(html_content, position)
+        if end is not None:
+            return closing, name, attributes, position, end.end()
+        match = _HTML_ATTRIBUTE_NAME.match(html_content, position)
+        if match is None:
+            raise _NeedsRegexFallback(html_content[start:position + 20])
+        space, attribute_name = match.groups()
+        position = match.end()
+        quote = value = ''
+        if html_content.startswith('=', position):
+            quote = html_content[position + 1:position + 2]
+            close = html_content.find(quote, position + 2) if quote in _OTHER_QUOTE else -1
+            if close < 0:
+                raise _NeedsRegexFallback(html_content[start:position + 20])
+            value = html_content[position + 2:close]
+            if _OTHER_QUOTE[quote] in value or '<' in value or '>' in value:
+                raise _NeedsRegexFallback(value)
+            position = close + 1
+        attributes.append([space, attribute_name, quote, value])
+
+
+def _rewrite_html_tag(html_content, start, variant):
+    """
+    태그 하나에 태그 단위 변환 적용
+
+    Returns:
+        (태그 문자열, 목록 종류, 태그 끝 위치) - 목록 종류는 ul 태그의 'practice' / 'check-bullet' 또는 None
+    """
+    closing, name, attributes, tail_start, end = _parse_html_tag(html_content, start)
+    text = html_content[start:end]
+
+    if name not in _PREFIX_MATCHED_TAGS and name.startswith(_PREFIX_MATCHED_TAGS):
+        raise _NeedsRegexFallback(name)
+    if not attributes:
+        return text, None, end
+
+    is_img = name == "img" and not closing
+    is_ul = name == "ul" and not closing
+    quote_attributes = variant == HTML_VARIANT_BUILDER and any(a[2] == '"' for a in attributes)
+    if not (is_img or is_ul or quote_attributes):
+        return text, None, end
+
+    for _, _, quote, value in attributes:
+        if quote and value.endswith('=') and _RISKY_ATTRIBUTE_VALUE.search(value):
+            raise _NeedsRegexFallback(value)
+
+    list_kind = None
+    changed = False
+    if is_ul:
+        for _, attribute_name, quote, value in attributes:
+            if quote and attribute_name.endswith('class'):
+                if value == 'practice':
+                    list_kind = 'practice'
+                    break
+                if value == 'check-bullet' and list_kind is None:
+                    list_kind = 'check-bullet'
+
+    if is_img:
+        # data-original-src가 있으면 src 계열 속성을 모두 원본 경로로 바꾸고 data-original-src 제거
+        original_src = None
+        for _, attribute_name, quote, value in attributes:
+            if attribute_name.endswith('data-original-src'):
+                if attribute_name != 'data-original-src':
+                    raise _NeedsRegexFallback(attribute_name)
+                if quote and value and original_src is None:
+                    original_src = value
+        if original_src is not None:
+            if '\\' in original_src:
+                raise _NeedsRegexFallback(original_src)
+            src_quote = "'" if variant == HTML_VARIANT_BUILDER else '"'
+            for attribute in attributes:
+                if attribute[2] and attribute[3] and attribute[1].endswith('src'):
+                    attribute[2] = src_quote
+                    attribute[3] = original_src
+            attributes = [a for a in attributes if not (a[2] and a[1] == 'data-original-src')]
+            changed = True
+
+        # notion-image: <img src='...' alt='' /> 형태로 정리
+        if any(quote and attribute_name.endswith('class') and value == 'notion-image'
+               for _, attribute_name, quote, value in attributes):
+            for _, attribute_name, quote, value in attributes:
+                if quote and attribute_name.endswith('src'):
+                    return f"<img src='{value}' alt='' />", None, end
+
+    if variant == HTML_VARIANT_BUILDER:
+        # 첫 번째 큰따옴표 속성을 작은따옴표로 (앞의 공백은 한 칸으로)
+        for attribute in attributes:
+            if attribute[2] == '"' and _QUOTABLE_ATTRIBUTE_NAME.fullmatch(attribute[1]):
+                attribute[0] = ' '
+                attribute[2] = "'"
+                changed = True
+                break
+
+    if not changed:
+        return text, list_kind, end
+    rendered = ''.join(
+        f"{space}{attribute_name}={quote}{value}{quote}" if quote else f"{space}{attribute_name}"
+        for space, attribute_name, quote, value in attributes
+    )
+    return f"<{closing}{name}{rendered}{html_content[tail_start:end]}", list_kind, end
+
+
+def _tokenize_html(html_content, variant):
+    """
+    HTML 조각을 텍스트/태그 토큰으로 분리 (태그 단위 변환 적용)
+
+    Returns:
+        (토큰 목록, {ul 토큰 위치: 목록 종류}, 제목 태그 포함 여부)
+    """
+    parts = _HTML_TAG_SPLIT.split(html_content)
+    if '<' in parts[-1]:
+        # 닫히지 않은 '<'
+        raise _NeedsRegexFallback(parts[-1][:20])
+
+    cache = _HTML_TAG_CACHE[variant]
+    tokens = []
+    list_tags = {}
+    append = tokens.append
+    has_headings = False
+
+    for index, part in enumerate(parts):
+        if not index & 1:
+            if part:
+                append(part)
+            continue
+        rewritten = cache.get(part)
+        if rewritten is None:
+            rewritten = _rewrite_html_tag(part, 0, variant)[:2]
+            # 짧은 태그(<p>, <p class="title"> 등)만 기억: base64 이미지 태그는 매번 다름
+            if len(part) <= _HTML_TAG_CACHE_MAX_LENGTH:
+                if len(cache) >= _HTML_TAG_CACHE_SIZE:
+                    cache.clear()
+                cache[part] = rewritten
+        tag, list_kind = rewritten
+        if list_kind is not None:
+            list_tags[len(tokens)] = list_kind
+        elif tag[1] == 'h':
+            has_headings = True
+        append(tag)
+
+    return tokens, list_tags, has_headings
+
+
+def _strip_html_tokens(tokens):
+    """토큰 목록을 이어 붙인 문자열의 str.strip()과 같은 결과가 되도록 양 끝 공백 제거"""
+    if not tokens:
+        return tokens
+    head, tail = tokens[0], tokens[-1]
+    if (head.startswith('<') or not head[0].isspace()) and (tail.startswith('<') or not tail[-1].isspace()):
+        return tokens
+    tokens = list(tokens)
+    while tokens and not tokens[0].startswith('<'):
+        text = tokens[0].lstrip()
+        if text:
+            tokens[0] = text
+            break
+        del tokens[0]
+    while tokens and not tokens[-1].startswith('<'):
+        text = tokens[-1].rstrip()
+        if text:
+            tokens[-1] = text
+            break
+        del tokens[-1]
+    return tokens
+
+
+def _remove_paragraph_tokens(tokens):
+    """<p>와 그 뒤의 가장 가까운 </p>를 짝지어 모두 제거 (짝이 없는 <p>는 남김)"""
+    while '<p>' in tokens:
+        result = []
+        removed = False
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if token == '<p>':
+                try:
+                    close = tokens.index('</p>', index + 1)
+                except ValueError:
+                    result.extend(tokens[index:])
+                    break
+                result.extend(tokens[index + 1:close])
+                index = close + 1
+                removed = True
+                continue
+            result.append(token)
+            index += 1
+        tokens = result
+        if not removed:
+            break
+    return tokens
+
+
+def _convert_list_tokens(tokens, list_tags):
+    """practice / check-bullet 목록 변환 (ul 시작 태그부터 첫 </ul>까지)"""
+    result = []
+    position = 0
+    for start in sorted(list_tags):
+        if start < position:
+            continue
+        try:
+            end = tokens.index('</ul>', start + 1)
+        except ValueError:
+            break
+        if any(start < other < end for other in list_tags):
+            raise _NeedsRegexFallback('nested list')
+
+        kind = list_tags[start]
+        converted = []
+        items = 0
+        index = start + 1
+        while index < end:
+            token = tokens[index]
+            if token.startswith('<li'):
+                try:
+                    close = tokens.index('</li>', index + 1, end)
+                except ValueError:
+                    if kind == 'practice':
+                        converted.extend(tokens[index:end])
+                    break
+                content = tokens[index + 1:close]
+                items += 1
+                if kind == 'practice':
+                    converted.append('<li>')
+                    converted.extend(_strip_html_tokens(_remove_paragraph_tokens(content)))
+                    converted.append('</li>')
+                else:
+                    content = _strip_html_tokens(content)
+                    if len(content) >= 2 and content[0] == '<p>' and content[-1] == '</p>':
+                        content = content[1:-1]
+                    converted.append('<p>')
+                    if not (content and content[0].startswith('✓')):
+                        converted.append('✓ ')
+                    converted.extend(content)
+                    converted.append('</p>')
+                index = close + 1
+                continue
+            if kind == 'practice':
+                converted.append(token)
+            index += 1
+
+        if kind == 'check-bullet' and not items:
+            continue
+
+        result.extend(tokens[position:start])
+        if kind == 'practice':
+            result.append("<div class='practice'><ul>")
+            result.extend(converted)
+            result.append('</ul></div>')
+        else:
+            result.extend(converted)
+        position = end + 1
+
+    if not position:
+        return tokens
+    result.extend(tokens[position:])
+    return result
+
+
+def _convert_h3_tokens(content, counter):
+    """<h3> 내용 → <ol ...>번호) 내용</ol> (이미 "1) " 같은 번호가 있으면 그대로 사용)"""
+    content = _strip_html_tokens(content)
+    leading = content[0] if content and not content[0].startswith('<') else ''
+    if leading and len(content) > 1 and not content[1].startswith('<'):
+        leading = ''.join(itertools.takewhile(lambda t: not t.startswith('<'), content))
+    if leading and _NUMBERED_HEADING.match(leading):
+        return [_H3_OL_OPEN, *content, '</ol>']
+    counter[0] += 1
+    return [_H3_OL_OPEN, f"{counter[0]}) ", *content, '</ol>']
+
+
+def _convert_h1_tokens(content):
+    """<h1> 내용 → <p class='main-title'><strong>내용</strong></p>"""
+    return ["<p class='main-title'><strong>", *content, "</strong></p>"]
+
+
+def _convert_heading_tokens(tokens, open_tag, close_tag, multiline, convert):
+    """
+    제목 태그 변환: open_tag 태그부터 첫 close_tag까지를 convert(내용 토큰)로 교체
+
+    open_tag가 '>'로 끝나면 속성 없는 태그만 (<h3>), 아니면 속성이 있는 태그도 변환 (<h3 ...>).
+    multiline=False이면 내용에 줄바꿈이 있을 때 변환하지 않음 (DOTALL 없는 정규식과 동일)
+    """
+    exact = open_tag.endswith('>')
+    result = []
+    index = 0
+    count = len(tokens)
+    while index < count:
+        token = tokens[index]
+        if token == open_tag or (not exact and token.startswith(open_tag)):
+            try:
+                close = tokens.index(close_tag, index + 1)
+            except ValueError:
+                result.extend(tokens[index:])
+                break
+            content = tokens[index + 1:close]
+            if multiline or not any('\n' in t for t in content):
+                result.extend(convert(content))
+                index = close + 1
+                continue
+        result.append(token)
+        index += 1
+    return result
+
+
+def clean_html_single_pass(html_content, variant=HTML_VARIANT_BUILDER):
+    """
+    clean_html_for_export의 단일 패스 구현
+
+    Args:
+        html_content: HTML 문자열
+        variant: HTML_VARIANT_BUILDER 또는 HTML_VARIANT_EXPORTER
+
+    Returns:
+        정리된 HTML 문자열, 정규식 구현으로 처리해야 하는 조각이면 None
+    """
+    if '<' not in html_content:
+        return html_content
+
+    try:
+        tokens, list_tags, has_headings = _tokenize_html(html_content, variant)
+        if list_tags:
+            tokens = _convert_list_tokens(tokens, list_tags)
+    except _NeedsRegexFallback:
+        return None
+
+    if has_headings:
+        convert_h3 = functools.partial(_convert_h3_tokens, counter=[0])
+        if variant == HTML_VARIANT_BUILDER:
+            tokens = _convert_heading_tokens(tokens, '<h3>', '</h3>', True, convert_h3)
+        else:
+            tokens = _convert_heading_tokens(tokens, '<h3', '</h3>', False, convert_h3)
+            tokens = _convert_heading_tokens(tokens, '<h1', '</h1>', False, _convert_h1_tokens)
+
+    return ''.join(tokens)
+
+
+# 이미지 디코딩/저장 병렬 처리 기본 스레드 수
+# (hashlib, base64 디코딩, 파일 쓰기는 GIL을 놓기 때문에 스레드로 겹쳐서 실행 가능)
+DEFAULT_IMAGE_WORKERS = min(8, os.cpu_count() or 1)
+
+# 이미지 저장소 기본 최대 크기 (초과 시 오래 사용하지 않은 이미지부터 삭제)
+DEFAULT_IMAGE_STORE_MAX_BYTES = 1024 * 1024 * 1024
+
+# 현재 export에서 사용 중인 ImageWriter (없으면 순차 처리)
+_current_image_writer = contextvars.ContextVar("image_writer", default=None)
+
+
+def _decode_base64_image(base64_data):
+    """base64 이미지 디코딩 (줄바꿈/공백, padding 차이는 무시)"""
+    compact = ''.join(base64_data.split()).rstrip('=')
+    return base64.b64decode(compact + '=' * (-len(compact) % 4))
+
+
+def _hash_image_bytes(image_data):
+    """디코딩된 이미지 바이트의 해시 (중복 판정 키, 이미지 저장소 파일명)"""
+    return hashlib.blake2b(image_data, digest_size=20).hexdigest()
+
+
+class DecodedImage:
+    """
+    디코딩된 이미지
+
+    key는 디코딩된 바이트의 해시이므로 base64 줄바꿈/padding이 달라도 같은 이미지는 같은 key를 가짐
+    내용은 data(bytes) 또는 path(저장소 이미지, 링크/복사로 내보냄) 중 하나에 있음
+    """
+
+    __slots__ = ("key", "size", "data", "path", "base64_data")
+
+    def __init__(self, key, size, data=None, path=None, base64_data=None):
+        self.key = key
+        self.size = size
+        self.data = data
+        self.path = path
+        # 링크 직전에 다른 프로세스가 저장소에서 삭제한 경우 다시 디코딩하기 위해 보관
+        self.base64_data = base64_data
+
+
+class ImageIndex(dict):
+    """
+    export 전체에서 공유하는 이미지 중복 제거 인덱스 {이미지 key: 상대경로}
+
+    Import된 원본 이미지, HTML 인라인 이미지, 교수 이미지가 모두 같은 인덱스를 사용하며
+    key는 디코딩된 바이트의 해시(DecodedImage.key)
+    """
+
+    def __init__(self):
+        super().__init__()
+        # base64 텍스트 해시 -> DecodedImage(key, size) (같은 텍스트는 다시 디코딩하지 않음)
+        self.aliases = {}
+        self.reused = 0
+        self.bytes_saved = 0
+
+
+def _record_reuse(image_cache, image):
+    """중복 이미지 재사용 통계 기록 (ImageIndex인 경우)"""
+    if isinstance(image_cache, ImageIndex):
+        image_cache.reused += 1
+        image_cache.bytes_saved += image.size
+
+
+def seed_image_index(image_cache, images_dir):
+    """
+    images_dir에 이미 있는 이미지 파일을 중복 제거 인덱스에 등록
+    (같은 폴더에 이어서 내보낼 때 이미 저장한 이미지를 새 번호로 다시 저장하지 않도록)
+
+    Returns:
+        등록한 이미지 수
+    """
+    seeded = 0
+    for name in sorted(os.listdir(images_dir)):
+        path = Path(images_dir) / name
+        if path.is_file():
+            image_cache.setdefault(_hash_image_bytes(path.read_bytes()), f"../images/{name}")
+            seeded += 1
+    return seeded
+
+
+def _forget_cached_path(image_cache, relative_path):
+    """고정 파일명을 다른 이미지로 덮어쓸 때 이전 이미지의 캐시 항목 제거"""
+    for key in [key for key, path in image_cache.items() if path == relative_path]:
+        del image_cache[key]
+
+
+class ImageStore:
+    """
+    export 간에 공유되는 content-addressed 이미지 저장소 (출력 폴더 밖에 위치)
+
+    구조:
+        objects/ab/abcdef...  디코딩된 이미지 (이미지 key가 파일명)
+        aliases/12/1234...    base64 텍스트 해시 -> 이미지 key (다음 export에서 디코딩 생략)
+
+    같은 이미지는 여러 과정/여러 번의 export에서 한 번만 디코딩되며,
+    출력 폴더로는 하드링크(불가능하면 복사)로 내보냄
+    크기가 max_bytes를 넘으면 마지막 사용 시각(mtime)이 오래된 이미지부터 삭제 (LRU)
+    """
+
+    def __init__(self, root, max_bytes=DEFAULT_IMAGE_STORE_MAX_BYTES):
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self._objects_dir = self.root / "objects"
+        self._aliases_dir = self.root / "aliases"
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        self._aliases_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+
+    def _object_path(self, digest):
+        return self._objects_dir / digest[:2] / digest
+
+    def _alias_path(self, base64_hash):
+        return self._aliases_dir / base64_hash[:2] / base64_hash
+
+    def lookup(self, base64_hash):
+        """base64 텍스트 해시로 저장된 이미지 경로를 찾음 (없으면 None)"""
+        alias_path = self._alias_path(base64_hash)
+        try:
+            digest = alias_path.read_text(encoding='ascii').strip()
+        except OSError:
+            return None
+        object_path = self._object_path(digest)
+        try:
+            # LRU: 사용 시각 갱신
+            os.utime(object_path)
+        except OSError:
+            # 이미지가 삭제된 경우 alias도 정리
+            try:
+                alias_path.unlink()
+            except OSError:
+                pass
+            return None
+        self.hits += 1
+        return object_path
+
+    def put(self, base64_hash, image_data, digest=None):
+        """디코딩된 이미지를 저장하고 경로 반환"""
+        if digest is None:
+            digest = _hash_image_bytes(image_data)
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            os.utime(object_path)
+        else:
+            _atomic_write(object_path, image_data)
+        _atomic_write(self._alias_path(base64_hash), digest.encode('ascii'))
+        return object_path
+
+    def evict(self):
+        """저장소 크기가 max_bytes 이하가 될 때까지 오래된 이미지부터 삭제
+
+        Returns:
+            삭제한 이미지 수
+        """
+        entries = []
+        total = 0
+        for bucket in os.scandir(self._objects_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        # 남은 alias는 lookup 시 이미지가 없으면 정리됨
+        return removed
+
+
+def _atomic_write(path, data):
+    """임시 파일에 쓴 뒤 교체 (다른 프로세스가 쓰다 만 파일을 읽지 않도록)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+class DirectoryTarget:
+    """export 출력 대상: 파일시스템 (기본값, 경로를 그대로 사용)"""
+
+    def makedirs(self, path):
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    def open_text(self, path):
+        return open(path, 'w', encoding='utf-8')
+
+    def open_text_stream(self, path):
+        """내용을 만드는 동안(이미지 저장 포함) 계속 열어 둘 수 있는 open_text"""
+        return self.open_text(path)
+
+    def link_file(self, source, path):
+        """source를 path에 하드링크 (이전 export의 파일은 먼저 삭제, 하드링크 불가 시 복사)"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(source, path)
+        except OSError:
+            shutil.copyfile(source, path)
+
+    def write_bytes(self, path, data):
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    def write_image(self, image_path, image, overwritable=False):
+        # 이전 export에서 저장소와 하드링크된 파일일 수 있으므로 덮어쓰지 않고 먼저 삭제
+        # (그대로 쓰면 저장소의 이미지 내용까지 바뀜)
+        try:
+            os.unlink(image_path)
+        except FileNotFoundError:
+            pass
+        image_data = image.data
+        if image.path is not None:
+            try:
+                os.link(image.path, image_path)
+                return
+            except FileNotFoundError:
+                if Path(image.path).exists():
+                    raise
+                # 다른 export가 저장소에서 삭제한 경우: 다시 디코딩
+                image_data = _decode_base64_image(image.base64_data)
+            except OSError:
+                # 하드링크 불가 (다른 파일시스템 등): 복사
+                shutil.copyfile(image.path, image_path)
+                return
+        with open(image_path, 'wb') as f:
+            f.write(image_data)
+
+    def flush(self):
+        pass
+
+
+class ZipTarget:
+    """
+    export 출력 대상: 열려 있는 zipfile.ZipFile (임시 폴더 없이 바로 압축)
+
+    root 아래의 경로를 root 기준 상대경로로 ZIP에 기록함 (root는 실제로 만들지 않음)
+    이미지(이미 압축된 형식)는 ZIP_STORED, 나머지는 ZipFile의 기본 압축 방식으로 저장
+
+    ZIP 항목은 덮어쓸 수 없으므로 교수 이미지처럼 같은 파일명에 다시 쓸 수 있는 이미지는
+    flush()까지 보관했다가 마지막 내용만 기록함
+
+    force_zip64: 크기를 미리 알 수 없는 텍스트 항목(data.json 등)을 ZIP64 형식으로 기록
+        (seek할 수 없는 스트림에 쓸 때 2GB를 넘는 항목을 허용하려면 필요)
+    """
+
+    def __init__(self, zip_file, root=None, force_zip64=False):
+        self.zip_file = zip_file
+        self.root = Path(root) if root is not None else Path(os.sep, "__zip_export__")
+        self.force_zip64 = force_zip64
+        self._lock = threading.Lock()
+        self._written = set()
+        self._deferred = {}
+
+    def _arcname(self, path):
+        return Path(path).relative_to(self.root).as_posix()
+
+    def _claim(self, arcname):
+        if arcname in self._written:
+            print(f"⚠️ ZIP에 이미 있는 파일은 다시 쓰지 않습니다: {arcname}")
+            return False
+        self._written.add(arcname)
+        return True
+
+    def makedirs(self, path):
+        pass  # ZIP에는 파일 항목만 기록
+
+    @contextlib.contextmanager
+    def open_text(self, path):
+        arcname = self._arcname(path)
+        with self._lock:
+            if not self._claim(arcname):
+                yield io.StringIO()
+                return
+            with self.zip_file.open(arcname, 'w', force_zip64=self.force_zip64) as raw:
+                with io.TextIOWrapper(raw, encoding='utf-8', newline='\n') as f:
+                    yield f
+
+    @contextlib.contextmanager
+    def open_text_stream(self, path):
+        """
+        내용을 만드는 동안 계속 열어 둘 수 있는 open_text
+
+        ZIP 항목을 열어 둔 동안에는 다른 항목(이미지 등)을 쓸 수 없으므로 메모리에 모았다가 기록
+        """
+        buffer = io.StringIO(newline='\n')
+        yield buffer
+        with self.open_text(path) as f:
+            f.write(buffer.getvalue())
+
+    def write_bytes(self, path, data, compress_type=None):
+        arcname = self._arcname(path)
+        with self._lock:
+            if self._claim(arcname):
+                self.zip_file.writestr(arcname, data, compress_type=compress_type)
+
+    def write_image(self, image_path, image, overwritable=False):
+        if overwritable:
+            with self._lock:
+                self._deferred[self._arcname(image_path)] = image
+            return
+        if image.data is not None:
+            image_data = image.data
+        else:
+            try:
+                with open(image.path, 'rb') as f:
+                    image_data = f.read()
+            except FileNotFoundError:
+                # 다른 export가 저장소에서 삭제한 경우: 다시 디코딩
+                image_data = _decode_base64_image(image.base64_data)
+        self.write_bytes(image_path, image_data, compress_type=zipfile.ZIP_STORED)
+
+    def flush(self):
+        """보관 중인(덮어쓸 수 있는) 이미지를 마지막 내용으로 기록"""
+        deferred, self._deferred = self._deferred, {}
+        for arcname, image in deferred.items():
+            self.write_image(self.root / arcname, image)
+
+
+class _MemoryTarget:
+    """프로세스 풀 worker용 출력 대상: 파일 내용을 모았다가 메인 프로세스에서 실제 대상에 기록"""
+
+    def __init__(self):
+        self.files = []
+
+    def makedirs(self, path):
+        pass
+
+    @contextlib.contextmanager
+    def open_text(self, path):
+        buffer = io.StringIO(newline='\n')
+        yield buffer
+        self.files.append((path, buffer.getvalue().encode('utf-8')))
+
+    open_text_stream = open_text
+
+    def write_bytes(self, path, data):
+        self.files.append((path, data))
+
+
+# 현재 export의 출력 대상 (없으면 파일시스템)
+_current_output_target = contextvars.ContextVar("output_target", default=None)
+_DIRECTORY_TARGET = DirectoryTarget()
+
+
+def _get_output_target():
+    target = _current_output_target.get()
+    return target if target is not None else _DIRECTORY_TARGET
+
+
+class ImageWriter:
+    """
+    이미지 디코딩/해시/파일 저장용 제한된 스레드 풀
+
+    번호 부여와 중복 판정(image_cache)은 항상 메인 스레드에서 기존 순서대로 처리하고,
+    해시 계산/디코딩/파일 쓰기만 풀에서 병렬로 실행하므로 결과는 순차 처리와 동일함
+
+    store(ImageStore)가 있으면 이미 저장소에 있는 이미지는 디코딩하지 않고 링크/복사함
+
+    with 블록 안에서 현재 writer로 등록되며, 블록을 빠져나갈 때 남은 쓰기를 모두 기다림
+    max_workers가 1 이하면 스레드 없이 순차 처리
+    """
+
+    def __init__(self, max_workers=None, store=None):
+        if max_workers is None:
+            max_workers = DEFAULT_IMAGE_WORKERS
+        self.max_workers = max(1, max_workers)
+        self.store = store
+        self._executor = None
+        self._slots = None
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image")
+            # 대기 중인 쓰기 작업 수 제한 (디코딩된 바이트가 메모리에 쌓이지 않도록)
+            self._slots = threading.BoundedSemaphore(self.max_workers * 4)
+        self._pending = []
+        self._last_write = {}  # 경로 -> 마지막 쓰기 future (같은 파일은 요청 순서대로 씀)
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current_image_writer.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_image_writer.reset(self._token)
+        self.close()
+        return False
+
+    def map(self, fn, items):
+        """fn을 items에 병렬 적용하고 결과를 입력 순서대로 반환"""
+        items = list(items)
+        if self._executor is None or len(items) < 2:
+            return [fn(item) for item in items]
+        return list(self._executor.map(fn, items))
+
+    def decode(self, base64_data, base64_hash=None):
+        """
+        base64 이미지 디코딩 (병렬 map용: 예외를 결과로 반환)
+
+        Returns:
+            DecodedImage 또는 디코딩 실패 시 Exception
+        """
+        if self.store is not None:
+            if base64_hash is None:
+                base64_hash = _hash_base64_text(base64_data)
+            stored_path = self.store.lookup(base64_hash)
+            if stored_path is not None:
+                try:
+                    size = stored_path.stat().st_size
+                except OSError:
+                    pass  # 방금 삭제된 경우 다시 디코딩
+                else:
+                    return DecodedImage(stored_path.name, size, path=stored_path, base64_data=base64_data)
+        try:
+            image_data = _decode_base64_image(base64_data)
+        except Exception as e:
+            return e
+        image = DecodedImage(_hash_image_bytes(image_data), len(image_data), data=image_data)
+        if self.store is not None:
+            try:
+                image.path = self.store.put(base64_hash, image_data, image.key)
+                image.data = None
+                image.base64_data = base64_data
+            except OSError as e:
+                print(f"⚠️ 이미지 저장소 기록 실패: {e}")
+        return image
+
+    def decode_many(self, base64_list, image_cache=None, reuse=True):
+        """
+        base64 데이터 목록을 병렬 디코딩하여 입력 순서대로 반환 (같은 데이터는 한 번만)
+
+        image_cache(ImageIndex)를 주면 디코딩한 이미지를 aliases에 기록하고,
+        reuse가 True면 이미 인덱스에 있는 이미지는 디코딩하지 않음
+        (이 경우 반환되는 DecodedImage에는 key와 size만 있음)
+        """
+        base64_list = list(base64_list)
+        hashes = self.map(_hash_base64_text, base64_list)
+        aliases = getattr(image_cache, 'aliases', None)
+
+        images = {}
+        pending = {}
+        for base64_data, base64_hash in zip(base64_list, hashes):
+            if base64_hash in images or base64_hash in pending:
+                continue
+            known = aliases.get(base64_hash) if aliases is not None and reuse else None
+            if known is not None and known.key in image_cache:
+                images[base64_hash] = known
+            else:
+                pending[base64_hash] = base64_data
+
+        decoded = self.map(lambda item: self.decode(item[1], item[0]), pending.items())
+        for base64_hash, image in zip(pending, decoded):
+            images[base64_hash] = image
+            if aliases is not None and isinstance(image, DecodedImage):
+                aliases[base64_hash] = DecodedImage(image.key, image.size)
+        return [images[base64_hash] for base64_hash in hashes]
+
+    def write(self, image_path, image, overwritable=False):
+        """
+        디코딩된 이미지(DecodedImage)를 파일로 저장 (풀이 있으면 백그라운드에서 실행)
+        overwritable: 같은 파일명에 나중에 다른 이미지를 다시 쓸 수 있는 경우 (교수 이미지)
+        """
+        # 풀 스레드에는 ContextVar가 전달되지 않으므로 출력 대상을 미리 가져옴
+        target = _get_output_target()
+        if self._executor is None:
+            target.write_image(image_path, image, overwritable)
+            return
+        previous = self._last_write.get(image_path)
+        if previous is not None and not previous.done():
+            # 같은 파일에 대한 이전 쓰기가 끝난 뒤에 써야 순차 처리와 결과가 같음
+            try:
+                previous.result()
+            except Exception:
+                pass  # 오류는 flush()에서 보고
+        self._slots.acquire()
+        future = self._executor.submit(target.write_image, image_path, image, overwritable)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending.append((image_path, future))
+        self._last_write[image_path] = future
+
+    def flush(self):
+        """대기 중인 쓰기 작업을 모두 기다림
+
+        Returns:
+            저장에 실패한 이미지 수
+        """
+        failed = 0
+        pending, self._pending = self._pending, []
+        self._last_write.clear()
+        for image_path, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"⚠️ 이미지 저장 실패 ({Path(image_path).name}): {e}")
+                failed += 1
+        return failed
+
+    def close(self):
+        failed = self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.store is not None:
+            removed = self.store.evict()
+            if removed:
+                print(f"🧹 이미지 저장소 정리: {removed}개 삭제")
+        return failed
+
+
+def _get_image_writer():
+    """현재 export의 ImageWriter (등록된 것이 없으면 순차 처리용 writer)"""
+    writer = _current_image_writer.get()
+    return writer if writer is not None else _SEQUENTIAL_IMAGE_WRITER
+
+
+def _hash_base64_text(base64_data):
+    """base64 텍스트의 해시 계산 (같은 텍스트의 디코딩 생략용)"""
+    return hashlib.md5(base64_data.encode('utf-8')).hexdigest()
+
+
+_SEQUENTIAL_IMAGE_WRITER = ImageWriter(max_workers=1)
+
+
+# 다중 프로세스 export에서 현재 차시의 이미지 처리 결과 기록/재생 (없으면 일반 처리)
+_current_image_plan = contextvars.ContextVar("image_plan", default=None)
+
+
+class _LessonImagePlan:
+    """
+    차시 하나의 이미지 처리 결과 (다중 프로세스 export용)
+
+    1단계(기록): 메인 프로세스에서 차시를 기존 순서대로 훑으면서 base64 이미지가 있는 조각만
+        실제로 처리(번호 부여, 중복 제거, 저장)하고 결과를 호출 순서대로 기록
+    2단계(재생): worker 프로세스에서 같은 차시를 내보낼 때 같은 순서로 호출되므로
+        기록된 결과를 그대로 반환 (이미지 번호와 경로가 순차 처리와 동일함)
+    """
+
+    __slots__ = ("recording", "results", "position")
+
+    def __init__(self, results=None):
+        self.recording = results is None
+        self.results = [] if results is None else results
+        self.position = 0
+
+    def next_result(self):
+        result = self.results[self.position]
+        self.position += 1
+        return result
+
+
+def _is_recording_images():
+    """1단계(이미지 번호 부여)로 차시를 훑는 중인지 확인"""
+    plan = _current_image_plan.get()
+    return plan is not None and plan.recording
+
+
+def _planned_image_step(fn):
+    """base64 이미지를 처리하는 함수의 결과를 _LessonImagePlan에 기록/재생하는 decorator"""
+
+    @functools.wraps(fn)
+    def wrapper(content, *args, **kwargs):
+        plan = _current_image_plan.get()
+        if plan is None:
+            return fn(content, *args, **kwargs)
+        if not isinstance(content, str) or 'data:image/' not in content:
+            # 이미지가 없는 조각은 번호/캐시와 무관: 1단계에서는 결과를 쓰지 않으므로 건너뜀
+            return content if plan.recording else fn(content, *args, **kwargs)
+        if not plan.recording:
+            return plan.next_result()
+        result = fn(content, *args, **kwargs)
+        plan.results.append(result)
+        return result
+
+    return wrapper
+
+
 def save_base64_image(base64_data_url, images_dir, course_code, image_counter, image_cache=None):
     """
     base64 이미지 데이터 URL을 파일로 저장하고 상대경로 반환
@@ -237,7 +1693,7 @@ def save_base64_image(base64_data_url, images_dir, course_code, image_counter, i
         images_dir: 이미지 저장 디렉토리
         course_code: 과목 코드
         image_counter: 이미지 카운터 (dict, {'count': int})
-        image_cache: 이미지 캐시 (dict, {hash: relative_path})
+        image_cache: 이미지 중복 제거 인덱스 (ImageIndex 또는 dict, {이미지 key: relative_path})
     
     Returns:
         상대경로 문자열 (예: ../images/25itinse_img_001.png)
@@ -251,20 +1707,24 @@ def save_base64_image(base64_data_url, images_dir, course_code, image_counter, i
     try:
         # data:image/png;base64,xxxxx 형식에서 타입과 데이터 추출
         header, data = base64_data_url.split(',', 1)
-        image_type_match = re.search(r'data:image/([^;]+)', header)
+        image_type_match = _DATA_URL_IMAGE_TYPE.search(header)
         if not image_type_match:
             return base64_data_url
         
         image_type = image_type_match.group(1)
         base64_data = data
         
-        # base64 데이터의 해시 계산 (중복 확인용)
-        image_hash = hashlib.md5(base64_data.encode('utf-8')).hexdigest()
+        # base64 디코딩 (중복 확인은 디코딩된 이미지 해시로)
+        writer = _get_image_writer()
+        image = writer.decode_many([base64_data], image_cache)[0]
+        if isinstance(image, Exception):
+            raise image
         
         # 이미 저장된 이미지인지 확인
-        if image_hash in image_cache:
-            print(f"♻️ 중복 이미지 재사용: {image_cache[image_hash]}")
-            return image_cache[image_hash]
+        if image.key in image_cache:
+            _record_reuse(image_cache, image)
+            print(f"♻️ 중복 이미지 재사용: {image_cache[image.key]}")
+            return image_cache[image.key]
         
         # 이미지 카운터 증가
         image_counter['count'] += 1
@@ -275,14 +1735,12 @@ def save_base64_image(base64_data_url, images_dir, course_code, image_counter, i
         filename = f"{course_code}_img_{image_num:03d}.{ext}"
         image_path = images_dir / filename
         
-        # base64 디코딩하여 파일로 저장
-        image_data = base64.b64decode(base64_data)
-        with open(image_path, 'wb') as f:
-            f.write(image_data)
+        # 파일로 저장 (쓰기는 ImageWriter 풀에서 처리)
+        writer.write(image_path, image)
         
         # 상대경로 생성 및 캐시에 저장
         relative_path = f"../images/{filename}"
-        image_cache[image_hash] = relative_path
+        image_cache[image.key] = relative_path
         
         print(f"✅ 이미지 저장 완료: {filename}")
         return relative_path
@@ -291,6 +1749,7 @@ def save_base64_image(base64_data_url, images_dir, course_code, image_counter, i
         return base64_data_url  # 실패 시 원본 반환
 
 
+@_planned_image_step
 def save_professor_image(base64_data_url, images_dir, filename="professor.png", image_cache=None):
     """
     교수 프로필 이미지를 고정된 파일명으로 저장
@@ -300,7 +1759,7 @@ def save_professor_image(base64_data_url, images_dir, filename="professor.png",
         base64_data_url: data:image/...;base64,... 형식의 문자열
         images_dir: 이미지 저장 디렉토리
         filename: 저장할 파일명 (기본값: professor.png)
-        image_cache: 이미지 캐시 (dict, {hash: relative_path})
+        image_cache: 이미지 중복 제거 인덱스 (ImageIndex 또는 dict, {이미지 key: relative_path})
 
     Returns:
         상대경로 문자열 (예: ../images/professor.png)
@@ -314,32 +1773,36 @@ def save_professor_image(base64_data_url, images_dir, filename="professor.png",
     try:
         # data:image/png;base64,xxxxx 형식에서 타입과 데이터 추출
         header, data = base64_data_url.split(',', 1)
-        image_type_match = re.search(r'data:image/([^;]+)', header)
+        image_type_match = _DATA_URL_IMAGE_TYPE.search(header)
         if not image_type_match:
             return base64_data_url
 
         image_type = image_type_match.group(1)
         base64_data = data
 
-        # base64 데이터의 해시 계산 (중복 확인용)
-        image_hash = hashlib.md5(base64_data.encode('utf-8')).hexdigest()
+        # base64 디코딩 (중복 확인은 디코딩된 이미지 해시로)
+        writer = _get_image_writer()
+        image = writer.decode_many([base64_data], image_cache)[0]
+        if isinstance(image, Exception):
+            raise image
 
-        # 이미 저장된 이미지인지 확인
-        if image_hash in image_cache:
-            print(f"♻️ 교수 이미지 재사용: {image_cache[image_hash]}")
-            return image_cache[image_hash]
+        # 이미 저장된 이미지인지 확인 (Import/본문 이미지와 같으면 그 파일을 사용)
+        if image.key in image_cache:
+            _record_reuse(image_cache, image)
+            print(f"♻️ 교수 이미지 재사용: {image_cache[image.key]}")
+            return image_cache[image.key]
 
         # 교수 이미지는 고정 파일명 사용 (image_counter 증가 안 함)
         image_path = images_dir / filename
 
-        # base64 디코딩하여 파일로 저장
-        image_data = base64.b64decode(base64_data)
-        with open(image_path, 'wb') as f:
-            f.write(image_data)
+        # 파일로 저장 (쓰기는 ImageWriter 풀에서 처리)
+        writer.write(image_path, image, overwritable=True)
 
         # 상대경로 생성 및 캐시에 저장
+        # 같은 파일명에 이전에 저장한 다른 이미지는 덮어써지므로 캐시에서 제거
         relative_path = f"../images/{filename}"
-        image_cache[image_hash] = relative_path
+        _forget_cached_path(image_cache, relative_path)
+        image_cache[image.key] = relative_path
 
         print(f"✅ 교수 이미지 저장 완료: {filename}")
         return relative_path
@@ -348,6 +1811,124 @@ def save_professor_image(base64_data_url, images_dir, filename="professor.png",
         return base64_data_url  # 실패 시 원본 반환
 
 
+def process_professor_photo(professor_photo, images_dir, image_cache=None):
+    """
+    교수 사진을 인트로 페이지에서 사용할 경로로 변환 (base64면 professor.png로 저장)
+
+    Args:
+        professor_photo: <img src="data:image/..."> 태그, data URL, 상대경로 또는 URL
+        images_dir: 이미지 저장 디렉토리
+        image_cache: 이미지 중복 제거 인덱스
+
+    Returns:
+        상대경로 문자열 (base64가 아니면 원래 값)
+    """
+    if not professor_photo:
+        return professor_photo
+    # HTML 태그가 포함된 경우 (<img src="data:image/...">)
+    if "<img" in professor_photo and "data:image/" in professor_photo:
+        # HTML 태그에서 src 속성의 base64 데이터 추출
+        src_match = re.search(r'src=["\']([^"\']+)["\']', professor_photo)
+        if src_match:
+            # 교수 이미지 전용 함수 사용 (professor.png 고정)
+            return save_professor_image(src_match.group(1), images_dir, "professor.png", image_cache)
+        return professor_photo
+    # 단순 base64 문자열인 경우 (data:image/...;base64,...)
+    if professor_photo.startswith("data:image/"):
+        return save_professor_image(professor_photo, images_dir, "professor.png", image_cache)
+    # 이미 상대경로(../images/)이거나 절대경로/URL인 경우 그대로 사용
+    return professor_photo
+
+
+class _DataUrlImage:
+    """HTML 안의 base64 <img> 태그 하나 (html[start:end])"""
+
+    __slots__ = ("start", "end", "before_src", "image_type", "base64_data", "after_src")
+
+    def __init__(self, start, end, before_src, image_type, base64_data, after_src):
+        self.start = start
+        self.end = end
+        self.before_src = before_src  # src 이전 속성들
+        self.image_type = image_type  # png, jpeg, jpg, gif 등
+        self.base64_data = base64_data  # base64 데이터
+        self.after_src = after_src  # src 이후 속성들
+
+
+def _scan_data_url_images(html_content):
+    """
+    HTML에서 base64 이미지 태그를 위치(index) 기반으로 찾음
+
+    정규식 r'<img\\s+([^>]*?)src=["\\'](data:image/([^;]+);base64,([^"\\']+))["\\']([^>]*?)>'
+    과 같은 태그를 같은 순서로 찾지만, 수 MB의 base64 데이터 위에서 backtracking 하지 않고
+    find()로 구분 문자만 찾으므로 데이터 길이에 선형 시간이 걸림
+    (base64 데이터는 디코딩할 때 한 번만 잘라냄)
+
+    Returns:
+        _DataUrlImage 목록 (등장 순서)
+    """
+    images = []
+    find = html_content.find
+    startswith = html_content.startswith
+    length = len(html_content)
+    position = find('<img')
+    while position != -1:
+        attrs_start = position + 4
+        while attrs_start < length and html_content[attrs_start].isspace():
+            attrs_start += 1
+        image = None
+        if attrs_start > position + 4:
+            # src= 이전 속성에는 '>'가 올 수 없음
+            tag_limit = find('>', attrs_start)
+            if tag_limit == -1:
+                tag_limit = length
+            src = find('src=', attrs_start, tag_limit)
+            while src != -1:
+                image = _match_data_url_src(html_content, position, attrs_start, src)
+                if image is not None:
+                    break
+                src = find('src=', src + 1, tag_limit)
+        if image is None:
+            position = find('<img', position + 1)
+            continue
+        images.append(image)
+        position = find('<img', image.end)
+    return images
+
+
+def _match_data_url_src(html_content, position, attrs_start, src):
+    """src= 위치에서 시작하는 data URL 태그 확인 (맞지 않으면 None)"""
+    if html_content[src + 4:src + 5] not in ('"', "'"):
+        return None
+    type_start = src + 16
+    if not html_content.startswith('data:image/', src + 5):
+        return None
+    type_end = html_content.find(';', type_start)
+    if type_end <= type_start or not html_content.startswith(';base64,', type_end):
+        return None
+    data_start = type_end + 8
+    # 데이터는 첫 따옴표(종류 무관)에서 끝남: 여는 따옴표를 먼저 찾고 그 앞에서 다른 따옴표를 찾음
+    opening = html_content[src + 4]
+    other = "'" if opening == '"' else '"'
+    data_end = html_content.find(opening, data_start)
+    other_end = html_content.find(other, data_start, data_end if data_end != -1 else len(html_content))
+    if other_end != -1:
+        data_end = other_end
+    if data_end == -1 or data_end == data_start:
+        return None
+    tag_end = html_content.find('>', data_end + 1)
+    if tag_end == -1:
+        return None
+    return _DataUrlImage(
+        position,
+        tag_end + 1,
+        html_content[attrs_start:src],
+        html_content[type_start:type_end],
+        html_content[data_start:data_end],
+        html_content[data_end + 1:tag_end],
+    )
+
+
+@_planned_image_step
 def extract_and_save_images(html_content, images_dir, course_code, image_counter, imported_path_mapping=None, image_cache=None):
     """
     HTML에서 base64 이미지를 추출하여 파일로 저장하고 상대경로로 교체
@@ -360,7 +1941,7 @@ def extract_and_save_images(html_content, images_dir, course_code, image_counter
         course_code: 과목 코드
         image_counter: 이미지 카운터 (dict, {'count': int})
         imported_path_mapping: Import된 이미지 경로 매핑 (원본 -> 실제)
-        image_cache: 이미지 캐시 (dict, {hash: relative_path})
+        image_cache: 이미지 중복 제거 인덱스 (ImageIndex 또는 dict, {이미지 key: relative_path})
 
     Returns:
         이미지 경로가 교체된 HTML 문자열
@@ -374,30 +1955,32 @@ def extract_and_save_images(html_content, images_dir, course_code, image_counter
     if image_cache is None:
         image_cache = {}
 
-    # 먼저 에디터 관련 속성 정리
-    html_content = clean_html_for_export(html_content)
+    # 먼저 에디터 관련 속성 정리 (차시를 내보내는 중이면 차시 단위로 미리 정리한 결과 사용)
+    html_content = _clean_lesson_fragment(html_content)
     
     # 수식과 표는 브라우저에서 이미 이미지로 변환되어 base64로 들어옴
     # extract_and_save_images 함수가 base64 이미지를 자동으로 처리함
 
-    # base64 이미지 패턴 찾기: <img src="data:image/...;base64,..." />
-    # base64 데이터는 매우 길 수 있으므로 non-greedy가 아닌 greedy로 매칭
-    # 하지만 닫는 따옴표까지 매칭해야 하므로 더 정확한 패턴 사용
-    pattern = r'<img\s+([^>]*?)src=["\'](data:image/([^;]+);base64,([^"\']+))["\']([^>]*?)>'
-
-    def replace_image(match):
-        before_src = match.group(1)  # src 이전 속성들
-        full_data_url = match.group(2)  # 전체 data URL
-        image_type = match.group(3)  # png, jpeg, jpg, gif 등
-        base64_data = match.group(4)  # base64 데이터
-        after_src = match.group(5)  # src 이후 속성들
-
-        # base64 데이터의 해시 계산 (중복 확인용)
-        image_hash = hashlib.md5(base64_data.encode('utf-8')).hexdigest()
-        
-        # 이미 저장된 이미지인지 확인
-        if image_hash in image_cache:
-            relative_path = image_cache[image_hash]
+    # base64 이미지 태그 찾기: <img src="data:image/...;base64,..." />
+    # base64 데이터는 매우 길 수 있으므로 정규식 대신 위치 기반 스캐너 사용
+    writer = _get_image_writer()
+    matches = _scan_data_url_images(html_content)
+
+    # 1) 해시 계산과 디코딩을 병렬로 처리 (같은 데이터는 한 번만)
+    # 중복 판정은 디코딩된 이미지 해시로 하고, 디코딩 성공 여부를 먼저 알아야
+    # 순차 처리와 같은 결과(번호, 실패 시 원본 유지)가 나옴
+    decoded_images = writer.decode_many([match.base64_data for match in matches], image_cache)
+
+    def replace_image(match, image):
+        before_src = match.before_src  # src 이전 속성들
+        image_type = match.image_type  # png, jpeg, jpg, gif 등
+        base64_data = match.base64_data  # base64 데이터
+        after_src = match.after_src  # src 이후 속성들
+
+        # 이미 저장된 이미지인지 확인 (Import/교수 이미지 포함)
+        if not isinstance(image, Exception) and image.key in image_cache:
+            relative_path = image_cache[image.key]
+            _record_reuse(image_cache, image)
             print(f"♻️ 중복 이미지 재사용: {relative_path}")
             new_tag = f'<img {before_src}src="{relative_path}"{after_src}>'
             return new_tag
@@ -413,44 +1996,39 @@ def extract_and_save_images(html_content, images_dir, course_code, image_counter
         filename = f"{course_code}_img_{image_num:03d}.{ext}"
         image_path = images_dir / filename
 
-        try:
-            # base64 디코딩하여 파일로 저장
-            image_data = base64.b64decode(base64_data)
-            with open(image_path, 'wb') as f:
-                f.write(image_data)
-
-            # 상대경로로 교체 (data.json에서 images 폴더로의 경로: ../images/)
-            relative_path = f"../images/{filename}"
-            # 캐시에 저장
-            image_cache[image_hash] = relative_path
-            # img 태그의 src 속성만 교체 (다른 속성은 유지)
-            new_tag = f'<img {before_src}src="{relative_path}"{after_src}>'
-            print(f"✅ 이미지 저장 완료: {filename}")
-            return new_tag
-        except Exception as e:
-            print(f"⚠️ 이미지 저장 실패: {e}")
+        if isinstance(image, Exception):
+            print(f"⚠️ 이미지 저장 실패: {image}")
             # 실패 시 원본 태그 유지
-            return match.group(0)
+            return html_content[match.start:match.end]
+
+        # 파일 쓰기는 ImageWriter 풀에서 처리
+        writer.write(image_path, image)
 
-    # 모든 base64 이미지를 찾아서 교체 (순차적으로 처리)
-    # re.sub는 모든 매치를 순차적으로 처리하므로 각 이미지마다 카운터가 증가함
-    result = re.sub(pattern, replace_image, html_content)
+        # 상대경로로 교체 (data.json에서 images 폴더로의 경로: ../images/)
+        relative_path = f"../images/{filename}"
+        # 캐시에 저장
+        image_cache[image.key] = relative_path
+        # img 태그의 src 속성만 교체 (다른 속성은 유지)
+        new_tag = f'<img {before_src}src="{relative_path}"{after_src}>'
+        print(f"✅ 이미지 저장 완료: {filename}")
+        return new_tag
+
+    # 2) 번호 부여와 교체는 메인 스레드에서 등장 순서대로 처리 (각 이미지마다 카운터가 증가함)
+    parts = []
+    last_end = 0
+    for match, image in zip(matches, decoded_images):
+        parts.append(html_content[last_end:match.start])
+        parts.append(replace_image(match, image))
+        last_end = match.end
+    parts.append(html_content[last_end:])
+    result = ''.join(parts)
 
     # Import된 이미지 경로 교체 (확장자가 변경된 경우)
     # 예: ../images/25itinse_img_002.jpg -> ../images/25itinse_img_002.png
-    for original_path, actual_path in imported_path_mapping.items():
-        if original_path != actual_path:
-            # 교체 전 확인
-            if original_path in result:
-                print(f"🔄 경로 교체: {original_path} → {actual_path}")
-                # HTML에서 원본 경로를 실제 경로로 교체
-                before = result
-                result = result.replace(f'src="{original_path}"', f'src="{actual_path}"')
-                result = result.replace(f"src='{original_path}'", f"src='{actual_path}'")
-                if before != result:
-                    print(f"✅ 경로 교체 성공")
-                else:
-                    print(f"⚠️ 경로 교체 실패: HTML에서 매칭되는 패턴을 찾지 못했습니다")
+    if imported_path_mapping:
+        if not isinstance(imported_path_mapping, ImportedPathMapping):
+            imported_path_mapping = ImportedPathMapping(imported_path_mapping)
+        result = imported_path_mapping.rewrite(result)
 
     return result
 
@@ -647,12 +2225,19 @@ def is_practice_content_empty(content):
     # practice 항목인지 확인 (<ul class='practice'> 또는 <div class='practice'>)
     if "class='practice'" not in content and 'class="practice"' not in content:
         return False
-    # HTML 태그 제거 후 텍스트만 추출
-    text = re.sub(r'<[^>]+>', '', content)
-    text = text.strip()
-    # 비어있거나 공백만 있으면 True
-    return not text or not text.strip()
-    
+    return _is_practice_text_empty(content)
+
+
+@functools.lru_cache(maxsize=16)
+def _is_practice_text_empty(content):
+    """
+    HTML 태그를 제거한 실습 내용이 비어있거나 공백만 있는지
+
+    objectives/practice 컴포넌트와 학습목표 페이지가 같은 차시의 실습 내용을 다시 확인하므로 캐시
+    """
+    return not strip_html_tags(content).strip()
+
+
 def create_objectives_page(contents, objectives, images_dir=None, course_code=None, image_counter=None, imported_path_mapping=None, image_cache=None, description=None, script=None, lesson_meta=None):
     """학습목표 페이지 생성"""
     # 실습 항목 제외하고 학습내용 필터링
@@ -684,7 +2269,7 @@ def create_objectives_page(contents, objectives, images_dir=None, course_code=No
                 final_contents.append(c)
             else:
                 # 이미 번호가 있는지 확인 (중복 방지)
-                if re.match(r'^\d+[\.\)]\s', c):
+                if _NUMBERED_ITEM.match(c):
                     final_contents.append(c)
                 else:
                     final_contents.append(f"{content_number}. {c}")
@@ -696,7 +2281,7 @@ def create_objectives_page(contents, objectives, images_dir=None, course_code=No
     for o in processed_objectives:
         if o:
             # 이미 번호가 있는지 확인 (중복 방지)
-            if re.match(r'^\d+[\.\)]\s', o):
+            if _NUMBERED_ITEM.match(o):
                 final_objectives.append(o)
             else:
                 final_objectives.append(f"{objective_number}. {o}")
@@ -916,12 +2501,12 @@ def create_exercise_page(lesson, images_dir=None, course_code=None, image_counte
                     question = extract_and_save_images(question, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
                     # 문항의 <p> 태그 제거 (단일 단락인 경우)
                     if question.startswith('<p>') and question.endswith('</p>') and question.count('<p>') == 1:
-                        question = re.sub(r'</?p>', '', question)
+                        question = strip_paragraph_tags(question)
                 if commentary:
                     commentary = extract_and_save_images(commentary, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
                     # 해설의 <p> 태그 제거 (단일 단락인 경우)
                     if commentary.startswith('<p>') and commentary.endswith('</p>') and commentary.count('<p>') == 1:
-                        commentary = re.sub(r'</?p>', '', commentary)
+                        commentary = strip_paragraph_tags(commentary)
                 # 선택지도 이미지 처리 및 줄바꿈 처리
                 if ex.get("type") == "multiple":
                     processed_options = []
@@ -931,8 +2516,8 @@ def create_exercise_page(lesson, images_dir=None, course_code=None, image_counte
                             processed_opt = extract_and_save_images(opt, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
                             # <p> 태그를 <br />로 변환 (TipTap 에디터에서 오는 경우)
                             # <p>내용1</p><p>내용2</p> → 내용1<br />내용2
-                            processed_opt = re.sub(r'</p>\s*<p>', '<br />', processed_opt)
-                            processed_opt = re.sub(r'</?p>', '', processed_opt)
+                            processed_opt = join_paragraphs(processed_opt)
+                            processed_opt = strip_paragraph_tags(processed_opt)
                             # 줄바꿈 문자를 <br />로 변환
                             processed_opt = processed_opt.replace('\n', '<br />')
                             processed_options.append(processed_opt)
@@ -971,12 +2556,12 @@ def create_exercise_page(lesson, images_dir=None, course_code=None, image_counte
                     question = extract_and_save_images(question, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
                     # 문항의 <p> 태그 제거 (단일 단락인 경우)
                     if question.startswith('<p>') and question.endswith('</p>') and question.count('<p>') == 1:
-                        question = re.sub(r'</?p>', '', question)
+                        question = strip_paragraph_tags(question)
                     if commentary:
                         commentary = extract_and_save_images(commentary, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
                         # 해설의 <p> 태그 제거 (단일 단락인 경우)
                         if commentary.startswith('<p>') and commentary.endswith('</p>') and commentary.count('<p>') == 1:
-                            commentary = re.sub(r'</?p>', '', commentary)
+                            commentary = strip_paragraph_tags(commentary)
                     # 선택지도 이미지 처리 및 줄바꿈 처리
                     if ex.get("type") == "multiple":
                         processed_options = []
@@ -986,8 +2571,8 @@ def create_exercise_page(lesson, images_dir=None, course_code=None, image_counte
                                 processed_opt = extract_and_save_images(opt, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
                                 # <p> 태그를 <br />로 변환 (TipTap 에디터에서 오는 경우)
                                 # <p>내용1</p><p>내용2</p> → 내용1<br />내용2
-                                processed_opt = re.sub(r'</p>\s*<p>', '<br />', processed_opt)
-                                processed_opt = re.sub(r'</?p>', '', processed_opt)
+                                processed_opt = join_paragraphs(processed_opt)
+                                processed_opt = strip_paragraph_tags(processed_opt)
                                 # 줄바꿈 문자를 <br />로 변환
                                 processed_opt = processed_opt.replace('\n', '<br />')
                                 processed_options.append(processed_opt)
@@ -1173,6 +2758,30 @@ def get_index_html_template(preset_id="2025-standard", theme="type-1"):
 </html>'''
 
 
+# components가 없는 프리셋의 페이지 순서
+DEFAULT_PAGE_COMPONENTS = ("intro", "orientation", "term", "objectives", "opinion", "lecture", "practice", "check", "exercise", "theorem", "next")
+
+
+def _course_render_context(preset_id, theme):
+    """
+    과정 단위 렌더링 정보 (차시마다 프리셋 조회, index.html 생성을 반복하지 않도록 한 번만 계산)
+
+    Returns:
+        course_ctx에 합칠 딕셔너리
+        - preset: 프리셋 정의 (없는 프리셋이면 2025-standard)
+        - components: 페이지 컴포넌트 순서
+        - is_2018: 2018 템플릿 여부 (인트로 페이지 형식, data.json ' : ' 구분자)
+        - index_html: 모든 차시에 같은 내용으로 쓰는 index.html
+    """
+    preset = export_templates.TEMPLATE_PRESETS.get(preset_id, export_templates.TEMPLATE_PRESETS["2025-standard"])
+    return {
+        "preset": preset,
+        "components": tuple(preset.get("components", DEFAULT_PAGE_COMPONENTS)),
+        "is_2018": preset_id == "2018-standard",
+        "index_html": get_index_html_template(preset_id, theme),
+    }
+
+
 def create_subjects_json(course_data, preset_id="2025-standard"):
     """subjects.json 생성 (주차별 차시 목록)"""
     # 2018-2021 템플릿은 subjects.json에서 <span> 태그를 사용하지 않음 (순수 텍스트)
@@ -1273,106 +2882,761 @@ def create_subjects_json(course_data, preset_id="2025-standard"):
 
         subjects.append(subject_entry)
 
-    return {"subjects": subjects}
+    return {"subjects": subjects}
+
+
+def legacy_subjects_json_dumps(subjects_json_data):
+    """
+    2018 템플릿용 subjects.json 직렬화 (플레이어가 읽는 형식 그대로)
+    - ' : ' 구분자, 탭 들여쓰기
+    - 주차 객체를 '},{'로 이어 씀
+    - 제목/목록 문자열은 이스케이프하지 않음
+    """
+    lines = ["{", '\t"subjects" : [{']
+    for i, subj in enumerate(subjects_json_data["subjects"]):
+        if i > 0:
+            lines.append('\t},{')
+        lines.append(f'\t\t"title" : "{subj["title"]}"')
+        if "lists" in subj:
+            lines[-1] += ','
+            lines.append('\t\t"lists" : [')
+            for j, item in enumerate(subj["lists"]):
+                comma = "," if j < len(subj["lists"]) - 1 else ""
+                lines.append(f'\t\t\t"{item}"{comma}')
+            lines.append('\t\t]')
+    lines.append('\t}]')
+    lines.append('}')
+    return "\n".join(lines) + "\n"
+
+
+class ImportedPathMapping(dict):
+    """
+    Import된 이미지 경로 매핑 {원본 경로: 실제 저장된 경로}
+
+    확장자가 바뀐 경로(원본 != 실제)만 교체 테이블로 만들어 두고, 조각마다 src="..." / src='...'
+    값을 한 번 훑으면서 테이블에서 찾아 교체함 (매핑 전체를 조각마다 반복하지 않음)
+    교체 테이블은 처음 교체할 때 만들어지고, 매핑을 바꾸면 버려져 다음 교체 때 다시 만들어짐
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replacements = None
+        self._max_length = 0
+        self.rewritten_fragments = 0
+        self.rewritten_paths = 0
+
+    def _invalidate(self):
+        self._replacements = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._invalidate()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def setdefault(self, key, default=None):
+        self._invalidate()
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._invalidate()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._invalidate()
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def _compile(self):
+        items = [(original, actual) for original, actual in self.items() if original != actual]
+        # 매핑 순서대로 str.replace를 반복한 것과 같도록, 교체된 경로가 뒤의 매핑의 원본이면 이어서 적용
+        order = {original: index for index, (original, _) in enumerate(items)}
+        replacements = {}
+        for index, (original, actual) in enumerate(items):
+            while order.get(actual, -1) > index:
+                index = order[actual]
+                actual = items[index][1]
+            replacements[original] = actual
+        self._replacements = replacements
+        self._max_length = max(map(len, replacements), default=0)
+
+    def rewrite(self, html_content):
+        """HTML의 src 속성에서 확장자가 바뀐 원본 경로를 실제 경로로 교체"""
+        if self._replacements is None:
+            self._compile()
+        replacements = self._replacements
+        if not replacements or 'src=' not in html_content:
+            return html_content
+
+        parts = []
+        last_end = 0
+        find = html_content.find
+        position = find('src=')
+        while position != -1:
+            value_start = position + 5
+            quote = html_content[position + 4:value_start]
+            if quote == '"' or quote == "'":
+                value_end = find(quote, value_start, value_start + self._max_length + 1)
+                if value_end != -1:
+                    actual_path = replacements.get(html_content[value_start:value_end])
+                    if actual_path is not None:
+                        parts.append(html_content[last_end:value_start])
+                        parts.append(actual_path)
+                        last_end = value_end
+                        position = find('src=', value_end + 1)
+                        continue
+            position = find('src=', position + 4)
+
+        if not parts:
+            return html_content
+        self.rewritten_fragments += 1
+        self.rewritten_paths += len(parts) // 2
+        parts.append(html_content[last_end:])
+        return ''.join(parts)
+
+
+def save_imported_images(imported_images, images_dir, image_cache=None):
+    """
+    임포트된 이미지들을 파일로 저장
+    HTML에서 원래 파일명으로 참조하므로 중복이어도 모두 저장하고,
+    image_cache에 등록하여 같은 이미지가 본문에 있으면 이 파일을 재사용하게 함
+
+    Args:
+        imported_images: 경로 -> base64 딕셔너리
+            (스트리밍 모드에서는 (경로, base64) 쌍을 하나씩 내보내는 iterator)
+        images_dir: 저장할 디렉토리
+        image_cache: 이미지 중복 제거 인덱스 (ImageIndex 또는 dict, {이미지 key: relative_path})
+
+    Returns:
+        (저장된 이미지 개수, 경로 매핑 ImportedPathMapping {원본경로: 실제저장된경로})
+    """
+    if not imported_images:
+        return 0, ImportedPathMapping()
+
+    saved_count = 0
+    path_mapping = ImportedPathMapping()  # 원본 경로 -> 실제 저장된 경로
+
+    if isinstance(imported_images, dict):
+        print(f"\n📥 Import된 이미지 처리 시작: {len(imported_images)}개")
+        imported_images = imported_images.items()
+    else:
+        # 스트리밍 모드: 파싱되는 대로 하나씩 디코딩하여 저장 (전체 개수는 미리 알 수 없음)
+        print(f"\n📥 Import된 이미지 처리 시작 (스트리밍)")
+
+    # 디코딩과 저장은 ImageWriter 풀에서 묶음 단위로 병렬 처리
+    # (경로 매핑은 디코딩 성공 여부에 따라 결정되므로 입력 순서대로 반영)
+    writer = _get_image_writer()
+    batch = []
+
+    # 증분 export: 이전 export에서 같은 파일명으로 저장한 같은 이미지는 다시 디코딩/저장하지 않음
+    aliases = getattr(image_cache, 'aliases', None)
+
+    def saved_image(actual_filename, base64_data):
+        if not aliases:
+            return None
+        known = aliases.get(_hash_base64_text(base64_data))
+        if known is not None and image_cache.get(known.key) == f"../images/{actual_filename}":
+            return known
+        return None
+
+    def save_batch():
+        count = 0
+        # 파일명으로 참조되므로 인덱스에 같은 이미지가 있어도 항상 디코딩하여 저장
+        decoded = iter(writer.decode_many((item[2] for item in batch if item[3] is None), image_cache, reuse=False))
+        for rel_path, actual_filename, _, known in batch:
+            image = known if known is not None else next(decoded)
+            if isinstance(image, Exception):
+                print(f"⚠️ 이미지 저장 실패 ({rel_path}): {image}")
+                continue
+            if known is None:
+                writer.write(images_dir / actual_filename, image)
+
+            # 경로 매핑 저장 (원본 -> 실제)
+            actual_rel_path = f"../images/{actual_filename}"
+            path_mapping[rel_path] = actual_rel_path
+            if image_cache is not None:
+                image_cache.setdefault(image.key, actual_rel_path)
+            count += 1
+        batch.clear()
+        return count
+
+    for rel_path, base64_data in imported_images:
+        try:
+            # ../images/filename.ext 에서 filename.ext 추출 (크로스 플랫폼 호환)
+            # Windows와 Unix 모두 '/' 또는 '\' 구분자 처리
+            # Path 객체 사용하여 더 안전하게 처리
+            normalized_path = rel_path.replace('\\', '/')
+            original_filename = os.path.basename(normalized_path)
+            if not original_filename:
+                continue
+
+            # base64 데이터에서 이미지 타입 추출
+            image_type = 'png'  # 기본값
+            actual_base64_data = base64_data
+
+            if ',' in base64_data:
+                header, actual_base64_data = base64_data.split(',', 1)
+                # data:image/png;base64 형식에서 타입 추출
+                type_match = _DATA_URL_IMAGE_TYPE.search(header)
+                if type_match:
+                    detected_type = type_match.group(1)
+                    image_type = 'png' if detected_type == 'png' else ('jpg' if detected_type in ['jpeg', 'jpg'] else detected_type)
+
+            # 원본 파일명에서 확장자 제거하고 실제 타입 확장자로 교체
+            name_without_ext = os.path.splitext(original_filename)[0]
+            actual_filename = f"{name_without_ext}.{image_type}"
+
+            # 타입이 변경되었는지 확인
+            original_ext = os.path.splitext(original_filename)[1][1:]  # 점 제거
+            if original_ext != image_type:
+                print(f"  🔄 {original_filename}: {original_ext} → {image_type}")
+
+            batch.append((rel_path, actual_filename, actual_base64_data, saved_image(actual_filename, actual_base64_data)))
+        except Exception as e:
+            print(f"⚠️ 이미지 저장 실패 ({rel_path}): {e}")
+            continue
+
+        if len(batch) >= writer.max_workers * 4:
+            saved_count += save_batch()
+
+    if batch:
+        saved_count += save_batch()
+
+    # 경로 매핑 결과 출력
+    changed_paths = {k: v for k, v in path_mapping.items() if k != v}
+    if changed_paths:
+        print(f"\n📋 경로 매핑 결과:")
+        for original, actual in changed_paths.items():
+            print(f"  {original} → {actual}")
+
+    return saved_count, path_mapping
+
+
+class _JsonStreamReader:
+    """
+    JSON 파일을 청크 단위로 읽으며 값을 하나씩 디코딩하는 최소한의 스트리밍 리더
+    (외부 패키지 없이 json.JSONDecoder.raw_decode 사용)
+
+    컨테이너(객체/배열)는 항목 단위로 순회할 수 있어서,
+    거대한 lessons 배열이나 importedImages 객체를 통째로 메모리에 올리지 않음
+    """
+
+    def __init__(self, f, chunk_size=1 << 20):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size=None):
+        """버퍼에 데이터를 더 읽어옴 (이미 소비한 앞부분은 버림)"""
+        if self._eof:
+            return False
+        data = self._f.read(size or self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛰고 다음 문자를 반환 (파일 끝이면 빈 문자열)"""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            end = len(buf)
+            while pos < end and buf[pos] in ' \t\r\n':
+                pos += 1
+            self._pos = pos
+            if pos < end:
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON 파싱 오류: '{char}' 예상, '{found}' 발견")
+        self._pos += 1
+
+    def read_value(self):
+        """다음 JSON 값 하나를 디코딩하여 반환"""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # 값이 버퍼 경계에서 잘린 경우: 더 읽고 다시 시도 (읽기 크기는 두 배씩)
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # 숫자가 버퍼 경계에서 잘렸을 수 있으므로 (예: "0" + ".125") 뒤에 구분자가 올 때까지 확인
+            truncated = end >= len(self._buf) or (
+                isinstance(value, (int, float)) and self._buf[end] not in ' \t\r\n,]}'
+            )
+            if truncated and self._fill(size):
+                continue
+            self._pos = end
+            return value
+
+    def _iter_container(self, open_char, close_char):
+        self._expect(open_char)
+        if self.peek() == close_char:
+            self._pos += 1
+            return
+        while True:
+            yield
+            found = self.peek()
+            self._pos += 1
+            if found == close_char:
+                return
+            if found != ',':
+                raise ValueError(f"JSON 파싱 오류: ',' 또는 '{close_char}' 예상, '{found}' 발견")
+
+    def iter_array(self):
+        """배열 항목을 하나씩 디코딩하여 반환"""
+        for _ in self._iter_container('[', ']'):
+            yield self.read_value()
+
+    def iter_object(self):
+        """
+        객체의 키를 하나씩 반환
+        호출 측은 다음 키를 요청하기 전에 read_value/iter_array/skip_value 등으로 값을 소비해야 함
+        """
+        for _ in self._iter_container('{', '}'):
+            key = self.read_value()
+            self._expect(':')
+            yield key
+
+    def skip_value(self):
+        """값을 건너뜀 (컨테이너는 항목 단위로 버리므로 전체를 메모리에 올리지 않음)"""
+        char = self.peek()
+        if char == '[':
+            for _ in self._iter_container('[', ']'):
+                self.skip_value()
+        elif char == '{':
+            for _ in self.iter_object():
+                self.skip_value()
+        else:
+            self.read_value()
+
+
+# subjects.json 생성에 필요한 차시 필드 (스트리밍 모드에서 차시 요약으로 보관)
+LESSON_SUMMARY_KEYS = ("lessonNumber", "lessonTitle", "weekNumber", "weekTitle", "isPracticeWeek")
+
+
+def read_builder_json_header(builder_json_path):
+    """
+    Builder JSON에서 lessons/importedImages 본문을 제외한 최상위 값을 읽음
+
+    lessons는 subjects.json 생성에 필요한 필드만 남긴 요약 리스트로 대체하고,
+    importedImages는 건너뛰되 항목이 있었는지 여부만 기록함
+
+    Returns:
+        (course_data 딕셔너리, importedImages 존재 여부)
+    """
+    course_data = {}
+    has_imported_images = False
+
+    with open(builder_json_path, 'r', encoding='utf-8') as f:
+        reader = _JsonStreamReader(f)
+        for key in reader.iter_object():
+            if key == "lessons" and reader.peek() == '[':
+                course_data["lessons"] = [
+                    {k: lesson[k] for k in LESSON_SUMMARY_KEYS if k in lesson}
+                    for lesson in reader.iter_array()
+                ]
+            elif key == "importedImages" and reader.peek() == '{':
+                for _ in reader.iter_object():
+                    reader.skip_value()
+                    has_imported_images = True
+            else:
+                course_data[key] = reader.read_value()
+
+    return course_data, has_imported_images
 
 
-def save_imported_images(imported_images, images_dir):
+def iter_builder_json_member(builder_json_path, member):
     """
-    임포트된 이미지들을 파일로 저장
-
-    Args:
-        imported_images: 경로 -> base64 딕셔너리
-        images_dir: 저장할 디렉토리
+    Builder JSON 최상위 member의 항목을 하나씩 디코딩하여 반환
+    - 배열(lessons): 각 항목
+    - 객체(importedImages): (키, 값) 쌍
 
-    Returns:
-        (저장된 이미지 개수, 경로 매핑 딕셔너리 {원본경로: 실제저장된경로})
+    member 외의 값은 항목 단위로 건너뛰므로 메모리 사용량은 가장 큰 항목 하나 수준
     """
-    if not imported_images:
-        return 0, {}
-
-    saved_count = 0
-    path_mapping = {}  # 원본 경로 -> 실제 저장된 경로
+    with open(builder_json_path, 'r', encoding='utf-8') as f:
+        reader = _JsonStreamReader(f)
+        for key in reader.iter_object():
+            if key != member:
+                reader.skip_value()
+                continue
+            char = reader.peek()
+            if char == '[':
+                yield from reader.iter_array()
+            elif char == '{':
+                for item_key in reader.iter_object():
+                    yield item_key, reader.read_value()
+            else:
+                reader.skip_value()
 
-    print(f"\n📥 Import된 이미지 처리 시작: {len(imported_images)}개")
 
-    for rel_path, base64_data in imported_images.items():
-        try:
-            # ../images/filename.ext 에서 filename.ext 추출 (크로스 플랫폼 호환)
-            # Windows와 Unix 모두 '/' 또는 '\' 구분자 처리
-            # Path 객체 사용하여 더 안전하게 처리
-            normalized_path = rel_path.replace('\\', '/')
-            original_filename = os.path.basename(normalized_path)
-            if not original_filename:
-                continue
+EXPORT_MANIFEST_NAME = ".export-manifest.json"
+EXPORT_MANIFEST_VERSION = 1
 
-            # base64 데이터에서 이미지 타입 추출
-            image_type = 'png'  # 기본값
-            actual_base64_data = base64_data
+# data.json에서 참조하는 이미지 경로
+_IMAGE_REFERENCE_PATTERN = re.compile(r'\.\./images/([^"\'\s\\<>]+)')
 
-            if ',' in base64_data:
-                header, actual_base64_data = base64_data.split(',', 1)
-                # data:image/png;base64 형식에서 타입 추출
-                type_match = re.search(r'data:image/([^;]+)', header)
-                if type_match:
-                    detected_type = type_match.group(1)
-                    image_type = 'png' if detected_type == 'png' else ('jpg' if detected_type in ['jpeg', 'jpg'] else detected_type)
 
-            # 원본 파일명에서 확장자 제거하고 실제 타입 확장자로 교체
-            name_without_ext = os.path.splitext(original_filename)[0]
-            actual_filename = f"{name_without_ext}.{image_type}"
+def _fingerprint(value):
+    """JSON으로 표현 가능한 값의 내용 해시"""
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
-            # 타입이 변경되었는지 확인
-            original_ext = os.path.splitext(original_filename)[1][1:]  # 점 제거
-            if original_ext != image_type:
-                print(f"  🔄 {original_filename}: {original_ext} → {image_type}")
 
-            # 디코딩 및 저장
-            image_data = base64.b64decode(actual_base64_data)
-            image_path = images_dir / actual_filename
+def _exporter_fingerprint():
+    """변환 코드(이 파일, export_templates)의 해시 (코드가 바뀌면 모든 차시를 다시 생성)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (__file__, export_templates.__file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
 
-            with open(image_path, 'wb') as f:
-                f.write(image_data)
 
-            # 경로 매핑 저장 (원본 -> 실제)
-            actual_rel_path = f"../images/{actual_filename}"
-            path_mapping[rel_path] = actual_rel_path
+class ExportManifest:
+    """
+    증분 export용 manifest (과정 폴더의 .export-manifest.json)
 
-            saved_count += 1
-        except Exception as e:
-            print(f"⚠️ 이미지 저장 실패 ({rel_path}): {e}")
+    차시별 입력 fingerprint, 프리셋/테마 fingerprint, 저장된 이미지(경로 -> 이미지 key)를 기록함
+    다음 export에서 입력이 바뀌지 않은 차시는 다시 생성하지 않고,
+    이미지 번호와 중복 제거 인덱스를 이어받아 바뀌지 않은 차시의 ../images/... 경로가 유지되게 함
+    """
 
-    # 경로 매핑 결과 출력
-    changed_paths = {k: v for k, v in path_mapping.items() if k != v}
-    if changed_paths:
-        print(f"\n📋 경로 매핑 결과:")
-        for original, actual in changed_paths.items():
-            print(f"  {original} → {actual}")
+    def __init__(self, course_dir, previous=None):
+        self.path = Path(course_dir) / EXPORT_MANIFEST_NAME
+        self.previous = previous or {}
+        self.lessons = {}
+        self.course = None
 
-    return saved_count, path_mapping
+    @classmethod
+    def load(cls, course_dir):
+        """이전 manifest 로드 (없거나 읽을 수 없으면 빈 manifest)"""
+        path = Path(course_dir) / EXPORT_MANIFEST_NAME
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+        except FileNotFoundError:
+            return cls(course_dir)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ export manifest를 읽을 수 없어 전체 변환합니다: {e}")
+            return cls(course_dir)
+        if previous.get("version") != EXPORT_MANIFEST_VERSION:
+            return cls(course_dir)
+        return cls(course_dir, previous)
+
+    @property
+    def image_count(self):
+        """이전 export의 마지막 이미지 번호"""
+        return self.previous.get("imageCount", 0)
+
+    def seed_image_cache(self, image_cache, images_dir):
+        """이전 export에서 저장한 이미지를 중복 제거 인덱스에 등록 (파일이 남아 있는 것만)"""
+        seeded = 0
+        for relative_path, key in self.previous.get("images", {}).items():
+            if (Path(images_dir) / os.path.basename(relative_path)).is_file():
+                image_cache.setdefault(key, relative_path)
+                seeded += 1
+        for base64_hash, (key, size) in self.previous.get("aliases", {}).items():
+            image_cache.aliases[base64_hash] = DecodedImage(key, size)
+        return seeded
+
+    def set_course(self, course_fingerprint, template_fingerprint):
+        self.course = {"course": course_fingerprint, "template": template_fingerprint}
+
+    def is_unchanged(self, lesson_num, lesson_fingerprint, course_dir, images_dir):
+        """이전 export와 입력이 같고 출력 파일이 모두 남아 있는 차시인지 확인"""
+        previous_lesson = self.previous.get("lessons", {}).get(lesson_num)
+        if previous_lesson is None or previous_lesson.get("fingerprint") != lesson_fingerprint:
+            return False
+        if any(self.previous.get(name) != value for name, value in self.course.items()):
+            return False
+        lesson_folder = Path(course_dir) / lesson_num
+        if not (lesson_folder / "index.html").is_file() or not (lesson_folder / "assets" / "data" / "data.json").is_file():
+            return False
+        return all((Path(images_dir) / name).is_file() for name in previous_lesson.get("images", []))
+
+    def keep_lesson(self, lesson_num):
+        """변경 없는 차시의 이전 기록 유지"""
+        self.lessons[lesson_num] = self.previous["lessons"][lesson_num]
+
+    def record_lesson(self, lesson_num, lesson_fingerprint, course_dir):
+        """생성한 차시의 fingerprint와 참조하는 이미지 기록"""
+        data_path = Path(course_dir) / lesson_num / "assets" / "data" / "data.json"
+        with open(data_path, 'r', encoding='utf-8') as f:
+            images = sorted(set(_IMAGE_REFERENCE_PATTERN.findall(f.read())))
+        self.lessons[lesson_num] = {"fingerprint": lesson_fingerprint, "images": images}
+
+    def save(self, image_cache, image_counter, images_dir):
+        """manifest 저장 (이미지 쓰기가 모두 끝난 뒤 호출)"""
+        # 기본 이미지처럼 export하지 않은 파일은 차시 출력 확인 대상에서 제외
+        for lesson in self.lessons.values():
+            lesson["images"] = [name for name in lesson["images"] if (Path(images_dir) / name).is_file()]
+        manifest = {
+            "version": EXPORT_MANIFEST_VERSION,
+            **self.course,
+            "imageCount": image_counter['count'],
+            "images": {relative_path: key for key, relative_path in image_cache.items()},
+            "aliases": {
+                base64_hash: [image.key, image.size]
+                for base64_hash, image in image_cache.aliases.items()
+                if image.key in image_cache
+            },
+            "lessons": self.lessons,
+        }
+        _atomic_write(self.path, json.dumps(manifest, ensure_ascii=False, indent=1).encode('utf-8'))
 
 
-def convert_builder_to_subjects(builder_json_path, output_dir=None):
+def convert_builder_to_subjects(builder_json_path, output_dir=None, stream=False, image_workers=None,
+                                image_store=None, incremental=False, lesson_workers=None, target=None,
+                                link_index_html=False):
     """Builder JSON을 subjects 폴더 구조로 변환
     
     Args:
         builder_json_path: Path 객체 또는 문자열 (JSON 파일 경로)
         output_dir: Path 객체 또는 문자열 (출력 디렉토리, None이면 현재 디렉토리/subjects)
+        stream: True면 JSON 전체를 로드하지 않고 차시/이미지를 하나씩 읽어서 처리
+            (최대 메모리 사용량이 과정 전체가 아닌 가장 큰 차시 크기에 비례)
+        image_workers: 이미지 디코딩/저장 스레드 수 (None이면 DEFAULT_IMAGE_WORKERS, 1이면 순차 처리)
+        image_store: ImageStore 또는 저장소 디렉토리 경로 (export 간 이미지 재사용, None이면 사용 안 함)
+        incremental: True면 과정 폴더의 manifest와 비교하여 입력이 바뀐 차시만 다시 생성
+            (이미지 번호는 이전 export에서 이어받음)
+        lesson_workers: 차시 내보내기 프로세스 수 (None 또는 1이면 순차 처리, 결과는 항상 동일)
+        target: 출력 대상 (None이면 output_dir에 파일로 저장, ZipTarget이면 ZIP에 바로 기록)
+        link_index_html: True면 index.html을 첫 차시에만 쓰고 나머지 차시는 하드링크
+            (파일시스템 출력에서만 사용, 하드링크를 만들 수 없으면 복사)
+    """
+
+    course_data, lessons, imported_images = _load_builder_json(builder_json_path, stream)
+    return _run_export(course_data, lessons, imported_images, output_dir, image_workers, image_store,
+                       incremental, lesson_workers, target, link_index_html)
+
+
+def _load_builder_json(builder_json_path, stream=False):
     """
+    Builder JSON 읽기
 
+    Returns:
+        (course_data, lessons, imported_images)
+        stream이면 lessons/imported_images는 파일에서 하나씩 읽는 iterator
+    """
     # Path 객체로 변환 (크로스 플랫폼 호환성)
     builder_json_path = Path(builder_json_path)
-    
-    # JSON 로드
-    with open(builder_json_path, 'r', encoding='utf-8') as f:
-        course_data = json.load(f)
 
+    if stream:
+        # 1회차: 최상위 값과 차시 요약만 읽음
+        # 2회차: importedImages를 하나씩 디코딩하여 저장 (save_imported_images)
+        # 3회차: 차시를 하나씩 읽어서 내보내고 버림
+        course_data, has_imported_images = read_builder_json_header(builder_json_path)
+        imported_images = iter_builder_json_member(builder_json_path, "importedImages") if has_imported_images else {}
+        lessons = iter_builder_json_member(builder_json_path, "lessons")
+    else:
+        # JSON 로드
+        with open(builder_json_path, 'r', encoding='utf-8') as f:
+            course_data = json.load(f)
+        lessons = course_data["lessons"]
+        imported_images = course_data.get("importedImages", {})
+    return course_data, lessons, imported_images
+
+
+def convert_course_data(course_data, output_dir=None, image_workers=None, image_store=None,
+                        incremental=False, lesson_workers=None, target=None, link_index_html=False):
+    """이미 로드된 Builder JSON 데이터를 변환 (API 핸들러 등에서 임시 JSON 파일 없이 사용)
+
+    Args:
+        course_data: Builder JSON 딕셔너리
+        나머지: convert_builder_to_subjects와 동일
+    """
+    return _run_export(course_data, course_data["lessons"], course_data.get("importedImages", {}), output_dir,
+                       image_workers, image_store, incremental, lesson_workers, target, link_index_html)
+
+
+def _run_export(course_data, lessons, imported_images, output_dir, image_workers, image_store,
+                incremental, lesson_workers, target, link_index_html=False):
+    if target is not None and not isinstance(target, DirectoryTarget):
+        if incremental:
+            raise ValueError("incremental export는 파일시스템 출력에서만 사용할 수 있습니다")
+        # ZIP 등에서는 output_dir 대신 출력 대상의 가상 root 사용
+        output_dir = target.root
+
+    if image_store is not None and not isinstance(image_store, ImageStore):
+        image_store = ImageStore(image_store)
+
+    token = _current_output_target.set(target)
+    try:
+        with ImageWriter(image_workers, store=image_store):
+            success = _convert_course(course_data, lessons, imported_images, output_dir, incremental, lesson_workers,
+                                      link_index_html)
+        # 이미지 쓰기가 모두 끝난 뒤 보관 중인 항목 기록
+        _get_output_target().flush()
+        return success
+    finally:
+        _current_output_target.reset(token)
+
+
+def find_builder_json_files(paths):
+    """
+    파일/디렉토리 목록에서 변환할 Builder JSON 파일 목록 (디렉토리는 바로 아래의 *.json, 중복 제외)
+    """
+    files = []
+    seen = set()
+    for path in paths:
+        path = Path(path).expanduser()
+        candidates = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for candidate in candidates:
+            resolved = candidate.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                files.append(resolved)
+    return files
+
+
+def _course_output_stats(course_dir):
+    """과정 폴더의 전체 파일 크기와 이미지 수"""
+    total_bytes = 0
+    for root, _, names in os.walk(course_dir):
+        for name in names:
+            try:
+                total_bytes += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    images_dir = Path(course_dir) / "images"
+    images = sum(1 for entry in os.scandir(images_dir) if entry.is_file()) if images_dir.is_dir() else 0
+    return total_bytes, images
+
+
+def _convert_batch_course(builder_json_path, output_dir, options):
+    """
+    batch 변환의 과정 하나 (worker 프로세스에서 실행)
+
+    worker는 여러 과정을 차례로 처리하므로 모듈 수준 캐시(HTML 정리 결과, 변환 통계 등)를
+    과정 간에 그대로 재사용함. 변환 중 출력은 과정별 log로 모음
+
+    Returns:
+        {"path", "course_code", "success", "seconds", "bytes", "images", "log"}
+    """
+    log = io.StringIO()
+    result = {"path": str(builder_json_path), "course_code": None, "success": False,
+              "seconds": 0.0, "bytes": 0, "images": 0}
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            course_data, lessons, imported_images = _load_builder_json(builder_json_path, options["stream"])
+            result["course_code"] = course_data.get("courseCode")
+            result["success"] = bool(_run_export(
+                course_data, lessons, imported_images, output_dir, options["image_workers"], options["image_store"],
+                options["incremental"], None, None, options["link_index_html"]))
+    except Exception:
+        log.write(traceback.format_exc())
+    result["seconds"] = time.perf_counter() - start
+    if result["course_code"]:
+        result["bytes"], result["images"] = _course_output_stats(Path(output_dir) / result["course_code"])
+    result["log"] = log.getvalue()
+    return result
+
+
+def convert_builder_batch(builder_json_paths, output_dir=None, workers=None, stream=False, image_workers=None,
+                          image_store=None, incremental=False, link_index_html=False, on_result=None):
+    """여러 Builder JSON을 한 번에 변환 (과정 단위로 프로세스 풀에 분배)
+
+    큰 파일부터 시작하여 마지막에 큰 과정 하나만 남아 다른 worker가 노는 시간을 줄임
+    각 worker는 모듈을 한 번만 import하고 캐시를 과정 간에 공유함
+
+    Args:
+        builder_json_paths: Builder JSON 파일 또는 디렉토리 목록 (find_builder_json_files)
+        output_dir: 출력 디렉토리 (None이면 현재 디렉토리/subjects)
+        workers: 과정 변환 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 처리)
+        on_result: 과정 하나가 끝날 때마다 결과 딕셔너리로 호출 (완료 순서)
+        나머지: convert_builder_to_subjects와 동일
+
+    Returns:
+        _convert_batch_course 결과 목록 (입력 순서)
+    """
+    paths = find_builder_json_files(builder_json_paths)
+    output_dir = Path(output_dir).expanduser() if output_dir is not None else Path.cwd() / "subjects"
+    options = {"stream": stream, "image_workers": image_workers, "image_store": image_store,
+               "incremental": incremental, "link_index_html": link_index_html}
+    scheduled = sorted(paths, key=lambda path: path.stat().st_size if path.is_file() else 0, reverse=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(scheduled)))
+
+    results = {}
+    if workers == 1:
+        for path in scheduled:
+            results[path] = _convert_batch_course(path, output_dir, options)
+            if on_result is not None:
+                on_result(results[path])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_convert_batch_course, path, output_dir, options): path for path in scheduled}
+            for future in as_completed(futures):
+                results[futures[future]] = result = future.result()
+                if on_result is not None:
+                    on_result(result)
+    return [results[path] for path in paths]
+
+
+def format_batch_results(results, wall_seconds=None):
+    """convert_builder_batch() 결과를 과정별 표 형식 문자열로"""
+    lines = [f"{'course':<16} {'file':<32} {'status':<6} {'seconds':>8} {'MB':>8} {'images':>7}"]
+    for result in results:
+        status = "ok" if result["success"] else "FAIL"
+        lines.append(f"{result['course_code'] or '-':<16} {Path(result['path']).name[:32]:<32} {status:<6} "
+                     f"{result['seconds']:>8.2f} {result['bytes'] / (1024 * 1024):>8.2f} {result['images']:>7}")
+    total_seconds = sum(result["seconds"] for result in results)
+    succeeded = sum(1 for result in results if result["success"])
+    summary = (f"{succeeded}/{len(results)} courses, {sum(r['bytes'] for r in results) / (1024 * 1024):.2f} MB, "
+               f"{sum(r['images'] for r in results)} images, course time {total_seconds:.2f}s")
+    if wall_seconds:
+        summary += f", wall {wall_seconds:.2f}s ({total_seconds / wall_seconds:.1f}x)"
+    lines.append(summary)
+    return "\n".join(lines)
+
+
+def _convert_course(course_data, lessons, imported_images, output_dir=None, incremental=False, lesson_workers=None,
+                    link_index_html=False):
+    """과정 단위 변환 (convert_builder_to_subjects 본체)
+
+    Args:
+        course_data: Builder JSON 최상위 딕셔너리 (lessons는 subjects.json 생성용)
+        lessons: 내보낼 차시 iterable (스트리밍 모드에서는 파일에서 하나씩 읽는 generator)
+        imported_images: 경로 -> base64 딕셔너리 또는 (경로, base64) iterator
+        output_dir: 출력 디렉토리
+        incremental: True면 manifest 기반 증분 export
+        lesson_workers: 차시 내보내기 프로세스 수
+        link_index_html: True면 첫 차시 index.html을 나머지 차시에 하드링크
+    """
     course_code = course_data["courseCode"]
     course_name = course_data["courseName"]
     course_type = course_data.get("courseType", "general")  # 과정 유형
     year = course_data.get("year", "")
     professor = course_data["professor"]
-    # imported_images: import 시 가져온 원본 이미지들 (경로 -> base64)
-    imported_images = course_data.get("importedImages", {})
 
     if not course_code:
         print("❌ 과목 코드가 없습니다!")
@@ -1385,8 +3649,9 @@ def convert_builder_to_subjects(builder_json_path, output_dir=None):
         # ~ 경로 확장 (Windows/macOS/Linux 호환)
         output_dir = Path(output_dir).expanduser()
 
+    target = _get_output_target()
     course_dir = output_dir / course_code
-    course_dir.mkdir(parents=True, exist_ok=True)
+    target.makedirs(course_dir)
 
     print(f"📁 생성 위치: {course_dir}")
 
@@ -1397,60 +3662,57 @@ def convert_builder_to_subjects(builder_json_path, output_dir=None):
     # 2019-2021은 content를 배열로 저장
     is_legacy_template = preset_id.startswith("2018")
     
-    with open(course_dir / "subjects.json", 'w', encoding='utf-8') as f:
+    with target.open_text(course_dir / "subjects.json") as f:
         if is_legacy_template:
-            lines = ["{", '\t"subjects" : [{']
-            for i, subj in enumerate(subjects_json_data["subjects"]):
-                if i > 0:
-                    lines.append('\t},{')
-                lines.append(f'\t\t"title" : "{subj["title"]}"')
-                if "lists" in subj:
-                    lines[-1] += ','
-                    lines.append('\t\t"lists" : [')
-                    for j, item in enumerate(subj["lists"]):
-                        comma = "," if j < len(subj["lists"]) - 1 else ""
-                        lines.append(f'\t\t\t"{item}"{comma}')
-                    lines.append('\t\t]')
-            lines.append('\t}]')
-            lines.append('}')
-            f.write("\n".join(lines) + "\n")
+            f.write(legacy_subjects_json_dumps(subjects_json_data))
         else:
             json.dump(subjects_json_data, f, ensure_ascii=False, indent=2)
     print(f"✅ subjects.json 생성 완료")
 
     # subtitles 폴더 생성
     subtitles_dir = course_dir / "subtitles"
-    subtitles_dir.mkdir(exist_ok=True)
+    target.makedirs(subtitles_dir)
 
     # import된 자막 파일들 복사
     imported_subtitles = course_data.get("importedSubtitles", {})
     if imported_subtitles:
         for filename, content in imported_subtitles.items():
             subtitle_path = subtitles_dir / filename
-            with open(subtitle_path, 'w', encoding='utf-8') as f:
+            with target.open_text(subtitle_path) as f:
                 f.write(content)
         print(f"✅ 자막 파일 {len(imported_subtitles)}개 복사 완료")
 
     # images 폴더 생성
     images_dir = course_dir / "images"
-    images_dir.mkdir(exist_ok=True)
+    target.makedirs(images_dir)
+
+    # 이미지 중복 제거 인덱스 (Import/본문/교수 이미지가 공유, 디코딩된 이미지 해시 기반)
+    image_cache = ImageIndex()
+
+    # 증분 export: 이전 export의 이미지를 그대로 재사용
+    manifest = None
+    if incremental:
+        manifest = ExportManifest.load(course_dir)
+        seeded = manifest.seed_image_cache(image_cache, images_dir)
+        if seeded:
+            print(f"📝 이전 export 이미지 {seeded}개 재사용")
 
     # import된 원본 이미지들 복사 (data-original-src에 있는 경로의 이미지들)
-    imported_image_path_mapping = {}
+    imported_image_path_mapping = ImportedPathMapping()
     if imported_images:
-        saved_count, imported_image_path_mapping = save_imported_images(imported_images, images_dir)
+        saved_count, imported_image_path_mapping = save_imported_images(imported_images, images_dir, image_cache)
         print(f"✅ 원본 이미지 {saved_count}개 복사 완료")
-        # 경로 변경 사항 출력
-        for original_path, actual_path in imported_image_path_mapping.items():
-            if original_path != actual_path:
-                original_ext = os.path.splitext(original_path)[1]
-                actual_ext = os.path.splitext(actual_path)[1]
-                if original_ext != actual_ext:
-                    print(f"  ⚠️ 확장자 변경: {os.path.basename(original_path)} -> {os.path.basename(actual_path)}")
+        # 경로 변경 사항 출력 (파일별 변경 내용은 저장할 때 출력됨)
+        changed_count = sum(
+            1 for original_path, actual_path in imported_image_path_mapping.items()
+            if os.path.splitext(original_path)[1] != os.path.splitext(actual_path)[1]
+        )
+        if changed_count:
+            print(f"  ⚠️ 확장자 변경: {changed_count}개 (본문의 src 경로를 실제 파일로 교체)")
 
     # 이미지 카운터 및 캐시 (전체 과정에서 공유)
     # HTML 내용의 base64 이미지를 추출하여 파일로 저장하고 상대경로로 교체
-    # image_cache는 해시 기반으로 중복 이미지를 재사용
+    # image_cache는 디코딩된 이미지 해시 기반으로 중복 이미지를 재사용
 
     # import된 이미지 경로에서 최대 번호 찾기 (재export 시 번호 충돌 방지)
     max_img_number = 0
@@ -1464,35 +3726,15 @@ def convert_builder_to_subjects(builder_json_path, output_dir=None):
     if max_img_number > 0:
         print(f"📝 import된 이미지 최대 번호: {max_img_number}, 새 이미지는 {max_img_number + 1}부터 시작")
 
+    if manifest is not None and manifest.image_count > max_img_number:
+        # 바뀌지 않은 차시가 참조하는 이미지와 번호가 겹치지 않도록 이전 번호 다음부터 시작
+        max_img_number = manifest.image_count
+        print(f"📝 이전 export 이미지 최대 번호: {max_img_number}, 새 이미지는 {max_img_number + 1}부터 시작")
+
     image_counter = {'count': max_img_number}
-    image_cache = {}  # {hash: relative_path}
 
     # 교수 사진 미리 처리 (한 번만 처리하여 모든 차시에서 재사용)
-    professor_photo = professor.get("photo", "")
-    processed_professor_photo = professor_photo
-    if professor_photo:
-        # HTML 태그가 포함된 경우 (<img src="data:image/...">)
-        if "<img" in professor_photo and "data:image/" in professor_photo:
-            # HTML 태그에서 src 속성의 base64 데이터 추출
-            src_match = re.search(r'src=["\']([^"\']+)["\']', professor_photo)
-            if src_match:
-                base64_data = src_match.group(1)
-                # 교수 이미지 전용 함수 사용 (professor.png 고정)
-                processed_professor_photo = save_professor_image(
-                    base64_data, images_dir, "professor.png", image_cache
-                )
-        # 단순 base64 문자열인 경우 (data:image/...;base64,...)
-        elif professor_photo.startswith("data:image/"):
-            # 교수 이미지 전용 함수 사용 (professor.png 고정)
-            processed_professor_photo = save_professor_image(
-                professor_photo, images_dir, "professor.png", image_cache
-            )
-        # 이미 상대경로인 경우 그대로 사용
-        elif professor_photo.startswith("../images/"):
-            processed_professor_photo = professor_photo
-        # 절대경로나 URL인 경우 그대로 사용
-        else:
-            processed_professor_photo = professor_photo
+    processed_professor_photo = process_professor_photo(professor.get("photo", ""), images_dir, image_cache)
 
     # 전체 주차 제목 리스트 생성 (next 페이지용)
     week_titles_list = []
@@ -1502,195 +3744,99 @@ def convert_builder_to_subjects(builder_json_path, output_dir=None):
         if title:
             # <span>N주</span> 제목 → 제목만 추출
             # span 태그 제거
-            title = re.sub(r'<span[^>]*>.*?</span>\s*', '', title)
+            title = strip_week_span(title)
             # N주 텍스트 제거
-            title = re.sub(r'^\d+주\s*', '', title)
+            title = _WEEK_PREFIX.sub('', title)
             week_titles_list.append(title)
 
     # 각 차시별 data.json 생성
-    lessons_list = course_data["lessons"]
-
-    for idx, lesson in enumerate(lessons_list):
-        lesson_num = f"{lesson['lessonNumber']:02d}"
-        lesson_dir = course_dir / lesson_num / "assets" / "data"
-        lesson_dir.mkdir(parents=True, exist_ok=True)
-
-        # 현장실습 주차인 경우 이미지만 생성
-        if lesson.get("isPracticeWeek", False):
-            practice_image = lesson.get("practiceImage", "")
-            data_json = {
-                "image": practice_image
-            }
-            with open(lesson_dir / "data.json", 'w', encoding='utf-8') as f:
-                json.dump(data_json, f, ensure_ascii=False, indent=2)
-
-            # index.html 생성
-            preset_id = course_data.get("templatePreset", "2025-standard")
-            theme = course_data.get("templateTheme", "type-1")
-            index_html = get_index_html_template(preset_id, theme)
-            lesson_folder = course_dir / lesson_num
-            index_file = lesson_folder / "index.html"
-            with open(index_file, 'w', encoding='utf-8') as f:
-                f.write(index_html)
-
-            print(f"  📄 {lesson_num}강 (현장실습 주차) 생성 완료")
-            continue  # 다음 차시로 넘어감
-
-        # 페이지 생성
-        pages = []
-
-        # 템플릿 프리셋에 따른 페이지 컴포넌트 동적 순서 생성
-        preset_id = course_data.get("templatePreset", "2025-standard")
-        theme = course_data.get("templateTheme", "type-1")
-        preset = export_templates.TEMPLATE_PRESETS.get(preset_id, export_templates.TEMPLATE_PRESETS["2025-standard"])
-        components = preset.get("components", ["intro", "orientation", "term", "objectives", "opinion", "lecture", "practice", "check", "exercise", "theorem", "next"])
-
-        # 2018 템플릿 여부 확인
-        is_2018 = preset_id == "2018-standard"
-
-        for comp in components:
-            if comp == "intro":
-                lesson_title = lesson.get("lessonTitle", "")
-                pages.append(create_intro_page(professor, processed_professor_photo, lesson_title, is_2018))
-            
-            elif comp == "orientation":
-                if lesson.get("hasOrientation"):
-                    pages.append(create_orientation_page(lesson["orientation"], course_code, year))
-            
-            elif comp == "term":
-                if course_type == "general":
-                    pages.append(create_term_page(
-                        lesson["terms"],
-                        images_dir,
-                        course_code,
-                        image_counter,
-                        imported_image_path_mapping,
-                        image_cache,
-                        is_legacy_template,
-                        lesson.get("termDescription"),
-                        lesson.get("termScript")
-                    ))
-
-            elif comp == "objectives":
-                learning_contents_for_objectives = list(lesson.get("learningContents", []))
-                if lesson.get("hasPractice", False):
-                    practice_content = lesson.get("practiceContent", "")
-                    if not practice_content:
-                        for content in learning_contents_for_objectives:
-                            if isinstance(content, str) and "class='practice'" in content:
-                                practice_content = content
-                                break
-                    if practice_content and not is_practice_content_empty(practice_content):
-                        learning_contents_for_objectives.append(practice_content)
-
-                pages.append(create_objectives_page(
-                    learning_contents_for_objectives,
-                    lesson["learningObjectives"],
-                    images_dir,
-                    course_code,
-                    image_counter,
-                    imported_image_path_mapping,
-                    image_cache,
-                    lesson.get("objectivesDescription"),
-                    lesson.get("objectivesScript"),
-                    lesson.get("_meta")
-                ))
-            
-            elif comp == "opinion":
-                pages.append(create_opinion_page(lesson["opinionQuestion"]))
-            
-            elif comp == "lecture":
-                pages.append(create_lecture_page(lesson, course_code, year))
-            
-            elif comp == "practice":
-                if lesson.get("hasPractice", False):
-                    practice_content = lesson.get("practiceContent", "")
-                    if not practice_content:
-                        learning_contents = lesson.get("learningContents", [])
-                        for content in learning_contents:
-                            if isinstance(content, str) and "class='practice'" in content:
-                                practice_content = content
-                                break
-                    if practice_content and not is_practice_content_empty(practice_content):
-                        pages.append(create_practice_page(lesson, course_code, year))
-            
-            elif comp == "check":
-                pages.append(create_check_page(
-                    lesson,
-                    images_dir,
-                    course_code,
-                    image_counter,
-                    imported_image_path_mapping,
-                    image_cache,
-                    lesson.get("checkDescription"),
-                    lesson.get("checkScript")
-                ))
-            
-            elif comp in ["exercise", "exercise_pre", "exercise_post"]:
-                # 현재는 pre/post 상관없이 동일한 연습문제 페이지 생성 
-                if course_type == "general":
-                    pages.append(create_exercise_page(lesson, images_dir, course_code, image_counter, imported_image_path_mapping, image_cache))
-            
-            elif comp == "theorem":
-                pages.append(create_theorem_page(lesson, images_dir, course_code, image_counter, imported_image_path_mapping, image_cache))
-            
-            elif comp == "next":
-                pages.append(create_next_page(week_titles_list, lesson.get("nextWeekTitles")))
-
-        # index.html 생성 (차시 폴더 바로 아래에 생성: 01/index.html)
-        index_html = get_index_html_template(preset_id, theme)
-        lesson_folder = course_dir / lesson_num  # 01, 02, ...
-        index_file = lesson_folder / "index.html"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_html)
-
-        # 다운로드 URL 자동 생성 (비어있는 경우)
-        instruction_url = lesson.get("instructionUrl", "")
-        if not instruction_url and course_code and year:
-            lesson_num_str = f"{lesson['lessonNumber']:02d}"
-            instruction_url = f"https://cdn-it.livestudy.com/mov/{year}/{course_code}/down/{course_code}_mp3_{lesson_num_str}.zip"
-        
-        guide_url = lesson.get("guideUrl", "")
-        if not guide_url and course_code and year:
-            lesson_num_str = f"{lesson['lessonNumber']:02d}"
-            guide_url = f"https://cdn-it.livestudy.com/mov/{year}/{course_code}/down/{course_code}_book_{lesson_num_str}.zip"
-        
-        # section 값 가져오기 (App.jsx에서 export 전 재계산됨)
-        section_in_week = lesson.get("sectionInWeek")
-        if section_in_week is None:
-            # 혹시 없으면 자동 계산
-            section_in_week = ((lesson["lessonNumber"] - 1) % 2) + 1
-            print(f"⚠️ {lesson_num}차시 sectionInWeek 없음, 자동 계산: {section_in_week}")
-
-        print(f"📝 {lesson_num}차시: {lesson['weekNumber']}주 {section_in_week}차")
+    # 차시 단위 내보내기에 필요한 과정 공통 상태
+    theme = course_data.get("templateTheme", "type-1")
+    course_ctx = {
+        "course_dir": course_dir,
+        "course_code": course_code,
+        "course_name": course_name,
+        "course_type": course_type,
+        "year": year,
+        "professor": professor,
+        "processed_professor_photo": processed_professor_photo,
+        "preset_id": preset_id,
+        "theme": theme,
+        "is_legacy_template": is_legacy_template,
+        "images_dir": images_dir,
+        "image_counter": image_counter,
+        "image_cache": image_cache,
+        "imported_image_path_mapping": imported_image_path_mapping,
+        "week_titles_list": week_titles_list,
+        # 하드링크 원본 index.html (link_index_html일 때만)
+        "index_html_source": None,
+        **_course_render_context(preset_id, theme),
+    }
+    # 컴포넌트별 페이지 생성 함수 (과정 공통 인자를 미리 적용)
+    course_ctx["page_plan"] = compile_page_plan(course_ctx)
+
+    if manifest is not None:
+        # 차시 출력에 영향을 주는 과정 공통 입력과 템플릿
+        manifest.set_course(
+            _fingerprint({
+                "courseCode": course_code,
+                "courseName": course_name,
+                "courseType": course_type,
+                "year": year,
+                "professor": professor,
+                "processedProfessorPhoto": processed_professor_photo,
+                "weekTitles": week_titles_list,
+                "importedImages": imported_image_path_mapping,
+            }),
+            _fingerprint({
+                "exporter": _exporter_fingerprint(),
+                "preset": preset_id,
+                "theme": theme,
+                "definition": export_templates.TEMPLATE_PRESETS.get(preset_id),
+                "indexHtml": course_ctx["index_html"],
+            }),
+        )
+
+    if link_index_html and isinstance(_get_output_target(), DirectoryTarget):
+        # 첫 차시의 index.html만 쓰고 나머지 차시는 하드링크 (worker 프로세스도 같은 원본 사용)
+        lessons = iter(lessons)
+        first_lesson = next(lessons, None)
+        if first_lesson is not None:
+            lessons = itertools.chain([first_lesson], lessons)
+            course_ctx["index_html_source"] = _write_index_html_source(
+                course_dir / f"{first_lesson['lessonNumber']:02d}", course_ctx["index_html"])
+
+    # 스트리밍 모드에서는 lessons가 generator이므로 차시를 하나씩 내보내고 바로 버림
+    skipped_count = 0
+    with _LessonExporter(course_ctx, lesson_workers) as exporter:
+        for lesson in lessons:
+            if manifest is None:
+                exporter.export(lesson)
+                continue
+            lesson_num = f"{lesson['lessonNumber']:02d}"
+            lesson_fingerprint = _fingerprint(lesson)
+            if manifest.is_unchanged(lesson_num, lesson_fingerprint, course_dir, images_dir):
+                manifest.keep_lesson(lesson_num)
+                skipped_count += 1
+                continue
+            exporter.export(lesson, functools.partial(manifest.record_lesson, lesson_num, lesson_fingerprint, course_dir))
 
-        # data.json 생성
-        data_json = {
-            "subject": course_name,
-            "index": lesson["weekNumber"],
-            "section": section_in_week,
-            "instruction": instruction_url,
-            "guide": guide_url,
-            "sections": ["인트로", "준비하기", "학습하기", "정리하기"],
-            "pages": pages
-        }
+    # 백그라운드 이미지 쓰기 완료 대기
+    _get_image_writer().flush()
 
-        data_json_path = lesson_dir / "data.json"
-        with open(data_json_path, 'w', encoding='utf-8') as f:
-            if is_legacy_template:
-                # 레거시 템플릿: 커스텀 직렬화 사용 (sections 배열 한 줄 유지)
-                # 2018만 ' : ' 구분자, 2019+ ': ' 구분자
-                use_space_sep = (preset_id == "2018-standard")
-                f.write(legacy_json_dumps(data_json, use_space_separator=use_space_sep))
-                f.write('\n')
-            else:
-                json.dump(data_json, f, ensure_ascii=False, indent=2)
+    if manifest is not None:
+        manifest.save(image_cache, image_counter, images_dir)
+        if skipped_count:
+            print(f"⏭️ 변경 없는 차시 {skipped_count}개 건너뜀")
 
-        print(f"✅ {lesson_num}차시 index.html, data.json 생성 완료")
-    
     # 이미지 저장 결과 출력
     if image_counter['count'] > 0:
         print(f"📷 총 {image_counter['count']}개 이미지 저장 완료: {images_dir}")
+    if image_cache.reused:
+        print(f"♻️ 중복 이미지 {image_cache.reused}회 재사용 ({image_cache.bytes_saved / 1024:.1f}KB 절약)")
+    if imported_image_path_mapping.rewritten_paths:
+        print(f"🔄 Import 이미지 경로 교체: {imported_image_path_mapping.rewritten_paths}개 "
+              f"({imported_image_path_mapping.rewritten_fragments}개 조각)")
 
     print(f"\n🎉 총 {len(course_data['lessons'])}개 차시 변환 완료!")
     print(f"📂 생성된 폴더: {course_dir}")
@@ -1698,19 +3844,647 @@ def convert_builder_to_subjects(builder_json_path, output_dir=None):
     return True
 
 
+class _LessonExporter:
+    """
+    차시 내보내기 (lesson_workers가 2 이상이면 프로세스 풀 사용)
+
+    이미지 번호와 중복 제거는 과정 전체에서 공유되므로 두 단계로 나눔
+        1단계: 메인 프로세스에서 차시를 기존 순서(TEMPLATE_PRESETS의 컴포넌트 순서)대로 훑으면서
+            이미지 번호 부여/저장 결과만 기록 (_LessonImagePlan)
+        2단계: worker 프로세스에서 기록된 이미지 결과로 나머지 정리, 직렬화, 파일 쓰기
+    차시마다 1단계가 끝나는 대로 풀에 넘기므로 두 단계가 겹쳐서 실행되며,
+    출력은 worker 수와 관계없이 순차 처리와 동일함
+    """
+
+    def __init__(self, course_ctx, lesson_workers=None):
+        self.course_ctx = course_ctx
+        self.lesson_workers = max(1, lesson_workers or 1)
+        self._executor = None
+        self._pending = []
+        if self.lesson_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.lesson_workers)
+            # worker에서는 이미지 캐시를 사용하지 않음 (이미지 결과는 1단계에서 전달)
+            # 페이지 생성 계획은 메인 프로세스의 캐시에 묶여 있으므로 worker에서 다시 만듦
+            self._worker_ctx = dict(course_ctx, image_cache={}, page_plan=None)
+            # 파일시스템이 아닌 출력 대상(ZIP 등)은 worker가 만든 파일을 메인 프로세스에서 기록
+            self._target = _get_output_target()
+            self._collect = not isinstance(self._target, DirectoryTarget)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._drain(0)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+        return False
+
+    def export(self, lesson, on_done=None):
+        """차시 하나 내보내기 (on_done은 파일 쓰기가 끝난 뒤 차시 순서대로 호출)"""
+        if self._executor is None:
+            _export_lesson(lesson, self.course_ctx)
+            if on_done is not None:
+                on_done()
+            return
+
+        plan = _LessonImagePlan()
+        token = _current_image_plan.set(plan)
+        try:
+            _export_lesson(lesson, self.course_ctx)
+        finally:
+            _current_image_plan.reset(token)
+
+        future = self._executor.submit(_export_lesson_worker, lesson, self._worker_ctx, plan.results, self._collect)
+        self._pending.append((future, on_done))
+        # 스트리밍 모드에서 차시가 메모리에 쌓이지 않도록 대기 중인 차시 수 제한
+        self._drain(self.lesson_workers * 2)
+
+    def _drain(self, limit):
+        while len(self._pending) > limit:
+            future, on_done = self._pending.pop(0)
+            log, files, clean_stats = future.result()
+            _merge_html_transform_stats(clean_stats["transforms"])
+            HTML_FRAGMENT_CACHE.add_counters(clean_stats["cache"])
+            for path, data in files:
+                self._target.write_bytes(path, data)
+            # worker 출력은 차시 순서대로 표시
+            print(log, end='')
+            if on_done is not None:
+                on_done()
+
+
+def _export_lesson_worker(lesson, course_ctx, image_results, collect=False):
+    """프로세스 풀에서 차시 하나 내보내기
+
+    Returns:
+        (출력 로그, collect가 True면 만든 파일 [(경로, 내용)] 아니면 빈 목록,
+         이 차시의 HTML 변환/정리 캐시 횟수 {"transforms", "cache"} - 메인 프로세스에서 합침)
+    """
+    # fork로 물려받았거나 이전 차시에서 센 횟수는 이미 메인 프로세스에 있으므로 비움
+    reset_html_transform_stats()
+    HTML_FRAGMENT_CACHE.take_counters()
+    log = io.StringIO()
+    memory_target = _MemoryTarget() if collect else None
+    plan_token = _current_image_plan.set(_LessonImagePlan(image_results))
+    target_token = _current_output_target.set(memory_target)
+    try:
+        with contextlib.redirect_stdout(log):
+            _export_lesson(lesson, course_ctx)
+    finally:
+        _current_output_target.reset(target_token)
+        _current_image_plan.reset(plan_token)
+    clean_stats = {"transforms": html_transform_stats(), "cache": HTML_FRAGMENT_CACHE.take_counters()}
+    return log.getvalue(), memory_target.files if collect else [], clean_stats
+
+
+def _export_lesson(lesson, course_ctx):
+    """차시 하나의 index.html, data.json 생성
+
+    Args:
+        lesson: 차시 데이터
+        course_ctx: 과정 공통 상태 (_convert_course에서 생성)
+    """
+    # 차시의 HTML 조각은 페이지 순서대로 하나씩 정리하지 않고 한 번에 정리
+    # (정리는 이미지 번호와 무관하고, 이미지 추출/번호 부여는 기존 순서대로 진행)
+    # 1단계(이미지 번호 부여)는 파일을 쓰지 않고 이미지 없는 조각도 건너뛰므로 한 번에 정리하지 않음
+    # (정리는 차시를 실제로 내보내는 worker에서 수행)
+    if lesson.get("isPracticeWeek", False) or _is_recording_images():
+        _write_lesson(lesson, course_ctx)
+        return
+    with _lesson_fragments(lesson):
+        _write_lesson(lesson, course_ctx)
+
+
+def _write_index_html_source(lesson_folder, index_html):
+    """하드링크 원본으로 쓸 index.html 작성 (이전 export의 하드링크는 끊고 새로 씀)
+
+    Returns:
+        작성한 파일 경로
+    """
+    target = _get_output_target()
+    target.makedirs(lesson_folder)
+    index_file = lesson_folder / "index.html"
+    try:
+        os.unlink(index_file)
+    except FileNotFoundError:
+        pass
+    with target.open_text(index_file) as f:
+        f.write(index_html)
+    return index_file
+
+
+def _write_index_html(lesson_folder, course_ctx):
+    """차시 index.html 쓰기 (index_html_source가 있으면 하드링크)"""
+    index_file = lesson_folder / "index.html"
+    source = course_ctx["index_html_source"]
+    if source is None:
+        with _get_output_target().open_text(index_file) as f:
+            f.write(course_ctx["index_html"])
+    elif index_file != source:
+        _get_output_target().link_file(source, index_file)
+
+
+class PageComponent:
+    """
+    페이지 컴포넌트: 프리셋 components의 이름 하나에 해당하는 페이지 생성 단계
+
+    bind(course_ctx)는 과정 공통 인자(이미지 폴더, 카운터, 캐시 등)를 미리 적용한
+    함수(lesson -> 페이지 dict 또는 None)를 반환함
+    과정에 해당하지 않는 컴포넌트(예: general이 아닌 과정의 용어 페이지)는 None을 반환하여 계획에서 제외
+    """
+
+    __slots__ = ("name", "bind", "calls", "seconds")
+
+    def __init__(self, name, bind):
+        self.name = name
+        self.bind = bind
+        self.calls = 0
+        self.seconds = 0.0
+
+    def compile(self, course_ctx, timed=False):
+        """과정에 맞춘 페이지 생성 함수 (timed면 실행 횟수/시간 기록), 해당 없으면 None"""
+        build = self.bind(course_ctx)
+        if build is None or not timed:
+            return build
+
+        def step(lesson):
+            start = time.perf_counter()
+            try:
+                return build(lesson)
+            finally:
+                self.calls += 1
+                self.seconds += time.perf_counter() - start
+
+        return step
+
+
+# 컴포넌트 이름 -> PageComponent (새 템플릿 계열은 _page_component로 등록)
+PAGE_COMPONENTS = {}
+
+# True면 compile_page_plan이 컴포넌트별 실행 횟수/시간을 기록하는 함수로 계획을 만듦 (--component-stats)
+PAGE_COMPONENT_TIMING = False
+
+
+def _page_component(*names):
+    """bind(course_ctx) 함수를 컴포넌트 이름으로 등록"""
+    def register(bind):
+        for name in names:
+            PAGE_COMPONENTS[name] = PageComponent(name, bind)
+        return bind
+    return register
+
+
+def page_component_stats():
+    """컴포넌트별 {'calls': 실행 횟수, 'seconds': 누적 시간} (등록 순서, PAGE_COMPONENT_TIMING일 때만 기록)"""
+    return {name: {"calls": component.calls, "seconds": component.seconds}
+            for name, component in PAGE_COMPONENTS.items()}
+
+
+def reset_page_component_stats():
+    for component in PAGE_COMPONENTS.values():
+        component.calls = 0
+        component.seconds = 0.0
+
+
+def format_page_component_stats(stats=None):
+    """page_component_stats()를 표 형식 문자열로"""
+    stats = page_component_stats() if stats is None else stats
+    lines = [f"{'component':<16} {'calls':>8} {'ms':>10} {'ms/call':>8}"]
+    for name, counts in stats.items():
+        per_call = counts["seconds"] * 1000 / counts["calls"] if counts["calls"] else 0.0
+        lines.append(f"{name:<16} {counts['calls']:>8} {counts['seconds'] * 1000:>10.1f} {per_call:>8.2f}")
+    return "\n".join(lines)
+
+
+def _image_args(course_ctx):
+    """이미지를 추출하는 페이지 함수의 공통 인자"""
+    return (course_ctx["images_dir"], course_ctx["course_code"], course_ctx["image_counter"],
+            course_ctx["imported_image_path_mapping"], course_ctx["image_cache"])
+
+
+def _lesson_practice_content(lesson):
+    """실습이 있는 차시의 실습 내용 (없거나 비어 있으면 빈 문자열)"""
+    if not lesson.get("hasPractice", False):
+        return ""
+    practice_content = lesson.get("practiceContent", "")
+    if not practice_content:
+        for content in lesson.get("learningContents", []):
+            if isinstance(content, str) and "class='practice'" in content:
+                practice_content = content
+                break
+    if practice_content and not is_practice_content_empty(practice_content):
+        return practice_content
+    return ""
+
+
+@_page_component("intro")
+def _bind_intro_page(course_ctx):
+    professor = course_ctx["professor"]
+    processed_photo = course_ctx["processed_professor_photo"]
+    is_2018 = course_ctx["is_2018"]
+    return lambda lesson: create_intro_page(professor, processed_photo, lesson.get("lessonTitle", ""), is_2018)
+
+
+@_page_component("orientation")
+def _bind_orientation_page(course_ctx):
+    course_code = course_ctx["course_code"]
+    year = course_ctx["year"]
+
+    def build(lesson):
+        if lesson.get("hasOrientation"):
+            return create_orientation_page(lesson["orientation"], course_code, year)
+        return None
+
+    return build
+
+
+@_page_component("term")
+def _bind_term_page(course_ctx):
+    if course_ctx["course_type"] != "general":
+        return None
+    image_args = _image_args(course_ctx)
+    is_legacy = course_ctx["is_legacy_template"]
+    return lambda lesson: create_term_page(
+        lesson["terms"], *image_args, is_legacy, lesson.get("termDescription"), lesson.get("termScript"))
+
+
+@_page_component("objectives")
+def _bind_objectives_page(course_ctx):
+    image_args = _image_args(course_ctx)
+
+    def build(lesson):
+        learning_contents = list(lesson.get("learningContents", []))
+        practice_content = _lesson_practice_content(lesson)
+        if practice_content:
+            learning_contents.append(practice_content)
+        return create_objectives_page(
+            learning_contents, lesson["learningObjectives"], *image_args,
+            lesson.get("objectivesDescription"), lesson.get("objectivesScript"), lesson.get("_meta"))
+
+    return build
+
+
+@_page_component("opinion")
+def _bind_opinion_page(course_ctx):
+    return lambda lesson: create_opinion_page(lesson["opinionQuestion"])
+
+
+@_page_component("lecture")
+def _bind_lecture_page(course_ctx):
+    course_code = course_ctx["course_code"]
+    year = course_ctx["year"]
+    return lambda lesson: create_lecture_page(lesson, course_code, year)
+
+
+@_page_component("practice")
+def _bind_practice_page(course_ctx):
+    course_code = course_ctx["course_code"]
+    year = course_ctx["year"]
+
+    def build(lesson):
+        if _lesson_practice_content(lesson):
+            return create_practice_page(lesson, course_code, year)
+        return None
+
+    return build
+
+
+@_page_component("check")
+def _bind_check_page(course_ctx):
+    image_args = _image_args(course_ctx)
+    return lambda lesson: create_check_page(
+        lesson, *image_args, lesson.get("checkDescription"), lesson.get("checkScript"))
+
+
+# 현재는 pre/post 상관없이 동일한 연습문제 페이지 생성
+@_page_component("exercise", "exercise_pre", "exercise_post")
+def _bind_exercise_page(course_ctx):
+    if course_ctx["course_type"] != "general":
+        return None
+    images_dir, course_code, image_counter, imported_path_mapping, image_cache = _image_args(course_ctx)
+    return lambda lesson: create_exercise_page(lesson, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
+
+
+@_page_component("theorem")
+def _bind_theorem_page(course_ctx):
+    images_dir, course_code, image_counter, imported_path_mapping, image_cache = _image_args(course_ctx)
+    return lambda lesson: create_theorem_page(lesson, images_dir, course_code, image_counter, imported_path_mapping, image_cache)
+
+
+@_page_component("next")
+def _bind_next_page(course_ctx):
+    week_titles_list = course_ctx["week_titles_list"]
+    return lambda lesson: create_next_page(week_titles_list, lesson.get("nextWeekTitles"))
+
+
+def compile_page_plan(course_ctx):
+    """
+    프리셋 components 순서대로 과정에 맞춘 페이지 생성 함수 목록 (export당 한 번)
+
+    Returns:
+        [(컴포넌트 이름, lesson -> 페이지 또는 None)] (등록되지 않았거나 과정에 해당하지 않는 컴포넌트는 제외)
+    """
+    plan = []
+    for name in course_ctx["components"]:
+        component = PAGE_COMPONENTS.get(name)
+        step = component.compile(course_ctx, PAGE_COMPONENT_TIMING) if component is not None else None
+        if step is not None:
+            plan.append((name, step))
+    return plan
+
+
+def _page_plan(course_ctx):
+    """course_ctx의 페이지 생성 계획 (없으면 만들어서 저장, worker 프로세스에서는 차시마다 새로 만듦)"""
+    plan = course_ctx.get("page_plan")
+    if plan is None:
+        plan = course_ctx["page_plan"] = compile_page_plan(course_ctx)
+    return plan
+
+
+def _iter_lesson_pages(lesson, course_ctx):
+    """템플릿 프리셋의 컴포넌트 순서대로 차시 페이지를 하나씩 생성"""
+    for _, build in _page_plan(course_ctx):
+        page = build(lesson)
+        if page is not None:
+            yield page
+
+
+# data.json sections (표준/HRD 4단 구성)
+DATA_JSON_SECTIONS = ("인트로", "준비하기", "학습하기", "정리하기")
+
+
+def lesson_data_header(lesson, course_name, course_code, year, sections=DATA_JSON_SECTIONS):
+    """
+    data.json의 pages 앞부분 (subject, index, section, instruction, guide, sections)
+
+    instruction/guide가 비어 있으면 과목 코드와 연도로 다운로드 URL을 만들고,
+    sectionInWeek가 없으면 차시 번호로 계산함
+    """
+    lesson_num = f"{lesson['lessonNumber']:02d}"
+
+    # 다운로드 URL 자동 생성 (비어있는 경우)
+    instruction_url = lesson.get("instructionUrl", "")
+    if not instruction_url and course_code and year:
+        instruction_url = f"https://cdn-it.livestudy.com/mov/{year}/{course_code}/down/{course_code}_mp3_{lesson_num}.zip"
+
+    guide_url = lesson.get("guideUrl", "")
+    if not guide_url and course_code and year:
+        guide_url = f"https://cdn-it.livestudy.com/mov/{year}/{course_code}/down/{course_code}_book_{lesson_num}.zip"
+
+    # section 값 가져오기 (App.jsx에서 export 전 재계산됨)
+    section_in_week = lesson.get("sectionInWeek")
+    if section_in_week is None:
+        # 혹시 없으면 자동 계산
+        section_in_week = ((lesson["lessonNumber"] - 1) % 2) + 1
+        print(f"⚠️ {lesson_num}차시 sectionInWeek 없음, 자동 계산: {section_in_week}")
+
+    return {
+        "subject": course_name,
+        "index": lesson["weekNumber"],
+        "section": section_in_week,
+        "instruction": instruction_url,
+        "guide": guide_url,
+        "sections": list(sections),
+    }
+
+
+def _write_lesson(lesson, course_ctx):
+    """_export_lesson의 페이지 생성과 파일 쓰기"""
+    course_dir = course_ctx["course_dir"]
+    course_code = course_ctx["course_code"]
+    course_name = course_ctx["course_name"]
+    year = course_ctx["year"]
+    is_legacy_template = course_ctx["is_legacy_template"]
+
+    lesson_num = f"{lesson['lessonNumber']:02d}"
+    lesson_dir = course_dir / lesson_num / "assets" / "data"
+    target = _get_output_target()
+    target.makedirs(lesson_dir)
+
+    # 현장실습 주차인 경우 이미지만 생성
+    if lesson.get("isPracticeWeek", False):
+        if _is_recording_images():
+            return
+        practice_image = lesson.get("practiceImage", "")
+        data_json = {
+            "image": practice_image
+        }
+        with target.open_text(lesson_dir / "data.json") as f:
+            json.dump(data_json, f, ensure_ascii=False, indent=2)
+
+        # index.html 생성
+        _write_index_html(course_dir / lesson_num, course_ctx)
+
+        print(f"  📄 {lesson_num}강 (현장실습 주차) 생성 완료")
+        return  # 다음 차시로 넘어감
+
+    pages = _iter_lesson_pages(lesson, course_ctx)
+
+    # 1단계(이미지 번호 부여)에서는 페이지만 생성하고 파일을 쓰지 않음
+    if _is_recording_images():
+        for _ in pages:
+            pass
+        return
+
+    # index.html 생성 (차시 폴더 바로 아래에 생성: 01/index.html)
+    _write_index_html(course_dir / lesson_num, course_ctx)
+
+    # data.json 생성 (페이지는 생성되는 대로 직렬화해서 씀)
+    header = lesson_data_header(lesson, course_name, course_code, year)
+    print(f"📝 {lesson_num}차시: {lesson['weekNumber']}주 {header['section']}차")
+
+    data_json_path = lesson_dir / "data.json"
+    with target.open_text_stream(data_json_path) as f:
+        # 레거시 템플릿: 커스텀 직렬화 사용 (sections 배열 한 줄 유지)
+        # 2018만 ' : ' 구분자, 2019+ ': ' 구분자
+        writer = DataJsonWriter(f, header, legacy=is_legacy_template,
+                                use_space_separator=course_ctx["is_2018"])
+        for page in pages:
+            writer.emit(page)
+        writer.close()
+
+    print(f"✅ {lesson_num}차시 index.html, data.json 생성 완료")
+
+
+# --worker 요청의 options (JSON 키 -> convert 함수 인자)
+EXPORT_WORKER_OPTIONS = {
+    "stream": "stream",
+    "imageWorkers": "image_workers",
+    "imageStore": "image_store",
+    "incremental": "incremental",
+    "lessonWorkers": "lesson_workers",
+    "linkIndexHtml": "link_index_html",
+}
+
+
+class _ProgressWriter(io.TextIOBase):
+    """변환 중 print 출력을 줄 단위 progress 메시지로 보내는 stdout 대체 스트림"""
+
+    def __init__(self, send, request_id):
+        self._send = send
+        self._request_id = request_id
+        self._buffer = ""
+        self.lines = []
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._buffer += text
+        if "\n" in self._buffer:
+            *lines, self._buffer = self._buffer.split("\n")
+            for line in lines:
+                self._emit(line)
+        return len(text)
+
+    def flush(self):
+        if self._buffer:
+            self._emit(self._buffer)
+            self._buffer = ""
+
+    def _emit(self, line):
+        self.lines.append(line)
+        self._send({"id": self._request_id, "type": "progress", "message": line})
+
+
+def handle_export_request(request, send):
+    """
+    --worker 요청 하나 처리
+
+    Args:
+        request: {"id", "courseData" 또는 "builderJsonPath", "outputDir", "options"}
+        send: 메시지(dict)를 보내는 함수 (progress 메시지는 변환 중 print 한 줄마다)
+
+    Returns:
+        result 메시지 {"id", "type": "result", "success", "courseCode", "seconds", "log"[, "error"]}
+    """
+    request_id = request.get("id")
+    progress = _ProgressWriter(send, request_id)
+    result = {"id": request_id, "type": "result", "success": False, "courseCode": None}
+    start = time.perf_counter()
+    try:
+        options = request.get("options") or {}
+        unknown = sorted(set(options) - set(EXPORT_WORKER_OPTIONS))
+        if unknown:
+            raise ValueError(f"알 수 없는 options: {', '.join(unknown)}")
+        kwargs = {EXPORT_WORKER_OPTIONS[key]: value for key, value in options.items()}
+        output_dir = request.get("outputDir")
+
+        with contextlib.redirect_stdout(progress):
+            if request.get("courseData") is not None:
+                # courseData는 이미 로드된 데이터이므로 stream 옵션은 무시
+                course_data = request["courseData"]
+                lessons, imported_images = course_data["lessons"], course_data.get("importedImages", {})
+            elif request.get("builderJsonPath"):
+                course_data, lessons, imported_images = _load_builder_json(
+                    request["builderJsonPath"], kwargs.get("stream", False))
+            else:
+                raise ValueError("courseData 또는 builderJsonPath가 필요합니다")
+            result["courseCode"] = course_data.get("courseCode")
+            success = _run_export(course_data, lessons, imported_images, output_dir,
+                                  kwargs.get("image_workers"), kwargs.get("image_store"),
+                                  kwargs.get("incremental", False), kwargs.get("lesson_workers"), None,
+                                  kwargs.get("link_index_html", False))
+            progress.flush()
+        result["success"] = bool(success)
+    except Exception as e:
+        progress.flush()
+        result["error"] = f"{type(e).__name__}: {e}"
+        progress.lines.append(traceback.format_exc().rstrip())
+    result["seconds"] = time.perf_counter() - start
+    result["log"] = "\n".join(progress.lines)
+    return result
+
+
+def serve_export_worker(input_stream=None, output_stream=None):
+    """
+    export worker 모드 (vite 개발 서버 플러그인용, --worker)
+
+    input_stream에서 요청을 한 줄에 하나씩(JSON) 읽어 순서대로 처리하고,
+    output_stream에 progress/result 메시지를 한 줄에 하나씩(JSON) 씀
+    프로세스가 계속 살아 있으므로 import와 모듈 캐시(HTML 정리 결과 등)를 export 간에 재사용함
+
+    메시지:
+        시작: {"type": "ready", "pid"}
+        요청: {"id", "courseData" 또는 "builderJsonPath", "outputDir", "options": {"stream", "incremental", ...}}
+        응답: {"id", "type": "progress", "message"}* 다음에 {"id", "type": "result", ...} (handle_export_request)
+        형식이 잘못된 줄: {"id": null, "type": "result", "success": false, "error"}
+    입력이 끝나면(EOF) 종료
+    """
+    if input_stream is None:
+        input_stream = sys.stdin
+    if output_stream is None:
+        # 메시지 전용 복사본을 만들고 fd 1은 stderr로 돌려서, 다른 경로의 출력이 메시지에 섞이지 않도록 함
+        output_stream = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8", buffering=1)
+        sys.stdout.flush()
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    lock = threading.Lock()
+
+    def send(message):
+        line = json.dumps(message, ensure_ascii=False)
+        with lock:
+            output_stream.write(line + "\n")
+            output_stream.flush()
+
+    send({"type": "ready", "pid": os.getpid()})
+    for line in input_stream:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("요청은 JSON 객체여야 합니다")
+        except ValueError as e:
+            send({"id": None, "type": "result", "success": False, "error": f"잘못된 요청: {e}"})
+            continue
+        send(handle_export_request(request, send))
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 builder_to_subjects.py <builder_json_file> [output_dir]")
-        print("Example: python3 builder_to_subjects.py 25itinse_builder.json")
-        sys.exit(1)
+    import argparse
 
-    builder_json_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(
+        description="Content Builder JSON을 subjects 폴더 구조로 변환",
+        epilog="Example: python3 builder_to_subjects.py 25itinse_builder.json",
+    )
+    parser.add_argument("builder_json_file", nargs="?", help="Builder JSON 파일 경로")
+    parser.add_argument("output_dir", nargs="?", default=None, help="출력 디렉토리 (기본값: ./subjects)")
+    parser.add_argument("--stream", action="store_true",
+                        help="JSON 전체를 로드하지 않고 차시/이미지를 하나씩 읽어서 변환 (대용량 과정용)")
+    parser.add_argument("--image-workers", type=int, default=None,
+                        help=f"이미지 디코딩/저장 스레드 수 (기본값: {DEFAULT_IMAGE_WORKERS}, 1이면 순차 처리)")
+    parser.add_argument("--image-store", default=None, metavar="DIR",
+                        help="export 간에 공유하는 이미지 저장소 디렉토리 (출력 폴더 밖, 이미 있는 이미지는 디코딩 생략)")
+    parser.add_argument("--image-store-max-mb", type=int, default=DEFAULT_IMAGE_STORE_MAX_BYTES // (1024 * 1024),
+                        help="이미지 저장소 최대 크기 (MB, 초과 시 오래 사용하지 않은 이미지부터 삭제)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 export의 manifest와 비교하여 입력이 바뀐 차시만 다시 생성")
+    parser.add_argument("--lesson-workers", type=int, default=None,
+                        help="차시 내보내기 프로세스 수 (기본값: 1, 출력은 순차 처리와 동일)")
+    parser.add_argument("--link-index-html", action="store_true",
+                        help="차시마다 같은 index.html을 한 번만 쓰고 나머지 차시는 하드링크")
+    parser.add_argument("--component-stats", action="store_true",
+                        help="변환 후 페이지 컴포넌트별 실행 횟수/시간 출력 (차시 worker 프로세스 실행분 제외)")
+    parser.add_argument("--transform-stats", action="store_true",
+                        help="변환 후 HTML 변환별 실행/건너뜀 횟수 출력 (차시 worker 프로세스 실행분 포함)")
+    parser.add_argument("--worker", action="store_true",
+                        help="export worker 모드: stdin에서 요청(JSON 한 줄)을 읽어 stdout에 결과를 씀 (vite 플러그인용)")
+    args = parser.parse_args()
+
+    if args.worker:
+        serve_export_worker()
+        sys.exit(0)
+    if not args.builder_json_file:
+        parser.error("builder_json_file이 필요합니다")
 
     # Windows 경로 처리: Path 객체로 변환하여 크로스 플랫폼 호환성 보장
-    builder_json_path = Path(builder_json_path).resolve()
-    if output_dir:
-        output_dir = Path(output_dir).expanduser().resolve()
+    builder_json_path = Path(args.builder_json_file).resolve()
+    if args.output_dir:
+        output_dir = Path(args.output_dir).expanduser().resolve()
     else:
         output_dir = None
 
@@ -1718,5 +4492,22 @@ if __name__ == "__main__":
         print(f"❌ 파일을 찾을 수 없습니다: {builder_json_path}")
         sys.exit(1)
 
-    success = convert_builder_to_subjects(builder_json_path, output_dir)
+    image_store = None
+    if args.image_store:
+        image_store = ImageStore(args.image_store, max_bytes=args.image_store_max_mb * 1024 * 1024)
+
+    PAGE_COMPONENT_TIMING = args.component_stats
+    success = convert_builder_to_subjects(builder_json_path, output_dir, stream=args.stream,
+                                          image_workers=args.image_workers, image_store=image_store,
+                                          incremental=args.incremental, lesson_workers=args.lesson_workers,
+                                          link_index_html=args.link_index_html)
+    if args.component_stats:
+        print("\n📊 페이지 컴포넌트 통계")
+        print(format_page_component_stats())
+    if args.transform_stats:
+        print("\n📊 HTML 변환 통계")
+        print(format_html_transform_stats())
+        cache_stats = HTML_FRAGMENT_CACHE.stats()
+        print(f"정리 결과 캐시: {cache_stats['hits']}회 재사용, {cache_stats['misses']}회 저장, "
+              f"{cache_stats['bypassed']}회 제외, {cache_stats['entries']}개 ({cache_stats['bytes'] / 1024:.1f} KB)")
     sys.exit(0 if success else 1)
@@ -7,24 +7,69 @@ from http.server import BaseHTTPRequestHandler
 import json
 import sys
 import os
-import tempfile
 import zipfile
 import io
 import base64
+import traceback
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
 
 # 모듈 import (Vercel/로컬 환경 호환)
 try:
-    from api.builder_to_subjects import convert_builder_to_subjects
+    from api.builder_to_subjects import ZipTarget, convert_course_data
 except ImportError:
-    from builder_to_subjects import convert_builder_to_subjects
+    from builder_to_subjects import ZipTarget, convert_course_data
+
+# 스트리밍 응답에서 한 번에 보내는 chunk 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkedResponseWriter:
+    """ZIP 데이터를 HTTP/1.1 chunked transfer encoding으로 바로 내보내는 쓰기 전용 스트림
+
+    tell()/seek()를 제공하지 않으므로 zipfile은 각 항목 뒤에 data descriptor를 붙이는
+    방식으로 기록함 (이미 보낸 로컬 헤더를 다시 고치지 않음)
+    """
+
+    def __init__(self, wfile, chunk_size=None):
+        self.wfile = wfile
+        self.chunk_size = chunk_size or STREAM_CHUNK_SIZE
+        self._buffer = bytearray()
+
+    def write(self, data):
+        self._buffer += data
+        if len(self._buffer) >= self.chunk_size:
+            self._send_chunk()
+        return len(data)
+
+    def flush(self):
+        self._send_chunk()
+
+    def close(self):
+        """남은 데이터와 종료 chunk 전송"""
+        self._send_chunk()
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _send_chunk(self):
+        if not self._buffer:
+            return
+        self.wfile.write(b"%x\r\n" % len(self._buffer))
+        self.wfile.write(self._buffer)
+        self.wfile.write(b"\r\n")
+        self.wfile.flush()
+        self._buffer.clear()
 
 
 class handler(BaseHTTPRequestHandler):
+    # chunked 응답을 위해 HTTP/1.1 사용 (모든 응답에 Content-Length 또는 chunked 필요)
+    protocol_version = "HTTP/1.1"
+
     def do_OPTIONS(self):
         """CORS preflight"""
         self.send_response(200)
         self._send_cors_headers()
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def do_POST(self):
@@ -42,53 +87,64 @@ class handler(BaseHTTPRequestHandler):
 
             course_code = course_data.get("courseCode", "export")
 
-            # 임시 디렉토리에서 작업
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
+            # ?stream=1: 차시를 생성하는 동안 ZIP 항목을 chunked 응답으로 바로 전송
+            query = parse_qs(urlparse(self.path).query)
+            if query.get("stream", ["0"])[0].lower() in ("1", "true", "yes"):
+                self._send_zip_stream(course_data, course_code)
+                return
 
-                # JSON 파일 임시 저장
-                json_file = temp_path / f"{course_code}_builder.json"
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(course_data, f, ensure_ascii=False)
+            # 생성되는 파일을 임시 폴더 없이 바로 ZIP에 기록
+            zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                success = convert_course_data(course_data, target=ZipTarget(zip_file))
 
-                # 폴더 구조 생성
-                output_dir = temp_path / "output"
-                output_dir.mkdir(exist_ok=True)
+            if not success:
+                self._send_error(500, "Export failed")
+                return
 
-                success = convert_builder_to_subjects(json_file, output_dir)
+            # getvalue()는 ZIP 전체를 한 번 더 복사하므로 내부 버퍼를 그대로 전송
+            zip_data = zip_buffer.getbuffer()
 
-                if not success:
-                    self._send_error(500, "Export failed")
-                    return
-
-                # ZIP 파일 생성
-                zip_buffer = io.BytesIO()
-                course_dir = output_dir / course_code
-
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    for file_path in course_dir.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(output_dir)
-                            zip_file.write(file_path, arcname)
-
-                zip_buffer.seek(0)
-                zip_data = zip_buffer.getvalue()
-
-                # ZIP 파일 응답
-                self.send_response(200)
-                self._send_cors_headers()
-                self.send_header('Content-Type', 'application/zip')
-                self.send_header('Content-Disposition', f'attachment; filename="{course_code}.zip"')
-                self.send_header('Content-Length', str(len(zip_data)))
-                self.end_headers()
-                self.wfile.write(zip_data)
+            # ZIP 파일 응답
+            self.send_response(200)
+            self._send_cors_headers()
+            self.send_header('Content-Type', 'application/zip')
+            self.send_header('Content-Disposition', f'attachment; filename="{course_code}.zip"')
+            self.send_header('Content-Length', str(len(zip_data)))
+            self.end_headers()
+            self.wfile.write(zip_data)
 
         except json.JSONDecodeError as e:
             self._send_error(400, f"Invalid JSON: {str(e)}")
         except Exception as e:
-            import traceback
             self._send_error(500, f"{str(e)}\n{traceback.format_exc()}")
 
+    def _send_zip_stream(self, course_data, course_code):
+        """ZIP을 메모리에 모으지 않고 chunked transfer encoding으로 전송
+
+        크기를 미리 알 수 없는 항목이 있으므로 ZIP64를 강제함 (대용량 과정 지원).
+        헤더를 보낸 뒤에는 오류 응답을 보낼 수 없으므로, 실패하면 종료 chunk 없이
+        연결을 끊어 클라이언트가 불완전한 응답으로 인식하게 함
+        """
+        self.send_response(200)
+        self._send_cors_headers()
+        self.send_header('Content-Type', 'application/zip')
+        self.send_header('Content-Disposition', f'attachment; filename="{course_code}.zip"')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        body = _ChunkedResponseWriter(self.wfile)
+        try:
+            with zipfile.ZipFile(body, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zip_file:
+                success = convert_course_data(course_data, target=ZipTarget(zip_file, force_zip64=True))
+                if not success:
+                    raise RuntimeError("Export failed")
+        except Exception:
+            traceback.print_exc()
+            self.close_connection = True
+            return
+        body.close()
+
     def _send_cors_headers(self):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
@@ -97,6 +153,8 @@ class handler(BaseHTTPRequestHandler):
     def _send_error(self, code, message):
         self.send_response(code)
         self._send_cors_headers()
+        body = json.dumps({"error": message}).encode('utf-8')
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps({"error": message}).encode('utf-8'))
+        self.wfile.write(body)
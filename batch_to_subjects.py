@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+여러 Content Builder JSON을 한 번에 subjects 폴더 구조로 변환
+
+Usage:
+    python3 batch_to_subjects.py <builder_json_file_or_dir>... [-o output_dir] [--workers N] [--stream]
+                                 [--image-workers N] [--image-store DIR] [--image-store-max-mb N]
+                                 [--incremental] [--link-index-html] [--verbose]
+
+과정마다 인터프리터를 새로 띄우지 않고 프로세스 풀에서 큰 과정부터 변환하며,
+끝나면 과정별 소요 시간/출력 크기/이미지 수를 표로 출력
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from builder_to_subjects import (DEFAULT_IMAGE_STORE_MAX_BYTES, DEFAULT_IMAGE_WORKERS, ImageStore,
+                                 convert_builder_batch, find_builder_json_files, format_batch_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="여러 Content Builder JSON을 subjects 폴더 구조로 변환",
+        epilog="Example: python3 batch_to_subjects.py ~/Downloads/builders -o ~/Documents/subjects --workers 8",
+    )
+    parser.add_argument("inputs", nargs="+", help="Builder JSON 파일 또는 디렉토리 (디렉토리는 바로 아래의 *.json)")
+    parser.add_argument("-o", "--output-dir", default=None, help="출력 디렉토리 (기본값: ./subjects)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="과정 변환 프로세스 수 (기본값: CPU 수, 1이면 순차 처리)")
+    parser.add_argument("--stream", action="store_true",
+                        help="JSON 전체를 로드하지 않고 차시/이미지를 하나씩 읽어서 변환 (대용량 과정용)")
+    parser.add_argument("--image-workers", type=int, default=None,
+                        help=f"과정마다 이미지 디코딩/저장 스레드 수 (기본값: {DEFAULT_IMAGE_WORKERS})")
+    parser.add_argument("--image-store", default=None, metavar="DIR",
+                        help="과정/export 간에 공유하는 이미지 저장소 디렉토리")
+    parser.add_argument("--image-store-max-mb", type=int, default=DEFAULT_IMAGE_STORE_MAX_BYTES // (1024 * 1024),
+                        help="이미지 저장소 최대 크기 (MB)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 export의 manifest와 비교하여 입력이 바뀐 차시만 다시 생성")
+    parser.add_argument("--link-index-html", action="store_true",
+                        help="차시마다 같은 index.html을 한 번만 쓰고 나머지 차시는 하드링크")
+    parser.add_argument("--verbose", action="store_true", help="성공한 과정의 변환 로그도 출력")
+    args = parser.parse_args()
+
+    paths = find_builder_json_files(args.inputs)
+    missing = [path for path in paths if not path.is_file()]
+    if missing:
+        for path in missing:
+            print(f"❌ 파일을 찾을 수 없습니다: {path}")
+        sys.exit(1)
+    if not paths:
+        print("❌ 변환할 Builder JSON이 없습니다")
+        sys.exit(1)
+
+    image_store = None
+    if args.image_store:
+        image_store = ImageStore(args.image_store, max_bytes=args.image_store_max_mb * 1024 * 1024)
+    output_dir = Path(args.output_dir).expanduser().resolve() if args.output_dir else None
+
+    print(f"📦 {len(paths)}개 과정 변환 시작")
+
+    def report(result):
+        status = "✅" if result["success"] else "❌"
+        print(f"{status} {result['course_code'] or Path(result['path']).name} ({result['seconds']:.2f}s)")
+        if args.verbose or not result["success"]:
+            print(result["log"].rstrip())
+
+    start = time.perf_counter()
+    results = convert_builder_batch(paths, output_dir, workers=args.workers, stream=args.stream,
+                                    image_workers=args.image_workers, image_store=image_store,
+                                    incremental=args.incremental, link_index_html=args.link_index_html,
+                                    on_result=report)
+    print()
+    print(format_batch_results(results, time.perf_counter() - start))
+    sys.exit(0 if all(result["success"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
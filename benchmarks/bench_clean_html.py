@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+clean_html_for_export 벤치마크: 정규식 구현 vs 단일 패스 토크나이저
+
+Usage:
+    python3 benchmarks/bench_clean_html.py [--number 2000] [--repeat 3] [--image-kb 4,64]
+
+조각 종류별로 한 조각을 정리하는 데 걸리는 시간(µs)을 측정
+"""
+
+import argparse
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from builder_to_subjects import _clean_html_for_export_regex, clean_html_for_export
+
+FRAGMENTS = {
+    "paragraph": "<p>학습 내용을 정리한 문단입니다.</p>",
+    "attributes": '<p class="title">정리</p><p style="text-align: center;"><span style="color: #e03e2d;">강조</span></p>',
+    "headings": "<h3>소제목</h3><p>본문</p><h3>2) 번호있음</h3><h3>또</h3>",
+    "practice": "<ul class='practice'><li><p>실습 <p>하나</p></p></li><li><p>둘</p></li></ul>",
+    "check-bullet": '<ul class="check-bullet"><li><p>하나</p></li><li>✓ 둘</li><li>셋</li></ul>',
+    "mixed": (
+        '<p class="title">정리</p><ul class="check-bullet"><li><p>하나</p></li></ul>'
+        "<h3>소제목</h3><ul class='practice'><li><p>실습</p></li></ul><p>끝 <b>강조</b></p>"
+    ),
+}
+
+
+def image_fragment(size_kb):
+    payload = base64.b64encode(bytes(range(256)) * (size_kb * 3)).decode()[:size_kb * 1024]
+    return (
+        f'<p>그림 <img class="notion-image" src="data:image/png;base64,{payload}" alt="그림"></p>'
+        f'<p><img src="data:image/png;base64,{payload}" data-original-src="../images/25bench_img_001.png"></p>'
+    )
+
+
+def per_call(number, repeat, fn, html):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(html)
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="측정 1회당 호출 횟수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    parser.add_argument("--image-kb", default="4,64", help="인라인 이미지 크기 목록 (KB, 쉼표 구분)")
+    args = parser.parse_args()
+
+    fragments = dict(FRAGMENTS)
+    for size in [int(s) for s in args.image_kb.split(",") if s]:
+        fragments[f"image {size}KB"] = image_fragment(size)
+
+    print(f"{'fragment':<14} {'bytes':>8} {'regex':>10} {'single':>10} {'speedup':>8}")
+    for name, html in fragments.items():
+        assert clean_html_for_export(html) == _clean_html_for_export_regex(html), name
+        number = max(1, args.number * 200 // max(200, len(html)))
+        regex_time = per_call(number, args.repeat, _clean_html_for_export_regex, html)
+        single_time = per_call(number, args.repeat, clean_html_for_export, html)
+        print(f"{name:<14} {len(html):>8} {regex_time * 1e6:>8.1f}µs {single_time * 1e6:>8.1f}µs "
+              f"{regex_time / single_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
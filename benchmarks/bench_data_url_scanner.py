@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+base64 <img> 탐색 벤치마크: 이전 정규식 vs 위치 기반 스캐너
+
+Usage:
+    python3 benchmarks/bench_data_url_scanner.py [--sizes 1,5,10,50] [--repeat 3]
+
+각 크기(MB)만큼의 인라인 이미지가 들어 있는 HTML 조각에서
+태그 탐색 시간과 extract_and_save_images 전체 시간을 측정
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from builder_to_subjects import _scan_data_url_images, extract_and_save_images
+
+REGEX_PATTERN = r'<img\s+([^>]*?)src=["\'](data:image/([^;]+);base64,([^"\']+))["\']([^>]*?)>'
+
+
+def make_fragment(total_mb, image_count=4):
+    """total_mb 크기의 base64 이미지 image_count개가 들어 있는 HTML"""
+    image_size = int(total_mb * 1024 * 1024 * 3 / 4 / image_count)
+    parts = ["<p>본문</p>"]
+    for i in range(image_count):
+        payload = base64.b64encode(bytes([i]) * image_size).decode()
+        parts.append(f'<p>그림 {i}<img class="notion-image" src="data:image/png;base64,{payload}" alt="그림"></p>')
+    return "".join(parts)
+
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def regex_scan(html):
+    # 이전 구현: 매치마다 그룹 문자열을 만듦
+    return [(m.group(1), m.group(3), m.group(4), m.group(5)) for m in re.finditer(REGEX_PATTERN, html)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,5,10,50", help="HTML 조각 크기 목록 (MB, 쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'regex scan':>12} {'scanner':>12} {'speedup':>8} {'extract':>10} {'MB/s':>8}")
+    for size in [float(s) for s in args.sizes.split(",")]:
+        html = make_fragment(size)
+        assert len(regex_scan(html)) == len(_scan_data_url_images(html))
+
+        regex_time = best_of(args.repeat, lambda: regex_scan(html))
+        scanner_time = best_of(args.repeat, lambda: _scan_data_url_images(html))
+
+        def extract():
+            with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+                extract_and_save_images(html, Path(temp_dir), "25bench", {"count": 0}, image_cache={})
+
+        extract_time = best_of(args.repeat, extract)
+        mb = len(html) / (1024 * 1024)
+        print(f"{size:>5g}M {regex_time * 1000:>10.1f}ms {scanner_time * 1000:>10.1f}ms "
+              f"{regex_time / scanner_time:>7.1f}x {extract_time * 1000:>8.1f}ms {mb / extract_time:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+계열별 exporter 처리량 벤치마크: exporters 계열 exporter vs builder_to_subjects 과정 변환
+
+Usage:
+    python3 benchmarks/bench_family_exporters.py [--lessons 40] [--repeat 3]
+
+계열마다 대표 템플릿 하나로 같은 차시들을 내보내고 초당 차시 수를 비교
+(builder_to_subjects는 subjects.json/이미지 폴더 등 과정 단위 작업을 포함)
+"""
+
+import argparse
+import base64
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from builder_to_subjects import convert_course_data
+from exporters import export_template
+
+FAMILIES = {
+    "standard": "2025-standard",
+    "hrd": "2026-hrd",
+    "legal": "2022-legal",
+    "short": "2022-ct",
+    "short_quiz": "2026-hrc",
+}
+
+
+def make_course(preset, lesson_count):
+    def image(seed):
+        return "data:image/png;base64," + base64.b64encode(f"image-{seed}".encode() * 64).decode()
+
+    lessons = []
+    for i in range(1, lesson_count + 1):
+        lessons.append({
+            "lessonNumber": i,
+            "weekNumber": (i + 1) // 2,
+            "weekTitle": f"주제 {(i + 1) // 2}",
+            "lessonTitle": f"차시 {i}",
+            "sectionInWeek": (i - 1) % 2 + 1,
+            "terms": [{"title": f"용어 {n}", "content": [f"<p>설명 {n} <b>강조</b></p>"]} for n in range(4)],
+            "learningContents": ["<p>내용</p>", "<h3>소제목</h3><p>본문</p>"] * 3,
+            "learningObjectives": ["목표 1", "목표 2", "목표 3"],
+            "opinionQuestion": "질문?",
+            "professorThink": '<ul class="check-bullet"><li><p>하나</p></li></ul>',
+            "exercises": [
+                {"type": "multiple", "question": f'<p>문항 <img src="{image(i)}"></p>', "answer": "2",
+                 "options": ["하나", "둘", "셋", "넷"], "commentary": "<p>해설</p>"},
+                {"type": "boolean", "question": "<p>OX</p>", "answer": "1", "commentary": ""},
+            ],
+            "summary": ["<p>정리 1</p>", "<p>정리 2</p>"],
+        })
+    return {
+        "courseCode": "25bench",
+        "courseName": "벤치마크",
+        "year": "2025",
+        "templatePreset": preset,
+        "templateTheme": "",
+        "professor": {"name": "교수", "photo": image("professor"), "education": [], "career": []},
+        "lessons": lessons,
+    }
+
+
+def content_models(course):
+    return [dict(lesson, courseCode=course["courseCode"], courseName=course["courseName"], year=course["year"],
+                 professor=course["professor"], _meta={"sourceTemplateId": course["templatePreset"]})
+            for lesson in course["lessons"]]
+
+
+def best_time(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn(Path(temp_dir))
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lessons", type=int, default=40, help="계열별 차시 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print(f"{'family':<12} {'template':<15} {'exporter':>12} {'builder':>12} {'ratio':>7}")
+    for family, preset in FAMILIES.items():
+        course = make_course(preset, args.lessons)
+        models = content_models(course)
+
+        def run_exporter(output_dir):
+            for model in models:
+                export_template(model, output_dir)
+
+        exporter_time = best_time(args.repeat, run_exporter)
+        builder_time = best_time(args.repeat, lambda output_dir: convert_course_data(course, output_dir))
+        print(f"{family:<12} {preset:<15} {args.lessons / exporter_time:>8.0f} l/s {args.lessons / builder_time:>8.0f} l/s "
+              f"{builder_time / exporter_time:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Shared builder JSON fixtures and output helpers for the test_*.py scripts.
+"""
+
+import base64
+import filecmp
+from pathlib import Path
+
+# 1x1 PNG
+PNG_1x1 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+
+DEFAULT_PROFESSOR = {"name": "교수", "education": [], "career": []}
+
+
+def data_url(payload, image_type="png"):
+    """bytes -> data:image/...;base64 URL"""
+    return f"data:image/{image_type};base64," + base64.b64encode(payload).decode()
+
+
+def make_lesson(number, lessons_per_week=1, **fields):
+    """
+    Standard lesson: one term, content, objective, opinion question, O/X exercise, summary
+
+    lessons_per_week decides weekNumber/sectionInWeek (2: lessons 1-2 are week 1, 3-4 week 2, ...).
+    fields replace or add lesson keys.
+    """
+    week = (number - 1) // lessons_per_week + 1
+    lesson = {
+        "lessonNumber": number,
+        "weekNumber": week,
+        "weekTitle": f"주제 {week}",
+        "lessonTitle": f"차시 {number}",
+        "sectionInWeek": (number - 1) % lessons_per_week + 1,
+        "terms": [{"title": "용어", "content": ["<p>설명</p>"]}],
+        "learningContents": ["<p>내용</p>"],
+        "learningObjectives": ["목표"],
+        "opinionQuestion": "질문?",
+        "exercises": [{"type": "boolean", "question": "<p>문항</p>", "answer": "1", "commentary": ""}],
+        "summary": ["<p>정리</p>"],
+    }
+    lesson.update(fields)
+    return lesson
+
+
+def practice_week(number, week, week_title="현장실습"):
+    """Field practice week lesson (image only)"""
+    return {"lessonNumber": number, "weekNumber": week, "isPracticeWeek": True,
+            "practiceImage": "../images/practice.png", "lessonTitle": "", "weekTitle": week_title}
+
+
+def make_course(code, lessons, preset=None, **fields):
+    """
+    Builder JSON course; fields replace or add course keys (courseName, professor, importedImages, ...)
+    """
+    course = {
+        "courseCode": code,
+        "courseName": f"과정 {code}",
+        "year": "2025",
+        "professor": dict(DEFAULT_PROFESSOR),
+        "lessons": lessons,
+    }
+    if preset is not None:
+        course["templatePreset"] = preset
+    course.update(fields)
+    return course
+
+
+def read_tree(root, exclude=()):
+    """Files under root: {relative posix path: bytes} (names in exclude are skipped)"""
+    root = Path(root)
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*")) if path.is_file() and path.name not in exclude
+    }
+
+
+def same_tree(left, right):
+    """True if both directory trees have the same files with the same contents"""
+    comparison = filecmp.dircmp(left, right)
+    if comparison.left_only or comparison.right_only or comparison.diff_files or comparison.funny_files:
+        return False
+    return all(same_tree(Path(left) / name, Path(right) / name) for name in comparison.common_dirs)
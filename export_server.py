@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+자체 호스팅용 asyncio export 서버 (Vercel 없이 api/export.py 대신 사용)
+
+Usage:
+    python3 export_server.py [--host 127.0.0.1] [--port 8000] [--workers N] [--max-concurrent N]
+                             [--max-queue N] [--max-body-mb N] [--keep-alive-timeout SEC]
+                             [--shutdown-timeout SEC]
+
+api/export.py와 같은 계약: POST /api/export {"courseData": ...} -> {courseCode}.zip
+(오류는 {"error": ...} JSON, OPTIONS는 CORS preflight)
+
+- 변환(JSON 파싱 + ZIP 생성)은 크기가 정해진 프로세스 풀에서 실행하므로 큰 과정을 변환하는 동안에도
+  다른 요청을 받을 수 있음
+- 동시에 변환하는 요청은 --max-concurrent개까지, 그 뒤로 --max-queue개까지 대기하고
+  그보다 많으면 본문을 받기 전에 503 (Retry-After)으로 거절
+- ZIP은 워커가 임시 파일에 기록하고 서버가 sendfile로 전송 (?stream=1도 같은 방식, 크기를 알고 보내므로
+  chunked 응답이 필요 없음)
+- HTTP/1.1 keep-alive 지원, SIGINT/SIGTERM을 받으면 새 연결을 받지 않고 진행 중인 export를 끝낸 뒤 종료
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import multiprocessing
+import os
+import signal
+import tempfile
+import traceback
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+# 모듈 import (api/export.py와 같은 템플릿 사용)
+try:
+    from api.builder_to_subjects import ZipTarget, convert_course_data
+except ImportError:
+    from builder_to_subjects import ZipTarget, convert_course_data
+
+EXPORT_PATH = "/api/export"
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024 * 1024
+DEFAULT_KEEP_ALIVE_TIMEOUT = 15.0
+DEFAULT_SHUTDOWN_TIMEOUT = 60.0
+# 요청 줄 + 헤더 최대 크기
+MAX_HEADER_BYTES = 64 * 1024
+HEADER_TIMEOUT = 30.0
+# 본문을 받지 않고 거절한 뒤 연결을 닫기 전에 남은 본문을 버리며 기다리는 시간
+# (바로 닫으면 클라이언트가 응답을 읽기 전에 RST를 받을 수 있음)
+LINGER_TIMEOUT = 2.0
+
+
+def export_zip_file(body, temp_dir=None):
+    """
+    요청 본문을 ZIP 파일로 변환 (프로세스 풀 워커에서 실행)
+
+    Args:
+        body: POST 요청 본문 (bytes, {"courseData": ...})
+        temp_dir: ZIP 임시 파일을 만들 디렉토리 (None이면 시스템 임시 디렉토리)
+
+    Returns:
+        성공: {"status": 200, "course_code", "path", "size"} (path는 호출한 쪽에서 삭제)
+        실패: {"status": 400 또는 500, "error"}
+    """
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except ValueError as e:
+        return {"status": 400, "error": f"Invalid JSON: {str(e)}"}
+
+    course_data = data.get("courseData") if isinstance(data, dict) else None
+    if not course_data:
+        return {"status": 400, "error": "courseData is required"}
+    course_code = course_data.get("courseCode", "export")
+
+    fd, path = tempfile.mkstemp(prefix="export_", suffix=".zip", dir=temp_dir)
+    try:
+        # 변환 로그는 동시에 처리하는 요청끼리 섞이므로 버림 (실패 시 traceback만 반환)
+        with os.fdopen(fd, "wb") as f, contextlib.redirect_stdout(io.StringIO()):
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                success = convert_course_data(course_data, target=ZipTarget(zip_file))
+        if not success:
+            os.unlink(path)
+            return {"status": 500, "error": "Export failed"}
+        return {"status": 200, "course_code": course_code, "path": path, "size": os.path.getsize(path)}
+    except Exception as e:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+        return {"status": 500, "error": f"{str(e)}\n{traceback.format_exc()}"}
+
+
+class _BadRequest(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ExportServer:
+    """
+    asyncio HTTP export 서버
+
+    Args:
+        host, port: 바인딩 주소 (port=0이면 임의 포트, start() 후 self.port)
+        workers: 변환 프로세스 수 (None이면 CPU 수)
+        max_concurrent: 동시에 변환하는 요청 수 (None이면 workers)
+        max_queue: 변환을 기다릴 수 있는 요청 수 (넘으면 503)
+        max_body_bytes: 요청 본문 최대 크기 (넘으면 413)
+        keep_alive_timeout: keep-alive 연결에서 다음 요청을 기다리는 시간 (초)
+        shutdown_timeout: 종료 시 진행 중인 요청을 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, host="127.0.0.1", port=8000, workers=None, max_concurrent=None, max_queue=16,
+                 max_body_bytes=DEFAULT_MAX_BODY_BYTES, keep_alive_timeout=DEFAULT_KEEP_ALIVE_TIMEOUT,
+                 shutdown_timeout=DEFAULT_SHUTDOWN_TIMEOUT, temp_dir=None):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrent = max_concurrent or self.workers
+        self.max_queue = max_queue
+        self.max_body_bytes = max_body_bytes
+        self.keep_alive_timeout = keep_alive_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.temp_dir = temp_dir
+        self.stats = {"exports": 0, "failed": 0, "rejected": 0}
+        self._pool = None
+        self._server = None
+        self._slots = None
+        # 본문을 받는 중이거나 변환을 기다리는/변환 중인 export 요청 수
+        self._admitted = 0
+        # 연결 task -> 다음 요청을 기다리는 중(idle)인지
+        self._connections = {}
+        self._closing = False
+
+    async def start(self):
+        # fork로 만든 워커는 listening socket/클라이언트 연결 fd를 물려받아 종료 후에도 연결을 받으므로
+        # 가능하면 forkserver 사용 (Windows/macOS 기본값인 spawn도 fd를 물려받지 않음)
+        context = None
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def shutdown(self):
+        """새 연결을 받지 않고, idle 연결은 닫고, 진행 중인 요청은 shutdown_timeout까지 기다린 뒤 종료"""
+        if self._closing:
+            return
+        self._closing = True
+        self._server.close()
+        for task, idle in list(self._connections.items()):
+            if idle:
+                task.cancel()
+        if self._connections:
+            _, pending = await asyncio.wait(list(self._connections), timeout=self.shutdown_timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        await self._server.wait_closed()
+        # 실행 중인 변환이 끝날 때까지 기다리는 동안에도 이벤트 루프를 막지 않음
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._pool.shutdown, wait=True, cancel_futures=True))
+
+    async def _handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections[task] = True
+        try:
+            keep_alive = True
+            first = True
+            while keep_alive and not self._closing:
+                self._connections[task] = True
+                timeout = HEADER_TIMEOUT if first else self.keep_alive_timeout
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_json(writer, 431, {"error": "Request header too large"}, False)
+                    break
+                self._connections[task] = False
+                first = False
+                keep_alive = await self._handle_request(head, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def _handle_request(self, head, reader, writer):
+        """요청 하나 처리, 연결을 유지할지 반환"""
+        try:
+            method, target, version, headers = _parse_head(head)
+        except _BadRequest as e:
+            await self._send_json(writer, e.status, {"error": str(e)}, False)
+            return False
+
+        keep_alive = _wants_keep_alive(version, headers)
+        try:
+            content_length = int(headers.get("content-length", 0))
+            if content_length < 0:
+                raise ValueError(content_length)
+        except ValueError:
+            await self._send_json(writer, 400, {"error": "Invalid Content-Length"}, False)
+            return False
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            await self._send_json(writer, 411, {"error": "Content-Length is required"}, False)
+            return False
+
+        path = urlsplit(target).path
+        if method == "OPTIONS":
+            await self._discard_body(reader, content_length)
+            await self._send(writer, 200, {"Content-Length": "0"}, keep_alive)
+            return keep_alive
+        if path != EXPORT_PATH:
+            # 본문을 받지 않았으므로 연결을 유지하지 않음
+            await self._send_json(writer, 404, {"error": "Not found"}, False)
+            return False
+        if method != "POST":
+            await self._send_json(writer, 405, {"error": "Method not allowed"}, False, {"Allow": "POST, OPTIONS"})
+            return False
+        if content_length > self.max_body_bytes:
+            await self._send_json(writer, 413, {"error": "Request body too large"}, False)
+            await _linger(reader, writer)
+            return False
+        if self._admitted >= self.max_concurrent + self.max_queue:
+            self.stats["rejected"] += 1
+            await self._send_json(writer, 503, {"error": "Too many exports in progress"}, False, {"Retry-After": "5"})
+            await _linger(reader, writer)
+            return False
+
+        self._admitted += 1
+        try:
+            if headers.get("expect", "").lower() == "100-continue":
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            body = await reader.readexactly(content_length)
+            async with self._slots:
+                job = self._pool.submit(export_zip_file, body, self.temp_dir)
+                try:
+                    result = await asyncio.wrap_future(job)
+                except asyncio.CancelledError:
+                    # 종료 시간 초과 등으로 취소되어도 이미 실행 중인 변환은 계속되므로, 끝나면 ZIP 삭제
+                    job.add_done_callback(_remove_zip_file)
+                    raise
+        finally:
+            self._admitted -= 1
+
+        keep_alive = keep_alive and not self._closing
+        if result["status"] != 200:
+            self.stats["failed"] += 1
+            await self._send_json(writer, result["status"], {"error": result["error"]}, keep_alive)
+            return keep_alive
+
+        self.stats["exports"] += 1
+        try:
+            await self._send(writer, 200, {
+                "Content-Type": "application/zip",
+                "Content-Disposition": f'attachment; filename="{result["course_code"]}.zip"',
+                "Content-Length": str(result["size"]),
+            }, keep_alive)
+            with open(result["path"], "rb") as f:
+                await asyncio.get_running_loop().sendfile(writer.transport, f)
+        finally:
+            with contextlib.suppress(OSError):
+                os.unlink(result["path"])
+        return keep_alive
+
+    async def _discard_body(self, reader, content_length):
+        if content_length:
+            await reader.readexactly(content_length)
+
+    async def _send(self, writer, status, headers, keep_alive):
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+                 "Access-Control-Allow-Origin: *",
+                 "Access-Control-Allow-Methods: POST, OPTIONS",
+                 "Access-Control-Allow-Headers: Content-Type",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def _send_json(self, writer, status, data, keep_alive, headers=None):
+        body = json.dumps(data).encode("utf-8")
+        await self._send(writer, status, dict(headers or {}, **{
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+        }), keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+
+def _parse_head(head):
+    """요청 줄과 헤더 파싱 -> (method, target, version, headers(소문자 키))"""
+    try:
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise _BadRequest(400, "Malformed request line")
+    if not version.startswith("HTTP/1."):
+        raise _BadRequest(505, "HTTP version not supported")
+    headers = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise _BadRequest(400, "Malformed header")
+        headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+def _remove_zip_file(job):
+    """응답하지 못한 변환 결과의 ZIP 임시 파일 삭제 (변환 future의 done callback)"""
+    if job.cancelled() or job.exception() is not None:
+        return
+    path = job.result().get("path")
+    if path:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+
+async def _linger(reader, writer):
+    """응답을 보낸 뒤 쓰기 방향만 닫고, 클라이언트가 보내는 본문은 LINGER_TIMEOUT까지 버림"""
+    if writer.can_write_eof():
+        writer.write_eof()
+
+    async def discard():
+        while await reader.read(64 * 1024):
+            pass
+
+    with contextlib.suppress(asyncio.TimeoutError, ConnectionError):
+        await asyncio.wait_for(discard(), LINGER_TIMEOUT)
+
+
+def _wants_keep_alive(version, headers):
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+async def serve(server):
+    """서버를 시작하고 SIGINT/SIGTERM을 받을 때까지 실행"""
+    await server.start()
+    print(f"🚀 export 서버: http://{server.host}:{server.port}{EXPORT_PATH} "
+          f"(workers={server.workers}, max_concurrent={server.max_concurrent}, max_queue={server.max_queue})")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):  # Windows
+            loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        print("⏹️ 종료 중: 진행 중인 export를 마무리합니다")
+        await server.shutdown()
+        print(f"✅ 종료 (export {server.stats['exports']}건, 실패 {server.stats['failed']}건, "
+              f"거절 {server.stats['rejected']}건)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Content Builder export 서버 (POST /api/export -> ZIP)",
+        epilog="Example: python3 export_server.py --host 0.0.0.0 --port 8000 --workers 4",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="포트 (기본값: 8000)")
+    parser.add_argument("--workers", type=int, default=None, help="변환 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--max-concurrent", type=int, default=None,
+                        help="동시에 변환하는 요청 수 (기본값: --workers)")
+    parser.add_argument("--max-queue", type=int, default=16,
+                        help="변환을 기다릴 수 있는 요청 수, 넘으면 503 (기본값: 16)")
+    parser.add_argument("--max-body-mb", type=int, default=DEFAULT_MAX_BODY_BYTES // (1024 * 1024),
+                        help="요청 본문 최대 크기 (MB)")
+    parser.add_argument("--keep-alive-timeout", type=float, default=DEFAULT_KEEP_ALIVE_TIMEOUT,
+                        help="keep-alive 연결 유지 시간 (초)")
+    parser.add_argument("--shutdown-timeout", type=float, default=DEFAULT_SHUTDOWN_TIMEOUT,
+                        help="종료 시 진행 중인 export를 기다리는 최대 시간 (초)")
+    args = parser.parse_args()
+
+    server = ExportServer(args.host, args.port, workers=args.workers, max_concurrent=args.max_concurrent,
+                          max_queue=args.max_queue, max_body_bytes=args.max_body_mb * 1024 * 1024,
+                          keep_alive_timeout=args.keep_alive_timeout, shutdown_timeout=args.shutdown_timeout)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(server))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,64 @@ This module provides shared functionality used by specific template family expor
 
 import re
 import os
+import sys
 import base64
 import hashlib
+import functools
+import threading
 from pathlib import Path
 
+from .serializers.modern_serializer import modern_json_dump
+
+
+@functools.lru_cache(maxsize=None)
+def load_legacy_exporter():
+    """builder_to_subjects 모듈 (처음 사용할 때 import, 없으면 None)"""
+    repo_root = str(Path(__file__).parent.parent)
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    try:
+        import builder_to_subjects
+    except ImportError:
+        return None
+    return builder_to_subjects
+
+
+@functools.lru_cache(maxsize=None)
+def _single_pass_cleaner():
+    """builder_to_subjects의 단일 패스 HTML 정리 함수 (처음 사용할 때 import, 없으면 None)"""
+    legacy_exporter = load_legacy_exporter()
+    if legacy_exporter is None:
+        return None
+    return functools.partial(legacy_exporter.clean_html_single_pass, variant=legacy_exporter.HTML_VARIANT_EXPORTER)
+
+
+@functools.lru_cache(maxsize=None)
+def _fragment_cache():
+    """builder_to_subjects의 정리 결과 캐시 (처음 사용할 때 import, 없으면 None)"""
+    legacy_exporter = load_legacy_exporter()
+    if legacy_exporter is None:
+        return None
+    return functools.partial(legacy_exporter.HTML_FRAGMENT_CACHE.clean, variant=legacy_exporter.HTML_VARIANT_EXPORTER,
+                             function=_clean_html)
+
+
+@functools.lru_cache(maxsize=64)
+def _index_html(template_id, theme):
+    """템플릿/테마별 index.html (모든 차시가 같은 내용이므로 한 번만 생성)"""
+    return load_legacy_exporter().get_index_html_template(template_id, theme)
+
+
+def _max_image_number(images_dir, course_code):
+    """images_dir에 이미 있는 {course_code}_img_N 이미지의 최대 번호 (이어서 번호를 붙이도록)"""
+    pattern = re.compile(rf'{re.escape(course_code)}_img_(\d+)\.')
+    max_number = 0
+    for name in os.listdir(images_dir):
+        match = pattern.match(name)
+        if match:
+            max_number = max(max_number, int(match.group(1)))
+    return max_number
+
 
 def clean_html_for_export(html_content):
     """
@@ -25,6 +79,27 @@ def clean_html_for_export(html_content):
     if not html_content:
         return html_content
 
+    # 같은 조각은 builder_to_subjects와 공유하는 캐시에서 재사용
+    cached_clean = _fragment_cache()
+    if cached_clean is not None:
+        return cached_clean(html_content)
+    return _clean_html(html_content)
+
+
+def _clean_html(html_content):
+    # 한 번의 스캔으로 정리하고, 같은 결과를 보장할 수 없는 조각만 정규식으로 처리
+    cleaner = _single_pass_cleaner()
+    cleaned = cleaner(html_content) if cleaner else None
+    if cleaned is None:
+        return _clean_html_for_export_regex(html_content)
+    return cleaned
+
+
+def _clean_html_for_export_regex(html_content):
+    """clean_html_for_export의 정규식 구현 (단일 패스 토크나이저의 기준 동작)"""
+    if not html_content:
+        return html_content
+
     # data-original-src가 있으면 src를 data-original-src로 교체하고 data-original-src 제거
     # <img src="base64..." data-original-src="../images/file.png">
     # → <img src="../images/file.png">
@@ -206,13 +281,46 @@ def save_base64_image(base64_data, output_dir, filename=None):
     return str(output_path.relative_to(Path(output_dir).parent.parent))
 
 
+class _CleanFrame:
+    """_clean_content_for_export의 탐색 상태 (dict/list 하나)"""
+
+    __slots__ = ("node", "keys", "position", "copy", "parent", "key")
+
+    def __init__(self, node, parent=None, key=None):
+        self.node = node
+        self.keys = list(node) if isinstance(node, dict) else range(len(node))
+        self.position = 0
+        self.copy = None  # 바뀐 값이 생기면 만드는 사본
+        self.parent = parent
+        self.key = key
+
+    def set(self, key, value):
+        if self.copy is None:
+            self.copy = dict(self.node) if isinstance(self.node, dict) else list(self.node)
+        self.copy[key] = value
+
+
 class BaseExporter:
     """
     Base Exporter class that all specific exporters should extend
     """
 
+    # HTML이 들어가지 않는 키 (정리하지 않고 원본 값을 그대로 공유)
+    # 계열별 exporter는 자신의 content model에 맞게 확장
+    NON_HTML_KEYS = frozenset({
+        "_meta", "type", "answer", "lessonNumber", "weekNumber", "sectionInWeek",
+        "timestamps", "lectureVideoUrl", "instructionUrl", "guideUrl", "fingerprint",
+        "professorThinkImage",
+    })
+
+    # data.json sections (계열별로 다름)
+    SECTIONS = ("인트로", "준비하기", "학습하기", "정리하기")
+
     def __init__(self):
         self.name = "BaseExporter"
+        # (images 폴더, 과정 코드) -> 이미지 번호/중복 제거 상태 (_image_state)
+        self._image_states = {}
+        self._image_states_lock = threading.Lock()
 
     def can_export(self, content_model):
         """
@@ -228,16 +336,69 @@ class BaseExporter:
 
     def export(self, content_model, output_dir):
         """
-        Export the content model to the output directory
+        Export one lesson content model to output_dir/<NN>/ (index.html, assets/data/data.json)
+
+        Pages are built by the family's component plan (_get_components) from the
+        builder_to_subjects page functions; only the listed components are bound.
+        Extracted images are saved to output_dir/images, numbered after the images already there;
+        an image already in the folder (saved by an earlier lesson) is referenced, not saved again.
+        Course-level values are read from the content model when present
+        (courseCode, courseName, year, courseType: same names as the builder JSON;
+        weekTitles: all week titles, used by the next page when nextWeekTitles is empty).
 
         Args:
             content_model: Content model to export
-            output_dir: Output directory path
+            output_dir: Output directory path (course folder)
 
         Returns:
             Dictionary with export results
         """
-        raise NotImplementedError("export() must be implemented by subclass")
+        legacy_exporter = load_legacy_exporter()
+        if legacy_exporter is None:
+            raise ImportError("Cannot import builder_to_subjects.py for page generation")
+
+        meta = content_model.get('_meta') or {}
+        template_id = meta.get('sourceTemplateId')
+        theme = meta.get('sourceTheme') or ''  # 없으면 프리셋의 첫 번째 테마
+        print(f"Exporting {template_id} template (theme: {theme}) using {self.name}...")
+
+        output_dir = Path(output_dir).expanduser()
+        lesson_dir = output_dir / f"{content_model['lessonNumber']:02d}"
+        data_dir = lesson_dir / "assets" / "data"
+        images_dir = output_dir / "images"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        images_dir.mkdir(parents=True, exist_ok=True)
+
+        # 하드링크된 index.html일 수 있으므로 지우고 새로 씀
+        index_path = lesson_dir / "index.html"
+        index_path.unlink(missing_ok=True)
+        index_path.write_text(_index_html(template_id, theme), encoding="utf-8")
+
+        # 현장실습 주차는 이미지만 있음
+        if content_model.get('isPracticeWeek'):
+            components = []
+            pages = []
+            data_json = {"image": content_model.get("practiceImage", "")}
+        else:
+            image_state = self._image_state(images_dir, content_model.get('courseCode', ''), legacy_exporter)
+            with image_state['lock']:
+                context = self._create_context(content_model, template_id, images_dir, legacy_exporter, image_state)
+                components = context["components"]
+                pages = self._create_pages(content_model, context, legacy_exporter)
+                image_state['mtime'] = os.stat(images_dir).st_mtime_ns
+            data_json = self._create_data_json(content_model, pages, context)
+
+        with open(data_dir / "data.json", "w", encoding="utf-8") as f:
+            self._get_serializer(template_id)(data_json, f)
+
+        return {
+            'success': True,
+            'template_id': template_id,
+            'theme': theme,
+            'lesson_dir': str(lesson_dir),
+            'components': list(components),
+            'pages': len(pages),
+        }
 
     def get_template_id(self):
         """
@@ -248,6 +409,122 @@ class BaseExporter:
         """
         raise NotImplementedError("getTemplateId() must be implemented by subclass")
 
+    def _get_components(self, template_id, content_model):
+        """
+        Get the page components of the template, in data.json order
+
+        Args:
+            template_id: Template ID
+            content_model: Content model
+
+        Returns:
+            List of component names
+        """
+        raise NotImplementedError("_get_components() must be implemented by subclass")
+
+    def _get_serializer(self, template_id):
+        """
+        Get the data.json serializer: function(obj, fp)
+        """
+        return modern_json_dump
+
+    def _image_state(self, images_dir, course_code, legacy_exporter):
+        """
+        Image numbering/dedup state shared by the lessons exported to one images folder
+
+        Like the course-wide image index of builder_to_subjects, so the same image in
+        several lessons is saved once. The state is reused while the folder is unchanged
+        since the last export into it (same mtime); otherwise it is rebuilt from the images
+        already there (numbering continues after them, identical files are reused).
+        """
+        key = (str(Path(images_dir).resolve()), course_code)
+        mtime = os.stat(images_dir).st_mtime_ns
+        with self._image_states_lock:
+            state = self._image_states.get(key)
+            if state is None or state['mtime'] != mtime:
+                image_cache = legacy_exporter.ImageIndex()
+                legacy_exporter.seed_image_index(image_cache, images_dir)
+                state = {
+                    'lock': threading.Lock(),
+                    'mtime': mtime,
+                    'image_cache': image_cache,
+                    'image_counter': {'count': _max_image_number(images_dir, course_code)},
+                    # (원본 교수 사진, 처리한 경로)
+                    'professor_photo': None,
+                }
+                self._image_states[key] = state
+        return state
+
+    def _create_context(self, content_model, template_id, images_dir, legacy_exporter, image_state):
+        """
+        Course-level values for the page functions of one lesson (builder_to_subjects course_ctx)
+
+        Components the family does not use are not bound, and the professor photo
+        is only processed when the template has an intro page (once per images folder).
+        """
+        course_code = content_model.get('courseCode', '')
+        components = self._get_components(template_id, content_model)
+        professor = content_model.get('professor') or {}
+        image_cache = image_state['image_cache']
+        processed_photo = None
+        if 'intro' in components:
+            photo = professor.get('photo', '')
+            cached_photo = image_state['professor_photo']
+            if cached_photo is not None and cached_photo[0] == photo:
+                processed_photo = cached_photo[1]
+            else:
+                processed_photo = legacy_exporter.process_professor_photo(photo, images_dir, image_cache)
+                image_state['professor_photo'] = (photo, processed_photo)
+        is_2018 = template_id == '2018-standard'
+        preserved = (content_model.get('_meta') or {}).get('preservedFields') or {}
+
+        return {
+            'components': components,
+            'course_code': course_code,
+            'course_name': content_model.get('courseName') or preserved.get('subject', ''),
+            'course_type': content_model.get('courseType', 'general'),
+            'year': content_model.get('year', ''),
+            'professor': professor,
+            'processed_professor_photo': processed_photo,
+            'is_2018': is_2018,
+            'is_legacy_template': is_2018,
+            'images_dir': images_dir,
+            'image_counter': image_state['image_counter'],
+            'image_cache': image_cache,
+            'imported_image_path_mapping': legacy_exporter.ImportedPathMapping(),
+            'week_titles_list': content_model.get('weekTitles') or [],
+        }
+
+    def _create_pages(self, content_model, context, legacy_exporter):
+        """
+        Build the pages of the lesson with the compiled component plan
+        """
+        pages = []
+        for _, build in legacy_exporter.compile_page_plan(context):
+            page = build(content_model)
+            if page is not None:
+                pages.append(page)
+        return pages
+
+    def _create_data_json(self, content_model, pages, context):
+        """
+        Create data.json structure (family sections, imported sections kept for round-trip)
+
+        Args:
+            content_model: Content model
+            pages: Pages built by _create_pages
+            context: Values from _create_context
+
+        Returns:
+            Dictionary representing data.json
+        """
+        original_format = (content_model.get('_meta') or {}).get('originalFormat') or {}
+        sections = original_format.get('sections') or self.SECTIONS
+        data_json = load_legacy_exporter().lesson_data_header(
+            content_model, context['course_name'], context['course_code'], context['year'], sections)
+        data_json['pages'] = pages
+        return data_json
+
     def _clean_content_for_export(self, content):
         """
         Clean content for export (remove editor-specific attributes)
@@ -256,13 +533,37 @@ class BaseExporter:
             content: Content to clean (string, list, or dict)
 
         Returns:
-            Cleaned content
+            Cleaned content. Unchanged strings, lists and dicts are the original
+            objects (copy-on-write), and values under NON_HTML_KEYS are not cleaned.
         """
         if isinstance(content, str):
-            return clean_html_for_export(content)
-        elif isinstance(content, list):
-            return [self._clean_content_for_export(item) for item in content]
-        elif isinstance(content, dict):
-            return {key: self._clean_content_for_export(value) for key, value in content.items()}
-        else:
+            return clean_html_for_export(content) if '<' in content else content
+        if not isinstance(content, (list, dict)):
             return content
+
+        # 재귀 대신 명시적 스택으로 순회 (중첩 깊이 제한 없음)
+        non_html_keys = self.NON_HTML_KEYS
+        stack = [_CleanFrame(content)]
+        while True:
+            frame = stack[-1]
+            if frame.position == len(frame.keys):
+                stack.pop()
+                cleaned = frame.node if frame.copy is None else frame.copy
+                if frame.parent is None:
+                    return cleaned
+                if frame.copy is not None:
+                    frame.parent.set(frame.key, cleaned)
+                continue
+
+            key = frame.keys[frame.position]
+            frame.position += 1
+            if key in non_html_keys:
+                continue
+            value = frame.node[key]
+            if isinstance(value, str):
+                if '<' in value:
+                    cleaned = clean_html_for_export(value)
+                    if cleaned != value:
+                        frame.set(key, cleaned)
+            elif isinstance(value, (list, dict)):
+                stack.append(_CleanFrame(value, frame, key))
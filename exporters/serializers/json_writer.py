@@ -0,0 +1,91 @@
+"""
+Streaming JSON Writer
+
+Shared one-pass writer for the legacy (2018) and modern (2019+) serializers:
+- Writes pieces to a callback (list.append or file write) instead of joining nested strings
+- String escaping via the stdlib json encoder (C implementation when available)
+- Short string arrays on one line, everything else tab-indented
+"""
+
+import json
+
+# JSON 문자열 이스케이프 (json 모듈의 C 구현, ensure_ascii=False와 같은 결과)
+encode_json_string = json.encoder.encode_basestring
+
+# dump_json이 모아서 한 번에 쓰는 최대 글자 수
+WRITE_BATCH = 8 * 1024
+
+
+def write_json(value, write, indent, separator, inline_list_max, level=0):
+    """
+    value를 write(조각)에 순서대로 씀
+
+    Args:
+        value: Serialization할 객체
+        write: 조각을 받는 함수 (list.append, file.write 등)
+        indent: 들여쓰기 문자
+        separator: key와 value 사이 구분자 (' : ' 또는 ': ')
+        inline_list_max: 한 줄로 쓰는 문자열 배열의 최대 길이
+        level: 현재 들여쓰기 단계
+    """
+    if isinstance(value, str):
+        write(encode_json_string(value))
+    elif isinstance(value, dict):
+        if not value:
+            write('{}')
+            return
+        next_indent = '\n' + indent * (level + 1)
+        item_prefix = '{' + next_indent
+        for key, val in value.items():
+            write(f'{item_prefix}"{key}"{separator}')
+            write_json(val, write, indent, separator, inline_list_max, level + 1)
+            item_prefix = ',' + next_indent
+        write('\n' + indent * level + '}')
+    elif isinstance(value, list):
+        # sections 배열은 한 줄로 (문자열 배열이고 inline_list_max개 이하인 경우)
+        if len(value) <= inline_list_max and all(isinstance(item, str) for item in value):
+            write('[' + ', '.join(map(encode_json_string, value)) + ']')
+            return
+        # 다른 배열은 여러 줄로
+        next_indent = '\n' + indent * (level + 1)
+        item_prefix = '[' + next_indent
+        for item in value:
+            write(item_prefix)
+            write_json(item, write, indent, separator, inline_list_max, level + 1)
+            item_prefix = ',' + next_indent
+        write('\n' + indent * level + ']')
+    elif value is None:
+        write('null')
+    elif value is True:
+        write('true')
+    elif value is False:
+        write('false')
+    elif isinstance(value, (int, float)):
+        write(str(value))
+    else:
+        write('null')
+
+
+def dumps_json(obj, indent, separator, inline_list_max):
+    """write_json 결과를 한 번에 이어 붙인 문자열"""
+    parts = []
+    write_json(obj, parts.append, indent, separator, inline_list_max)
+    return ''.join(parts)
+
+
+def dump_json(obj, fp, indent, separator, inline_list_max):
+    """write_json 결과를 WRITE_BATCH 글자 단위로 fp에 씀 (전체 문자열을 만들지 않음)"""
+    parts = []
+    size = 0
+
+    def write(text):
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        if size >= WRITE_BATCH:
+            fp.write(''.join(parts))
+            parts.clear()
+            size = 0
+
+    write_json(obj, write, indent, separator, inline_list_max)
+    fp.write(''.join(parts))
@@ -7,6 +7,11 @@ Special serialization for 2018 templates:
 - Tab indentation
 """
 
+from .json_writer import dump_json, dumps_json
+
+SEPARATOR = ' : '  # 2018 format
+INLINE_LIST_MAX = 4  # 한 줄로 쓰는 문자열 배열 최대 길이
+
 
 def legacy_json_dumps(obj, indent='\t'):
     """
@@ -22,48 +27,16 @@ def legacy_json_dumps(obj, indent='\t'):
     Returns:
         JSON 문자열
     """
-    separator = ' : '  # 2018 format: space-colon-space
+    return dumps_json(obj, indent, SEPARATOR, INLINE_LIST_MAX)
 
-    def serialize_value(value, level=0):
-        indent_str = indent * level
-        next_indent = indent * (level + 1)
 
-        if value is None:
-            return 'null'
-        elif isinstance(value, bool):
-            return 'true' if value else 'false'
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, str):
-            # JSON 이스케이프
-            escaped = (value
-                      .replace('\\', '\\\\')
-                      .replace('"', '\\"')
-                      .replace('\n', '\\n')
-                      .replace('\r', '\\r')
-                      .replace('\t', '\\t'))
-            return f'"{escaped}"'
-        elif isinstance(value, list):
-            # sections 배열은 한 줄로 (문자열 배열이고 4개 이하인 경우)
-            if all(isinstance(item, str) for item in value) and len(value) <= 4:
-                items = ', '.join(f'"{item}"' for item in value)
-                return f'[{items}]'
-            # 다른 배열은 여러 줄로
-            if not value:
-                return '[]'
-            items = []
-            for item in value:
-                items.append(f'{next_indent}{serialize_value(item, level + 1)}')
-            return '[\n' + ',\n'.join(items) + f'\n{indent_str}]'
-        elif isinstance(value, dict):
-            if not value:
-                return '{}'
-            items = []
-            for key, val in value.items():
-                serialized_val = serialize_value(val, level + 1)
-                items.append(f'{next_indent}"{key}"{separator}{serialized_val}')
-            return '{\n' + ',\n'.join(items) + f'\n{indent_str}}}'
-        else:
-            return 'null'
+def legacy_json_dump(obj, fp, indent='\t'):
+    """
+    legacy_json_dumps와 같은 내용을 fp에 바로 씀 (전체 문자열을 만들지 않음)
 
-    return serialize_value(obj)
+    Args:
+        obj: Serialization할 객체
+        fp: 쓰기 가능한 텍스트 파일 객체
+        indent: 들여쓰기 문자 (기본값: '\t')
+    """
+    dump_json(obj, fp, indent, SEPARATOR, INLINE_LIST_MAX)
@@ -3,22 +3,70 @@ Template Exporter Router
 
 Auto-detects template format from content model and routes to appropriate exporter.
 This is the main entry point for export operations.
+
+Family modules are imported on first use: routing only needs the template IDs below,
+so importing this package does not load the exporters (or builder_to_subjects).
 """
 
-from .families.standard_exporter import StandardExporter
-from .families.hrd_exporter import HrdExporter
-from .families.legal_exporter import LegalExporter
-from .families.short_exporter import ShortExporter
-from .families.short_quiz_exporter import ShortQuizExporter
+import importlib
+import threading
+
+# Priority-based family list: (module, class, template IDs)
+FAMILIES = (
+    ('legal_exporter', 'LegalExporter', ('2022-legal',)),  # 5-section unique structure (highest priority)
+    ('short_quiz_exporter', 'ShortQuizExporter', ('2026-hrc',)),  # 2-section: lecture + exercise
+    ('short_exporter', 'ShortExporter', ('2022-ct', 'onboard-dunamu')),  # 1-section: lecture only
+    ('hrd_exporter', 'HrdExporter', ('2024-hrd', '2026-hrd')),  # HRD components
+    ('standard_exporter', 'StandardExporter', (  # Default fallback
+        '2018-standard', '2019-standard', '2020-standard', '2021-standard',
+        '2022-standard', '2023-standard', '2025-standard',
+    )),
+)
+
+# sourceTemplateId -> (module, class); the first family listing an ID wins
+ROUTES = {}
+for _module_name, _class_name, _template_ids in FAMILIES:
+    for _template_id in _template_ids:
+        ROUTES.setdefault(_template_id, (_module_name, _class_name))
+del _module_name, _class_name, _template_ids, _template_id
+
+# (module, class) -> exporter instance (one per family, created on first use)
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def _load_exporter_class(module_name, class_name):
+    module = importlib.import_module(f'.families.{module_name}', __package__)
+    return getattr(module, class_name)
+
+
+def get_exporter(template_id):
+    """
+    Get the exporter instance for a template ID
+
+    Args:
+        template_id: sourceTemplateId from content model _meta
+
+    Returns:
+        Shared exporter instance, or None if no exporter handles the template
+    """
+    route = ROUTES.get(template_id)
+    if route is None:
+        return None
+    exporter = _instances.get(route)
+    if exporter is None:
+        with _instances_lock:
+            exporter = _instances.get(route)
+            if exporter is None:
+                exporter = _instances[route] = _load_exporter_class(*route)()
+    return exporter
+
 
-# Priority-based exporter list
-EXPORTERS = [
-    LegalExporter,  # 5-section unique structure (highest priority)
-    ShortQuizExporter,  # 2-section: lecture + exercise
-    ShortExporter,  # 1-section: lecture only
-    HrdExporter,  # HRD components
-    StandardExporter,  # Default fallback
-]
+def __getattr__(name):
+    # EXPORTERS (exporter classes in priority order) imports every family module, so build it on request
+    if name == 'EXPORTERS':
+        return [_load_exporter_class(module_name, class_name) for module_name, class_name, _ in FAMILIES]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def export_template(content_model, output_dir):
@@ -41,11 +89,10 @@ def export_template(content_model, output_dir):
     template_id = content_model['_meta'].get('sourceTemplateId', 'unknown')
 
     # Find appropriate exporter
-    for ExporterClass in EXPORTERS:
-        exporter = ExporterClass()
-        if exporter.can_export(content_model):
-            print(f"Using {exporter.name} for template: {template_id}")
-            return exporter.export(content_model, output_dir)
+    exporter = get_exporter(template_id)
+    if exporter is not None and exporter.can_export(content_model):
+        print(f"Using {exporter.name} for template: {template_id}")
+        return exporter.export(content_model, output_dir)
 
     # If no exporter found, raise error
     raise ValueError(f"No exporter found for template: {template_id}")
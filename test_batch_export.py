@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test batch export: many builder JSON files per run, largest first, worker pool, per-course results.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import PNG_1x1, make_course, make_lesson, same_tree
+from builder_to_subjects import (convert_builder_batch, convert_builder_to_subjects, find_builder_json_files,
+                                 format_batch_results)
+
+
+def make_batch_course(code, lesson_count, preset="2025-standard"):
+    lessons = [make_lesson(i, lessons_per_week=2,
+                           terms=[{"title": "용어", "content": [f'<p>설명 {i} <img src="{PNG_1x1}"></p>']}])
+               for i in range(1, lesson_count + 1)]
+    return make_course(code, lessons, preset)
+
+
+def write_inputs(input_dir):
+    input_dir.mkdir()
+    for name, course in [("small.json", make_batch_course("25small", 2)),
+                         ("large.json", make_batch_course("25large", 12, "2018-standard")),
+                         ("medium.json", make_batch_course("25medium", 6, "2026-hrd"))]:
+        (input_dir / name).write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+    return input_dir
+
+
+def test_batch_matches_single_exports():
+    print("Testing batch output against one export per course...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir = write_inputs(Path(temp_dir) / "inputs")
+        with contextlib.redirect_stdout(io.StringIO()):
+            for path in sorted(input_dir.iterdir()):
+                assert convert_builder_to_subjects(path, Path(temp_dir) / "single")
+
+        for workers in (1, 2):
+            finished = []
+            results = convert_builder_batch([input_dir], Path(temp_dir) / f"batch{workers}", workers=workers,
+                                            on_result=finished.append)
+            assert [Path(result["path"]).name for result in results] == ["large.json", "medium.json", "small.json"]
+            assert all(result["success"] for result in results), [result["log"] for result in results]
+            assert same_tree(Path(temp_dir) / "single", Path(temp_dir) / f"batch{workers}"), workers
+            assert len(finished) == 3
+            if workers == 1:
+                # 큰 과정부터 변환
+                assert [result["course_code"] for result in finished] == ["25large", "25medium", "25small"]
+
+        large = results[0]
+        assert large["images"] == 1 and large["bytes"] > 0 and "subjects.json" in large["log"]
+    print("  ✅ identical output with 1 and 2 workers")
+
+
+def test_failed_course_reported():
+    print("\nTesting failed course in a batch...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir = write_inputs(Path(temp_dir) / "inputs")
+        (input_dir / "broken.json").write_text('{"courseCode": "25broken", "lessons": [', encoding="utf-8")
+        results = convert_builder_batch([input_dir, input_dir / "small.json"], Path(temp_dir) / "out", workers=1)
+
+    assert len(results) == 4  # 디렉토리와 파일로 중복 지정한 과정은 한 번만
+    broken = [result for result in results if Path(result["path"]).name == "broken.json"][0]
+    assert not broken["success"] and broken["course_code"] is None and "Traceback" in broken["log"]
+    assert sum(result["success"] for result in results) == 3
+
+    table = format_batch_results(results, wall_seconds=1.0)
+    assert "FAIL" in table and "3/4 courses" in table
+    print("  ✅ failure isolated to its course")
+
+
+def test_find_builder_json_files():
+    print("\nTesting input discovery...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir = write_inputs(Path(temp_dir) / "inputs")
+        (input_dir / "notes.txt").write_text("not json", encoding="utf-8")
+        files = find_builder_json_files([input_dir / "small.json", input_dir])
+        assert [path.name for path in files] == ["small.json", "large.json", "medium.json"]
+    print(f"  ✅ {len(files)} files")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Batch Export")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Batch matches single exports", test_batch_matches_single_exports),
+        ("Failed course reported", test_failed_course_reported),
+        ("Input discovery", test_find_builder_json_files),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
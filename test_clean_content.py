@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test BaseExporter._clean_content_for_export: copy-on-write sharing, non-HTML key schema, deep nesting.
+"""
+
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from exporters.base_exporter import BaseExporter, clean_html_for_export
+from exporters.families.standard_exporter import StandardExporter
+
+
+def clean_recursively(content):
+    """이전 구현: 모든 dict/list를 다시 만들고 모든 문자열을 정리"""
+    if isinstance(content, str):
+        return clean_html_for_export(content)
+    elif isinstance(content, list):
+        return [clean_recursively(item) for item in content]
+    elif isinstance(content, dict):
+        return {key: clean_recursively(value) for key, value in content.items()}
+    return content
+
+
+def make_model():
+    return {
+        "_meta": {"sourceTemplateId": "2025-standard", "sourceTheme": "type-1"},
+        "lessonNumber": 1,
+        "lessonTitle": "차시",
+        "lectureVideoUrl": "https://example.com/video.mp4",
+        "practiceVideoUrl": "https://example.com/practice.mp4",
+        "timestamps": ["00:00", "01:30"],
+        "terms": [{"title": "용어", "content": ["<h1>제목</h1>", "<p>설명</p>"]}],
+        "learningContents": ["<p>내용</p>", "<h3>소제목</h3>"],
+        "exercises": [
+            {"type": "multiple", "question": "<p>문항</p>", "options": ["1", "2", "3", "4"], "answer": "2"},
+        ],
+        "summary": ['<p><img class="notion-image" src="../images/a.png"></p>', "<p>정리</p>"],
+        "professorThinkImage": "data:image/png;base64," + "A" * 4096,
+    }
+
+
+def test_matches_recursive_clean():
+    print("Testing result against recursive cleaning...")
+    model = make_model()
+    for exporter in (BaseExporter(), StandardExporter()):
+        assert exporter._clean_content_for_export(model) == clean_recursively(model)
+    for value in ("<h1>a</h1>", "text", 3, None, ["<h1>b</h1>"], {"x": "<h3>c</h3>"}):
+        assert BaseExporter()._clean_content_for_export(value) == clean_recursively(value)
+    print("  ✅ identical output")
+
+
+def test_unchanged_subtrees_shared():
+    print("\nTesting copy-on-write sharing...")
+    model = make_model()
+    cleaned = StandardExporter()._clean_content_for_export(model)
+    assert cleaned is not model
+    # 바뀐 경로만 새로 만듦
+    assert cleaned["terms"] is not model["terms"]
+    assert cleaned["terms"][0]["content"][1] is model["terms"][0]["content"][1]
+    assert cleaned["summary"][1] is model["summary"][1]
+    # 바뀌지 않은 하위 구조와 HTML이 아닌 키는 원본 공유
+    assert cleaned["learningContents"] is not model["learningContents"]  # <h3> 변환
+    assert cleaned["exercises"] is model["exercises"]
+    assert cleaned["_meta"] is model["_meta"] and cleaned["timestamps"] is model["timestamps"]
+    assert cleaned["professorThinkImage"] is model["professorThinkImage"]
+
+    unchanged = {"a": ["<p>x</p>", {"b": "text"}], "c": 1}
+    assert BaseExporter()._clean_content_for_export(unchanged) is unchanged
+    print("  ✅ unchanged subtrees are the original objects")
+
+
+def test_non_html_keys_skipped():
+    print("\nTesting per-family non-HTML key schema...")
+    model = {"answer": "<h1>x</h1>", "practiceImage": "<h1>y</h1>", "question": "<h1>z</h1>"}
+    base = BaseExporter()._clean_content_for_export(model)
+    standard = StandardExporter()._clean_content_for_export(model)
+    assert base["answer"] == "<h1>x</h1>" and standard["answer"] == "<h1>x</h1>"
+    assert base["practiceImage"] == clean_html_for_export("<h1>y</h1>")
+    assert standard["practiceImage"] == "<h1>y</h1>"
+    assert base["question"] == standard["question"] == clean_html_for_export("<h1>z</h1>")
+    assert BaseExporter.NON_HTML_KEYS < StandardExporter.NON_HTML_KEYS
+    print("  ✅ schema keys left as is")
+
+
+def test_deep_nesting():
+    print("\nTesting deep nesting without recursion limit...")
+    depth = sys.getrecursionlimit() * 3
+    root = node = []
+    for _ in range(depth):
+        child = []
+        node.append(child)
+        node = child
+    node.append("<h1>깊은 제목</h1>")
+
+    cleaned = BaseExporter()._clean_content_for_export(root)
+    for _ in range(depth):
+        cleaned = cleaned[0]
+    assert cleaned == [clean_html_for_export("<h1>깊은 제목</h1>")]
+    print(f"  ✅ depth {depth} cleaned")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Exporter Content Cleaning")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Matches recursive clean", test_matches_recursive_clean),
+        ("Unchanged subtrees shared", test_unchanged_subtrees_shared),
+        ("Non-HTML keys skipped", test_non_html_keys_skipped),
+        ("Deep nesting", test_deep_nesting),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
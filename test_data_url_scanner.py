@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test the linear-time data URL scanner used by extract_and_save_images.
+"""
+
+import sys
+import os
+import re
+import io
+import random
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_to_subjects import _scan_data_url_images, extract_and_save_images
+
+# 이전에 사용하던 정규식 (스캐너는 이와 같은 결과를 내야 함)
+REFERENCE_PATTERN = r'<img\s+([^>]*?)src=["\'](data:image/([^;]+);base64,([^"\']+))["\']([^>]*?)>'
+
+PNG = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+
+EDGE_CASES = [
+    "",
+    "<p>이미지 없음</p>",
+    f'<img src="data:image/png;base64,{PNG}">',
+    f"<img  class='a'\tsrc='data:image/jpeg;base64,{PNG}' alt=\"x\">",
+    f'<img\nsrc="data:image/svg+xml;base64,{PNG}"/>',
+    f'<imgsrc="data:image/png;base64,{PNG}">',  # 공백 없음
+    f'<img src="data:image/png;base64,">',  # 빈 데이터
+    f'<img src="data:image/;base64,{PNG}">',  # 빈 타입
+    f'<img src="data:image/png;utf8,{PNG}">',
+    f'<img src="data:image/png;base64,{PNG}',  # 닫는 따옴표/태그 없음
+    f'<img src="data:image/png;base64,{PNG}">{PNG}"',
+    f'<img data-src="x" src="data:image/png;base64,{PNG}" src="data:image/gif;base64,R0lG">',
+    f'<img alt=">" src="data:image/png;base64,{PNG}">',  # src 앞에 '>'
+    f'<img src="http://x/a.png"><img src="data:image/png;base64,{PNG}">',
+    f'<img src="data:image/p>ng;base64,{PNG}">',  # 타입에 '>'
+    f'<img src="data:image/png;base64,{PNG}\'>',  # 다른 따옴표로 닫힘
+    f'<img src=data:image/png;base64,{PNG}>',
+    f'<img <img src="data:image/png;base64,{PNG}">',
+    f'<img src="data:image/png;base64,{PNG}">',  # 유니코드 공백
+    f'<p><img src="data:image/png;base64,{PNG}"><img src="data:image/png;base64,{PNG}" class="b"></p>',
+]
+
+FRAGMENTS = [
+    "<img", "<img ", "<img\t", " ", "src=", "src=\"", "src='", "data:image/", "png", "jpeg", ";",
+    ";base64,", "base64,", PNG[:12], "\"", "'", ">", "<p>", "</p>", "class=\"a\"", "=", "<", "\n",
+]
+
+
+def random_html(rng):
+    """정상 태그를 조각 단위로 섞거나 일부를 빼서 만든 HTML"""
+    parts = []
+    for _ in range(rng.randint(1, 6)):
+        tag = ["<img", rng.choice([" ", "\t", "", "  "]), rng.choice(["", 'alt="a" ', "a>b ", "src=x "]),
+               "src=", rng.choice(["\"", "'", ""]), "data:image/", rng.choice(["png", "", "p;ng"]),
+               rng.choice([";base64,", ";base64", ","]), rng.choice([PNG[:8], "", PNG[:8] + "'"]),
+               rng.choice(["\"", "'", ""]), rng.choice(["", " class=\"b\"", "/"]), rng.choice([">", ""])]
+        if rng.random() < 0.5:
+            del tag[rng.randrange(len(tag))]
+        parts.extend(tag)
+        parts.extend(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 3)))
+    return "".join(parts)
+
+
+def reference_matches(html):
+    return [
+        (m.start(), m.end(), m.group(1), m.group(3), m.group(4), m.group(5))
+        for m in re.finditer(REFERENCE_PATTERN, html)
+    ]
+
+
+def scanner_matches(html):
+    return [
+        (m.start, m.end, m.before_src, m.image_type, m.base64_data, m.after_src)
+        for m in _scan_data_url_images(html)
+    ]
+
+
+def test_edge_cases_match_regex():
+    print("Testing scanner edge cases against the reference regex...")
+    for html in EDGE_CASES:
+        assert scanner_matches(html) == reference_matches(html), html
+    print(f"  ✅ {len(EDGE_CASES)} edge cases identical")
+
+
+def test_random_fragments_match_regex():
+    print("\nTesting scanner on random fragment soup...")
+    rng = random.Random(5)
+    for _ in range(5000):
+        html = random_html(rng)
+        assert scanner_matches(html) == reference_matches(html), repr(html)
+    print("  ✅ 5000 random fragments identical")
+
+
+def test_rewritten_html():
+    print("\nTesting rewritten HTML...")
+    html = (
+        f'<p>앞 <img class="a" src="data:image/png;base64,{PNG}" alt="x"> 뒤</p>'
+        f'<img src="data:image/png;base64,abcde"><img src="http://x/a.png">'
+        f"<img\tsrc='data:image/jpeg;base64,{PNG}'/><img src=\"data:image/png;base64,{PNG}\">"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = extract_and_save_images(html, Path(temp_dir), "25scan", {"count": 0})
+        images = sorted(p.name for p in Path(temp_dir).iterdir())
+    assert result == (
+        '<p>앞 <img class=\'a\' src="../images/25scan_img_001.png" alt="x"> 뒤</p>'
+        '<img src=\'data:image/png;base64,abcde\'><img src=\'http://x/a.png\'>'
+        '<img src="../images/25scan_img_001.png"/><img src="../images/25scan_img_001.png">'
+    ), result
+    assert images == ["25scan_img_001.png"], images
+    print("  ✅ rewritten HTML as expected")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Data URL Scanner")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Edge cases match regex", test_edge_cases_match_regex),
+        ("Random fragments match regex", test_random_fragments_match_regex),
+        ("Rewritten HTML", test_rewritten_html),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
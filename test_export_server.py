@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Test the asyncio export server: api/export.py contract, keep-alive, queue limit, graceful shutdown.
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import socket
+import asyncio
+import tempfile
+import zipfile
+import threading
+import contextlib
+import http.client
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import export_server
+from builder_fixtures import PNG_1x1, data_url, make_course, make_lesson
+from export_server import ExportServer, ZipTarget
+
+
+def make_server_course(code="25srv"):
+    lessons = [make_lesson(i, terms=[{"title": "용어", "content": [f'<p>설명 {i} <img src="{PNG_1x1}"></p>']}])
+               for i in range(1, 4)]
+    return make_course(code, lessons, "2025-standard", courseName="서버")
+
+
+def request_body(code="25srv"):
+    return json.dumps({"courseData": make_server_course(code)}, ensure_ascii=False).encode("utf-8")
+
+
+def read_zip(payload):
+    with zipfile.ZipFile(io.BytesIO(payload)) as zip_file:
+        return {name: zip_file.read(name) for name in zip_file.namelist()}
+
+
+def expected_zip(code="25srv"):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert export_server.convert_course_data(make_server_course(code), target=ZipTarget(zip_file))
+    return read_zip(buffer.getvalue())
+
+
+@contextlib.contextmanager
+def running_server(**options):
+    """별도 스레드의 이벤트 루프에서 서버 실행 -> (server, loop)"""
+    loop = asyncio.new_event_loop()
+    server = ExportServer(port=0, workers=1, **options)
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(10)
+    try:
+        yield server, loop
+    finally:
+        asyncio.run_coroutine_threadsafe(server.shutdown(), loop).result(30)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+        loop.close()
+
+
+def post(connection, body, path="/api/export", headers=None):
+    connection.request("POST", path, body=body, headers=dict(headers or {}, **{"Content-Type": "application/json"}))
+    response = connection.getresponse()
+    return response, response.read()
+
+
+def read_response(sock):
+    """raw 소켓에서 응답 하나를 읽음 -> (상태 줄과 헤더, 본문)"""
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return data, b""
+        data += chunk
+    head, _, body = data.partition(b"\r\n\r\n")
+    length = int(next((line.split(b":")[1] for line in head.split(b"\r\n")
+                       if line.lower().startswith(b"content-length:")), b"0"))
+    while len(body) < length:
+        body += sock.recv(65536)
+    return head.decode("latin-1"), body
+
+
+def test_zip_and_keep_alive():
+    print("Testing ZIP responses over one keep-alive connection...")
+    with tempfile.TemporaryDirectory() as temp_dir, running_server(temp_dir=temp_dir) as (server, _):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=30)
+        response, payload = post(connection, request_body())
+        assert response.status == 200, payload
+        assert response.getheader("Content-Type") == "application/zip"
+        assert response.getheader("Content-Disposition") == 'attachment; filename="25srv.zip"'
+        assert response.getheader("Access-Control-Allow-Origin") == "*"
+        assert read_zip(payload) == expected_zip()
+        first_socket = connection.sock
+
+        # 같은 연결에서 다음 요청 (?stream=1도 같은 ZIP)
+        response, payload = post(connection, request_body("25again"), "/api/export?stream=1")
+        assert response.status == 200 and connection.sock is first_socket
+        assert read_zip(payload) == expected_zip("25again")
+        connection.close()
+        assert server.stats["exports"] == 2
+        # ZIP 임시 파일은 전송 후 삭제
+        assert os.listdir(temp_dir) == []
+    print("  ✅ 2 exports on one connection")
+
+
+def test_error_contract():
+    print("\nTesting error responses...")
+    with running_server() as (server, _):
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=30)
+        response, payload = post(connection, b"{not json")
+        assert response.status == 400 and json.loads(payload)["error"].startswith("Invalid JSON")
+        response, payload = post(connection, b'{"other": 1}')
+        assert response.status == 400 and json.loads(payload)["error"] == "courseData is required"
+        response, payload = post(connection, json.dumps({"courseData": {"courseCode": "25x"}}).encode())
+        assert response.status == 500 and "lessons" in json.loads(payload)["error"]
+
+        connection.request("OPTIONS", "/api/export")
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 200 and response.getheader("Access-Control-Allow-Methods") == "POST, OPTIONS"
+        connection.close()
+
+        for method, path, status in [("GET", "/api/export", 405), ("POST", "/other", 404)]:
+            connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=30)
+            connection.request(method, path)
+            response = connection.getresponse()
+            response.read()
+            assert response.status == status, (method, path, response.status)
+            connection.close()
+    print("  ✅ 400/500/405/404 and CORS preflight")
+
+
+def test_queue_limit():
+    print("\nTesting concurrency cap and queue limit...")
+    body = request_body()
+    with running_server(max_concurrent=1, max_queue=1) as (server, _):
+        # 본문을 아직 보내지 않은 요청 두 개가 자리(변환 1 + 대기 1)를 차지
+        holders = []
+        for _ in range(2):
+            sock = socket.create_connection(("127.0.0.1", server.port), timeout=30)
+            sock.sendall(b"POST /api/export HTTP/1.1\r\nHost: test\r\nContent-Length: %d\r\n\r\n" % len(body))
+            holders.append(sock)
+        deadline = time.time() + 10
+        while server._admitted < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        # 본문을 받기 전에 거절
+        rejected = socket.create_connection(("127.0.0.1", server.port), timeout=30)
+        rejected.sendall(b"POST /api/export HTTP/1.1\r\nHost: test\r\nContent-Length: %d\r\n\r\n" % len(body))
+        head, payload = read_response(rejected)
+        assert head.startswith("HTTP/1.1 503") and "Retry-After: 5" in head, head
+        assert json.loads(payload) == {"error": "Too many exports in progress"}
+        rejected.close()
+
+        for sock in holders:
+            sock.sendall(body)
+        for sock in holders:
+            head, payload = read_response(sock)
+            assert head.startswith("HTTP/1.1 200"), head
+            assert read_zip(payload) == expected_zip()
+            sock.close()
+        assert server.stats == {"exports": 2, "failed": 0, "rejected": 1}
+    print("  ✅ third request rejected with 503, queued requests finished")
+
+
+def test_graceful_shutdown():
+    print("\nTesting graceful shutdown...")
+    body = request_body()
+    with running_server() as (server, loop):
+        idle = http.client.HTTPConnection("127.0.0.1", server.port, timeout=30)
+        response, _ = post(idle, body)
+        assert response.status == 200
+
+        busy = socket.create_connection(("127.0.0.1", server.port), timeout=30)
+        busy.sendall(b"POST /api/export HTTP/1.1\r\nHost: test\r\nContent-Length: %d\r\n\r\n" % len(body))
+        while server._admitted < 1:
+            time.sleep(0.01)
+
+        shutdown = asyncio.run_coroutine_threadsafe(server.shutdown(), loop)
+        time.sleep(0.2)
+        # 새 연결은 받지 않음, idle keep-alive 연결은 닫힘
+        try:
+            socket.create_connection(("127.0.0.1", server.port), timeout=5).close()
+            raise AssertionError("server still accepting connections")
+        except ConnectionRefusedError:
+            pass
+        assert idle.sock.recv(1) == b""
+
+        # 진행 중인 요청은 끝까지 처리하고 연결을 닫음
+        busy.sendall(body)
+        head, payload = read_response(busy)
+        assert head.startswith("HTTP/1.1 200") and "Connection: close" in head, head
+        assert read_zip(payload) == expected_zip()
+        assert busy.recv(1) == b""
+        busy.close()
+        shutdown.result(30)
+    print("  ✅ in-flight export finished, idle connection closed")
+
+
+def test_shutdown_timeout_removes_zip():
+    print("\nTesting shutdown timeout during a conversion...")
+    # 변환이 shutdown_timeout보다 오래 걸리도록 큰 이미지가 많은 과정
+    course = make_server_course("25slow")
+    course["lessons"] = [dict(course["lessons"][0], lessonNumber=i, weekNumber=i,
+                              learningContents=[f'<p><img src="{data_url(os.urandom(300000))}"></p>'])
+                         for i in range(1, 41)]
+    body = json.dumps({"courseData": course}).encode("utf-8")
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            running_server(temp_dir=temp_dir, shutdown_timeout=0.1) as (server, loop):
+        sock = socket.create_connection(("127.0.0.1", server.port), timeout=30)
+        sock.sendall(b"POST /api/export HTTP/1.1\r\nHost: test\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+        # 워커가 ZIP 임시 파일을 만들었으면 변환 중
+        deadline = time.time() + 30
+        while not os.listdir(temp_dir) and time.time() < deadline:
+            time.sleep(0.01)
+        assert os.listdir(temp_dir), "conversion did not start"
+
+        asyncio.run_coroutine_threadsafe(server.shutdown(), loop).result(60)
+        # 응답 없이 연결을 닫고, 변환이 끝난 뒤 ZIP도 삭제
+        assert sock.recv(1) == b""
+        sock.close()
+        assert os.listdir(temp_dir) == []
+    print("  ✅ cancelled export left no temp ZIP")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Export Server")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("ZIP and keep-alive", test_zip_and_keep_alive),
+        ("Error contract", test_error_contract),
+        ("Queue limit", test_queue_limit),
+        ("Graceful shutdown", test_graceful_shutdown),
+        ("Shutdown timeout removes ZIP", test_shutdown_timeout_removes_zip),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
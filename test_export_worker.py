@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test export worker mode: newline-delimited JSON requests on stdin, progress/result messages on stdout.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import subprocess
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import PNG_1x1, make_course, make_lesson, same_tree
+from builder_to_subjects import convert_course_data, serve_export_worker
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_worker_course(code, preset="2025-standard"):
+    lessons = [make_lesson(i, lessons_per_week=2,
+                           terms=[{"title": "용어", "content": [f'<p>설명 {i} <img src="{PNG_1x1}"></p>']}])
+               for i in range(1, 4)]
+    return make_course(code, lessons, preset)
+
+
+def run_worker(requests):
+    """worker 프로세스에 요청을 보내고 stdout 메시지를 모두 읽음"""
+    stdin = "".join(line if isinstance(line, str) else json.dumps(line, ensure_ascii=False) + "\n"
+                    for line in requests)
+    result = subprocess.run([sys.executable, "builder_to_subjects.py", "--worker"], cwd=ROOT, input=stdin,
+                            capture_output=True, text=True, encoding="utf-8", timeout=120)
+    assert result.returncode == 0, result.stderr
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_worker_matches_convert():
+    print("Testing worker output against convert_course_data...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        courses = [make_worker_course("25first"), make_worker_course("25second", "2018-standard")]
+        with contextlib.redirect_stdout(io.StringIO()):
+            for course in courses:
+                assert convert_course_data(course, Path(temp_dir) / "expected")
+        builder_json = Path(temp_dir) / "second.json"
+        builder_json.write_text(json.dumps(courses[1], ensure_ascii=False), encoding="utf-8")
+
+        messages = run_worker([
+            {"id": 1, "courseData": courses[0], "outputDir": str(Path(temp_dir) / "worker")},
+            {"id": 2, "builderJsonPath": str(builder_json), "outputDir": str(Path(temp_dir) / "worker"),
+             "options": {"stream": True, "linkIndexHtml": True}},
+        ])
+        assert messages[0]["type"] == "ready" and messages[0]["pid"] > 0
+        results = [message for message in messages if message["type"] == "result"]
+        assert [result["id"] for result in results] == [1, 2]
+        assert all(result["success"] for result in results), results
+        assert [result["courseCode"] for result in results] == ["25first", "25second"]
+        # 요청마다 progress가 result보다 먼저 오고, result의 log에도 같은 내용이 들어 있음
+        progress = [message for message in messages if message["type"] == "progress" and message["id"] == 1]
+        assert progress and messages.index(progress[-1]) < messages.index(results[0])
+        assert "\n".join(message["message"] for message in progress) == results[0]["log"]
+        assert same_tree(Path(temp_dir) / "expected", Path(temp_dir) / "worker")
+    print(f"  ✅ {len(results)} requests, {len(messages)} messages")
+
+
+def test_bad_requests_keep_worker_alive():
+    print("\nTesting bad requests...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        messages = run_worker([
+            "not json\n",
+            "\n",
+            {"id": "missing"},
+            {"id": "options", "courseData": make_worker_course("25bad"), "options": {"zip": True}},
+            {"id": "broken", "courseData": {"courseCode": "25broken"}, "outputDir": temp_dir},
+            {"id": "ok", "courseData": make_worker_course("25ok"), "outputDir": temp_dir},
+        ])
+    results = [message for message in messages if message["type"] == "result"]
+    assert [result["id"] for result in results] == [None, "missing", "options", "broken", "ok"]
+    assert [result["success"] for result in results] == [False, False, False, False, True]
+    assert "잘못된 요청" in results[0]["error"]
+    assert "builderJsonPath" in results[1]["error"] and "zip" in results[2]["error"]
+    assert results[3]["error"].startswith("KeyError") and "Traceback" in results[3]["log"]
+    print("  ✅ errors reported per request, worker kept running")
+
+
+def test_protocol_stream_in_process():
+    print("\nTesting in-process worker streams...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        requests = io.StringIO(json.dumps({"id": 7, "courseData": make_worker_course("25inproc"), "outputDir": temp_dir}) + "\n")
+        output = io.StringIO()
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            serve_export_worker(requests, output)
+        assert (Path(temp_dir) / "25inproc" / "subjects.json").exists()
+    messages = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert messages[-1] == dict(messages[-1], id=7, type="result", success=True)
+    # 변환 중 print는 모두 progress 메시지로 전달되고 stdout에는 쓰지 않음
+    assert captured.getvalue() == ""
+    print("  ✅ all output went through progress messages")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Export Worker")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Worker matches convert_course_data", test_worker_matches_convert),
+        ("Bad requests keep worker alive", test_bad_requests_keep_worker_alive),
+        ("Protocol stream in process", test_protocol_stream_in_process),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
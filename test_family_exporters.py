@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Test native family exporters: pages identical to builder_to_subjects, family sections, lean component plans.
+"""
+
+import sys
+import os
+import io
+import copy
+import json
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import builder_to_subjects
+import export_templates
+from builder_fixtures import DEFAULT_PROFESSOR, data_url, make_course, make_lesson, practice_week
+from builder_to_subjects import convert_course_data
+from exporters import export_template
+from exporters.template_exporter import get_exporter
+
+WEEK_TITLES = ["주제 1", "주제 2", "현장실습"]
+
+
+def _image(seed):
+    return data_url(f"image-{seed}".encode() * 8)
+
+
+def make_family_course(preset):
+    lessons = [make_lesson(
+        i,
+        lessons_per_week=2,
+        hasOrientation=i == 1,
+        orientation={"videoUrl": "https://example.com/ot.mp4", "subtitlePath": ""},
+        terms=[{"title": "용어", "content": [f'<p>설명 <img src="{_image(i)}"></p>']}],
+        # 모든 차시에 같은 이미지: 한 번만 저장하고 이후 차시는 같은 파일을 참조해야 함
+        learningContents=[f'<p>내용 <img src="{_image("shared")}"></p>', "<h3>소제목</h3>"],
+        hasPractice=i == 2,
+        practiceContent="<ul class='practice'><li><p>실습</p></li></ul>" if i == 2 else "",
+        exercises=[
+            {"type": "boolean", "question": "<p>문항</p>", "answer": "1", "commentary": ""},
+            {"type": "multiple", "question": f'<p>다지 <img src="{_image(f"q{i}")}"></p>', "answer": "2",
+             "options": ["하나", "둘", "셋", "넷"], "commentary": "<p>해설</p>"},
+        ],
+    ) for i in range(1, 5)] + [practice_week(5, 3)]
+    return make_course("25fam", lessons, preset, courseName="계열", templateTheme="",
+                       professor=dict(DEFAULT_PROFESSOR, photo=_image("professor")))
+
+
+def content_model(course, lesson, **meta):
+    return dict(lesson, courseCode=course["courseCode"], courseName=course["courseName"], year=course["year"],
+                professor=course["professor"], weekTitles=WEEK_TITLES,
+                _meta=dict(meta, sourceTemplateId=course["templatePreset"]))
+
+
+def export_native(course, output_dir, **meta):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [export_template(content_model(course, lesson, **meta), output_dir) for lesson in course["lessons"]]
+
+
+def read_lesson(course_dir, lesson_number):
+    lesson_dir = Path(course_dir) / f"{lesson_number:02d}"
+    data = json.loads((lesson_dir / "assets" / "data" / "data.json").read_text(encoding="utf-8"))
+    return data, (lesson_dir / "index.html").read_text(encoding="utf-8")
+
+
+def test_pages_match_builder():
+    print("Testing pages against builder_to_subjects for every preset...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for preset in export_templates.TEMPLATE_PRESETS:
+            course = make_family_course(preset)
+            with contextlib.redirect_stdout(io.StringIO()):
+                assert convert_course_data(copy.deepcopy(course), Path(temp_dir) / preset)
+            native_dir = Path(temp_dir) / preset / "native"
+            export_native(course, native_dir)
+
+            for lesson in course["lessons"]:
+                expected, expected_html = read_lesson(Path(temp_dir) / preset / course["courseCode"], lesson["lessonNumber"])
+                data, index_html = read_lesson(native_dir, lesson["lessonNumber"])
+                assert index_html == expected_html, (preset, lesson["lessonNumber"])
+                for key in expected:
+                    if key != "sections":
+                        assert data[key] == expected[key], (preset, lesson["lessonNumber"], key)
+            # 추출한 이미지 파일도 같은 이름/내용
+            expected_images = {path.name: path.read_bytes()
+                               for path in (Path(temp_dir) / preset / course["courseCode"] / "images").iterdir()}
+            images = {path.name: path.read_bytes() for path in (native_dir / "images").iterdir()}
+            if "intro" not in export_templates.TEMPLATE_PRESETS[preset]["components"]:
+                # builder_to_subjects는 인트로가 없는 템플릿에서도 교수 사진을 저장함
+                expected_images.pop("professor.png")
+            assert images == expected_images, (preset, sorted(images), sorted(expected_images))
+    print(f"  ✅ {len(export_templates.TEMPLATE_PRESETS)} presets identical")
+
+
+def test_images_reused_across_exports():
+    print("\nTesting image reuse across lessons and repeated exports...")
+    course = make_family_course("2025-standard")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        images_dir = Path(temp_dir) / "images"
+        export_native(course, temp_dir)
+        first = sorted(path.name for path in images_dir.iterdir())
+        data, _ = read_lesson(temp_dir, 1)
+        shared = [name for name in first if f"../images/{name}" in json.dumps(data, ensure_ascii=False)]
+
+        # 같은 폴더에 다시 내보내도 이미 있는 이미지를 참조 (새 번호로 저장하지 않음)
+        export_native(course, temp_dir)
+        assert sorted(path.name for path in images_dir.iterdir()) == first
+
+        # 폴더가 바뀌면 (mtime이 다름) 번호/중복 제거 상태를 폴더의 파일로 다시 구성
+        shutil.rmtree(images_dir)
+        export_native(course, temp_dir)
+        assert sorted(path.name for path in images_dir.iterdir()) == first
+        for lesson_number in (2, 3, 4):
+            data, _ = read_lesson(temp_dir, lesson_number)
+            text = json.dumps(data, ensure_ascii=False)
+            assert any(f"../images/{name}" in text for name in shared), lesson_number
+    print(f"  ✅ {len(first)} images, shared image saved once")
+
+
+def test_family_sections():
+    print("\nTesting family sections...")
+    expected = {
+        "2025-standard": ["인트로", "준비하기", "학습하기", "정리하기"],
+        "2026-hrd": ["인트로", "준비하기", "학습하기", "정리하기"],
+        "2022-legal": ["인트로", "들어가기", "학습하기", "점검하기", "정리하기"],
+        "2022-ct": ["학습하기"],
+        "2026-hrc": ["학습하기", "퀴즈"],
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for preset, sections in expected.items():
+            export_native(make_family_course(preset), Path(temp_dir) / preset)
+            data, _ = read_lesson(Path(temp_dir) / preset, 1)
+            assert data["sections"] == sections, (preset, data["sections"])
+
+        # import한 data.json의 sections는 그대로 유지 (round-trip)
+        export_native(make_family_course("2026-hrc"), Path(temp_dir) / "imported",
+                      originalFormat={"sections": ["학습하기", "연습문제"]})
+        data, _ = read_lesson(Path(temp_dir) / "imported", 1)
+        assert data["sections"] == ["학습하기", "연습문제"]
+    print(f"  ✅ {len(expected)} families")
+
+
+def test_lean_component_plans():
+    print("\nTesting lean component plans...")
+    course = make_family_course("2026-hrc")
+    builder_to_subjects.reset_page_component_stats()
+    builder_to_subjects.PAGE_COMPONENT_TIMING = True
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results = export_native(course, temp_dir)
+            images = sorted(path.name for path in (Path(temp_dir) / "images").iterdir())
+        stats = builder_to_subjects.page_component_stats()
+    finally:
+        builder_to_subjects.PAGE_COMPONENT_TIMING = False
+
+    assert results[0]["components"] == ["lecture", "exercise"] and results[0]["pages"] == 2
+    used = {name for name, counts in stats.items() if counts["calls"]}
+    assert used == {"lecture", "exercise"}, used
+    # 인트로가 없으므로 교수 사진도 저장하지 않음, 용어 이미지도 추출하지 않음
+    assert "professor.png" not in images and len(images) == 4, images
+    builder_to_subjects.reset_page_component_stats()
+
+    assert get_exporter("2024-hrd")._get_components("2024-hrd", {})[1] == "exercise_pre"
+    for preset, definition in export_templates.TEMPLATE_PRESETS.items():
+        components = get_exporter(preset)._get_components(preset, {"hasPractice": True})
+        assert components == definition["components"], preset
+    print(f"  ✅ short quiz used {sorted(used)}")
+
+
+def test_practice_week_and_legacy_format():
+    print("\nTesting practice week and 2018 serializer...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = export_native(make_family_course("2018-standard"), temp_dir)
+        data, _ = read_lesson(temp_dir, 5)
+        text = (Path(temp_dir) / "01" / "assets" / "data" / "data.json").read_text(encoding="utf-8")
+    assert data == {"image": "../images/practice.png"} and results[-1]["pages"] == 0
+    assert '"subject" : "계열"' in text
+    print("  ✅ practice week image and ' : ' separator")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Family Exporters")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Pages match builder", test_pages_match_builder),
+        ("Images reused across exports", test_images_reused_across_exports),
+        ("Family sections", test_family_sections),
+        ("Lean component plans", test_lean_component_plans),
+        ("Practice week and legacy format", test_practice_week_and_legacy_format),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Golden output regression suite: byte-exact export output for every TEMPLATE_PRESETS entry and serializer throughput.
+
+Usage:
+    python3 test_golden_output.py                      # golden 파일과 비교 + 직렬화 처리량(MB/s) 출력
+    python3 test_golden_output.py --update             # golden 파일 다시 생성 (출력 변경이 의도된 경우만)
+    python3 test_golden_output.py --add-input course.json [--name NAME]
+                                                       # 실제 Builder JSON을 익명화해서 golden/inputs에 추가
+
+입력: 코드로 만드는 synthetic 과정 + golden/inputs/*.json (익명화된 실제 과정)
+출력: golden/outputs/<입력>/<프리셋>/ 아래에 JSON 파일 원본, <프리셋>.sha256에 export 전체 파일의 해시
+직렬화 함수별 출력 해시: golden/serializers.sha256
+"""
+
+import sys
+import os
+import io
+import re
+import copy
+import json
+import time
+import base64
+import shutil
+import hashlib
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import export_templates
+from builder_to_subjects import DataJsonWriter, convert_course_data, legacy_json_dumps, legacy_subjects_json_dumps
+from exporters.serializers.legacy_serializer import legacy_json_dumps as exporter_legacy_json_dumps
+from exporters.serializers.modern_serializer import modern_json_dumps as exporter_modern_json_dumps
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+INPUTS_DIR = GOLDEN_DIR / "inputs"
+OUTPUTS_DIR = GOLDEN_DIR / "outputs"
+SERIALIZERS_FILE = GOLDEN_DIR / "serializers.sha256"
+
+# 처리량 측정 시 직렬화 함수마다 반복하는 최소 시간 (초)
+MIN_BENCH_SECONDS = 0.2
+
+
+def _image(seed, size, kind="png"):
+    """결정적인 가짜 이미지 data URL (실제 이미지 형식일 필요 없음)"""
+    data = b"".join(hashlib.sha256(f"{seed}:{i}".encode()).digest() for i in range(size // 32 + 1))[:size]
+    return f"data:image/{kind};base64,{base64.b64encode(data).decode()}"
+
+
+def synthetic_course():
+    """
+    이스케이프와 형식 분기를 고르게 거치는 synthetic 과정
+
+    따옴표/역슬래시/탭/줄바꿈/제어 문자, 빈 배열, 한 줄 배열 경계(4개/6개),
+    레거시 연습문제(exercise1/2), 현장실습 주차, import 이미지/자막 포함
+    """
+    lessons = []
+    for i in range(1, 5):
+        week = (i + 1) // 2
+        lesson = {
+            "lessonNumber": i,
+            "weekNumber": week,
+            "weekTitle": f"주제 {week}" if week == 1 else 'C:\\data "주제"\t2',
+            "lessonTitle": f"차시 제목 {i}",
+            "sectionInWeek": ((i - 1) % 2) + 1,
+            "hasOrientation": i == 1,
+            "orientation": {"videoUrl": "https://example.com/ot.mp4", "subtitlePath": ""},
+            "terms": [
+                {"title": "용어\n하나", "content": [f'<p>설명 <img src="{_image(i, 300)}" class="x"></p>', "<p>두번째</p>"]},
+                {"title": "용어 \"둘\"", "content": "<p class=\"t\">문자열 \\ 내용\u2028</p>"},
+                {"title": "", "content": []},
+            ],
+            "learningContents": [
+                "<p>학습 내용 1</p>",
+                "2. 이미 번호",
+                f'<p>그림 <img class="notion-image" src="{_image("c", 200)}"></p>',
+                '<p><img src="../images/25gold_img_001.jpg"></p>',
+                "<h3>소제목</h3><h3>2) 번호있음</h3><h3>또</h3>",
+                "<p>제어\b문자\x01</p>",
+            ][:4 + i % 3],
+            "learningObjectives": ["목표 1", "<p>목표 <b>2</b></p>", "", "넷"][:2 + i % 3],
+            "opinionQuestion": "생각해봅시다?\n\"인용\"",
+            "timestamps": [{"time": "00:10", "title": "시작"}, "01:00", ""],
+            "professorThink": f'<ul class="check-bullet"><li><p>하나</p></li><li>✓ 둘</li></ul><p><img src="{_image("d", 400, "gif")}"></p>',
+            "professorThinkImage": _image("think", 150) if i % 2 else "",
+            "exercises": [
+                {"type": "boolean", "question": "<p>OX 문제</p>", "answer": "1", "commentary": "<p>해설</p>"},
+                {"type": "multiple", "question": f'<p>다지 <img src="{_image(i, 300)}"></p>', "answer": "3",
+                 "commentary": "<p>a</p><p>b</p>",
+                 "options": ["<p>하나</p><p>줄</p>", f'<p><img src="{_image("c", 200)}"></p>', "셋\n넷", ""]},
+            ],
+            "summary": ["<p class='title'>정리</p><ul><li>내용</li></ul>", f"<p><img src=\"{_image(i, 100 + i)}\"></p>", ""],
+            "reference": "참고문헌",
+            "nextWeekTitles": [] if i % 3 else ["다음 주제", "그다음"],
+        }
+        if i == 2:
+            lesson["hasPractice"] = True
+            lesson["learningContents"].append("<ul class='practice'><li><p>실습 <p>하나</p></p></li><li><p></p></li></ul>")
+            lesson["practiceTimestamps"] = [{"time": "00:05", "title": "실습"}]
+        if i == 3:
+            del lesson["exercises"]
+            lesson["exercise1"] = {"question": "<p>레거시 OX</p>", "answer": "2", "commentary": "해설"}
+            lesson["exercise2"] = {"type": "multiple", "question": "레거시 다지", "options": ["<p>a</p>", "b", "c", "d"],
+                                   "answer": "1", "commentary": "<p>c</p>"}
+            lesson["summaryOriginalHtml"] = [f"<p class=\"title\">원본</p><img src=\"{_image('b', 500, 'jpeg')}\">", ""]
+            del lesson["sectionInWeek"]
+        if i == 4:
+            lesson["instructionUrl"] = "http://example.com/inst.zip"
+            lesson["objectivesDescription"] = "설명"
+            lesson["termScript"] = "스크립트"
+        lessons.append(lesson)
+    lessons.append({"lessonNumber": 5, "weekNumber": 3, "isPracticeWeek": True,
+                    "practiceImage": "../images/practice.png", "lessonTitle": "", "weekTitle": "현장실습"})
+    return {
+        "courseCode": "25gold",
+        "courseName": "골든 \"과정\"\t탭",
+        "courseType": "general",
+        "year": "2025",
+        "templateTheme": "type-2",
+        "professor": {
+            "name": "홍길동",
+            "photo": f'<img src="{_image("prof", 600)}">',
+            "education": ["학사", "석사"],
+            "career": [{"period": "2020~", "description": "교수"}, "문자열 경력", {"period": "", "description": ""}],
+        },
+        "lessons": lessons,
+        "importedImages": {"../images/25gold_img_001.jpg": _image("imported", 250, "jpeg")},
+        "importedSubtitles": {"25gold_01.vtt": "WEBVTT\n\n00:00.000 --> 00:01.000\n안녕"},
+        "examWeeks": [{"weekNumber": 8, "weekTitle": "중간고사"}],
+    }
+
+
+# 익명화에서 그대로 두는 키 (형식 분기에 쓰이는 값)
+_SANITIZE_KEEP_KEYS = frozenset({
+    "templatePreset", "templateTheme", "courseType", "year", "type", "answer",
+    "lessonNumber", "weekNumber", "sectionInWeek", "time",
+})
+_DATA_URL = re.compile(r"data:image/([a-zA-Z0-9.+-]+);base64,[A-Za-z0-9+/=\s]*")
+# 그대로 두는 조각: 태그, HTML 엔티티, URL scheme
+_KEEP_TOKEN = re.compile(r"<[^>]*>|&#?[A-Za-z0-9]+;|[a-z]+://")
+_TEXT_ATTRIBUTE = re.compile(r"""\b(alt|title)=(["'])(.*?)\2""")
+
+
+def _sanitize_text(text):
+    # 글자만 바꾸고 숫자/공백/구두점(따옴표, 역슬래시 포함)은 유지
+    return "".join("가" if "\uac00" <= ch <= "\ud7a3" else "x" if ch.isalpha() else ch for ch in text)
+
+
+def _sanitize_string(value, images):
+    def image(match):
+        key = match.group(0)
+        if key not in images:
+            images[key] = _image(f"sanitized-{len(images)}", 64, match.group(1))
+        return images[key]
+
+    value = _DATA_URL.sub(image, value)
+    parts = []
+    position = 0
+    for match in _KEEP_TOKEN.finditer(value):
+        parts.append(_sanitize_text(value[position:match.start()]))
+        # 태그 구조와 속성(이미지 경로, class, style)은 유지하고 alt/title 글자만 바꿈
+        parts.append(_TEXT_ATTRIBUTE.sub(
+            lambda m: f"{m.group(1)}={m.group(2)}{_sanitize_text(m.group(3))}{m.group(2)}", match.group(0)))
+        position = match.end()
+    parts.append(_sanitize_text(value[position:]))
+    return "".join(parts)
+
+
+def sanitize_course(value, images=None, key=None):
+    """
+    실제 Builder JSON 익명화: 글자를 '가'/'x'로 바꾸고 base64 이미지를 작은 가짜 이미지로 교체
+
+    HTML 구조, 엔티티, 키, 숫자, 구두점, 형식 분기에 쓰이는 값은 유지하므로 직렬화 경로는 원본과 같음
+    """
+    if images is None:
+        images = {}
+    if isinstance(value, dict):
+        return {k: sanitize_course(v, images, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [sanitize_course(item, images, key) for item in value]
+    if isinstance(value, str) and key not in _SANITIZE_KEEP_KEYS:
+        return _sanitize_string(value, images)
+    return value
+
+
+def iter_inputs():
+    """(입력 이름, Builder JSON) 목록"""
+    yield "synthetic", synthetic_course()
+    for path in sorted(INPUTS_DIR.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            yield path.stem, json.load(f)
+
+
+def export_files(course, preset):
+    """프리셋으로 export한 파일 {상대경로: 바이트}"""
+    course = copy.deepcopy(course)
+    course["templatePreset"] = preset
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert convert_course_data(course, temp_dir), preset
+        return {
+            path.relative_to(temp_dir).as_posix(): path.read_bytes()
+            for path in sorted(Path(temp_dir).rglob("*")) if path.is_file()
+        }
+
+
+def manifest_text(files):
+    return "".join(f"{hashlib.sha256(data).hexdigest()}  {name}\n" for name, data in sorted(files.items()))
+
+
+def iter_exports():
+    """(입력 이름, 프리셋, export 파일) 목록"""
+    for input_name, course in iter_inputs():
+        for preset in export_templates.TEMPLATE_PRESETS:
+            yield input_name, preset, export_files(course, preset)
+
+
+def _data_json_writer(obj, legacy, use_space_separator=True):
+    if not isinstance(obj, dict) or "pages" not in obj:
+        return None
+    fp = io.StringIO()
+    writer = DataJsonWriter(fp, {key: value for key, value in obj.items() if key != "pages"},
+                            legacy=legacy, use_space_separator=use_space_separator)
+    for page in obj["pages"]:
+        writer.emit(page)
+    writer.close()
+    return fp.getvalue()
+
+
+# 직렬화 함수: payload -> 문자열 (해당 없는 payload는 None)
+SERIALIZERS = {
+    "legacy_json_dumps(' : ')": legacy_json_dumps,
+    "legacy_json_dumps(': ')": lambda obj: legacy_json_dumps(obj, use_space_separator=False),
+    "json.dumps(indent=2)": lambda obj: json.dumps(obj, ensure_ascii=False, indent=2),
+    "DataJsonWriter(indent=2)": lambda obj: _data_json_writer(obj, legacy=False),
+    "DataJsonWriter(' : ')": lambda obj: _data_json_writer(obj, legacy=True),
+    "DataJsonWriter(': ')": lambda obj: _data_json_writer(obj, legacy=True, use_space_separator=False),
+    "legacy_subjects_json_dumps": lambda obj: legacy_subjects_json_dumps(obj) if "subjects" in obj else None,
+    "exporters legacy_json_dumps": exporter_legacy_json_dumps,
+    "exporters modern_json_dumps": exporter_modern_json_dumps,
+}
+
+
+def collect_payloads(exports):
+    """export된 JSON 파일을 다시 읽은 payload {이름: 객체} (JSON으로 읽을 수 없는 파일은 제외)"""
+    payloads = {}
+    for input_name, preset, files in exports:
+        for name, data in files.items():
+            if name.endswith(".json"):
+                try:
+                    payloads[f"{input_name}/{preset}/{name}"] = json.loads(data)
+                except ValueError:
+                    pass  # 2018 subjects.json은 제목을 이스케이프하지 않음
+    return payloads
+
+
+def serializer_digests(payloads):
+    """직렬화 함수 × export(입력/프리셋)별로 출력 전체를 이어 붙인 해시"""
+    lines = []
+    for serializer, function in SERIALIZERS.items():
+        digests = {}
+        for name, payload in payloads.items():
+            text = function(payload)
+            if text is not None:
+                export_name = "/".join(name.split("/", 2)[:2])
+                digest = digests.setdefault(export_name, hashlib.sha256())
+                digest.update(f"{name}\0{text}\0".encode("utf-8"))
+        lines.extend(f"{digest.hexdigest()}  {serializer}  {name}\n" for name, digest in digests.items())
+    return "".join(lines)
+
+
+def _first_difference(expected, actual):
+    offset = next((i for i, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+    return f"byte {offset}: expected {expected[offset:offset + 40]!r}, got {actual[offset:offset + 40]!r}"
+
+
+def compare_export(input_name, preset, files):
+    """golden과 다른 점 목록 (없으면 빈 리스트)"""
+    golden_dir = OUTPUTS_DIR / input_name / preset
+    manifest_path = OUTPUTS_DIR / input_name / f"{preset}.sha256"
+    if not manifest_path.exists():
+        return [f"{input_name}/{preset}: golden 없음 (--update로 생성)"]
+
+    differences = []
+    expected_manifest = manifest_path.read_text(encoding="utf-8").splitlines()
+    actual_manifest = manifest_text(files).splitlines()
+    if expected_manifest != actual_manifest:
+        expected_names = {line.split("  ", 1)[1]: line for line in expected_manifest}
+        actual_names = {line.split("  ", 1)[1]: line for line in actual_manifest}
+        for name in sorted(set(expected_names) | set(actual_names)):
+            if name not in actual_names:
+                differences.append(f"{input_name}/{preset}/{name}: 출력 없음")
+            elif name not in expected_names:
+                differences.append(f"{input_name}/{preset}/{name}: 새 파일")
+            elif expected_names[name] != actual_names[name]:
+                golden_file = golden_dir / name
+                detail = _first_difference(golden_file.read_bytes(), files[name]) if golden_file.exists() else "hash"
+                differences.append(f"{input_name}/{preset}/{name}: {detail}")
+    return differences
+
+
+def update_goldens():
+    if OUTPUTS_DIR.exists():
+        shutil.rmtree(OUTPUTS_DIR)
+    exports = list(iter_exports())
+    for input_name, preset, files in exports:
+        golden_dir = OUTPUTS_DIR / input_name / preset
+        for name, data in files.items():
+            if name.endswith(".json"):
+                path = golden_dir / name
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+        (OUTPUTS_DIR / input_name / f"{preset}.sha256").write_text(manifest_text(files), encoding="utf-8")
+    SERIALIZERS_FILE.write_text(serializer_digests(collect_payloads(exports)), encoding="utf-8")
+    print(f"✅ golden {len(exports)}개 export 갱신: {OUTPUTS_DIR}")
+
+
+def add_input(path, name=None):
+    with open(path, encoding="utf-8") as f:
+        course = sanitize_course(json.load(f))
+    INPUTS_DIR.mkdir(parents=True, exist_ok=True)
+    target = INPUTS_DIR / f"{name or Path(path).stem}.json"
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(course, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"✅ 익명화한 입력 저장: {target} (--update로 golden 생성)")
+
+
+_EXPORTS = None
+
+
+def _exports():
+    global _EXPORTS
+    if _EXPORTS is None:
+        _EXPORTS = list(iter_exports())
+    return _EXPORTS
+
+
+def test_all_presets_covered():
+    print("Testing golden inputs cover every preset...")
+    names = [name for name, _ in iter_inputs()]
+    assert "synthetic" in names and len(names) >= 2, names
+    for input_name in names:
+        for preset in export_templates.TEMPLATE_PRESETS:
+            assert (OUTPUTS_DIR / input_name / f"{preset}.sha256").exists(), f"{input_name}/{preset} golden 없음"
+    print(f"  ✅ {len(names)} inputs × {len(export_templates.TEMPLATE_PRESETS)} presets")
+
+
+def test_export_outputs_match():
+    print("\nTesting export output against golden files...")
+    differences = []
+    total = 0
+    for input_name, preset, files in _exports():
+        differences.extend(compare_export(input_name, preset, files))
+        total += len(files)
+    assert not differences, "\n".join(differences[:20])
+    print(f"  ✅ {total} files byte-identical")
+
+
+def test_serializer_outputs_match():
+    print("\nTesting serializer output against golden digests...")
+    expected = SERIALIZERS_FILE.read_text(encoding="utf-8").splitlines()
+    actual = serializer_digests(collect_payloads(_exports())).splitlines()
+    differences = sorted(set(expected) ^ set(actual))
+    assert not differences, "\n".join(differences[:20])
+    print(f"  ✅ {len(actual)} serializer outputs byte-identical")
+
+
+def test_serializer_throughput(min_seconds=MIN_BENCH_SECONDS):
+    print("\nMeasuring serializer throughput...")
+    payloads = list(collect_payloads(_exports()).values())
+    print(f"  {'serializer':<30} {'MB':>8} {'MB/s':>8}")
+    for serializer, function in SERIALIZERS.items():
+        applicable = [payload for payload in payloads if function(payload) is not None]
+        size = sum(len(function(payload).encode("utf-8")) for payload in applicable)
+        rounds = 0
+        start = time.perf_counter()
+        while True:
+            for payload in applicable:
+                function(payload)
+            rounds += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+        megabytes = size * rounds / 1e6
+        assert megabytes > 0, serializer
+        print(f"  {serializer:<30} {megabytes:>8.2f} {megabytes / elapsed:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="golden output regression + 직렬화 처리량")
+    parser.add_argument("--update", action="store_true", help="golden 파일 다시 생성")
+    parser.add_argument("--add-input", metavar="BUILDER_JSON", help="Builder JSON을 익명화해서 golden/inputs에 추가")
+    parser.add_argument("--name", help="--add-input으로 저장할 입력 이름 (기본값: 파일 이름)")
+    parser.add_argument("--min-seconds", type=float, default=MIN_BENCH_SECONDS,
+                        help=f"직렬화 함수마다 측정하는 최소 시간 (기본값: {MIN_BENCH_SECONDS})")
+    args = parser.parse_args()
+
+    if args.add_input:
+        add_input(args.add_input, args.name)
+        return
+    if args.update:
+        update_goldens()
+        return
+
+    print("=" * 60)
+    print("Testing Golden Output")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("All presets covered", test_all_presets_covered),
+        ("Export outputs match", test_export_outputs_match),
+        ("Serializer outputs match", test_serializer_outputs_match),
+        ("Serializer throughput", lambda: test_serializer_throughput(args.min_seconds)),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Test the bounded memo cache for cleaned HTML fragments (HtmlFragmentCache) and batched lesson cleaning.
+"""
+
+import sys
+import os
+import io
+import tempfile
+import contextlib
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import builder_to_subjects
+from builder_fixtures import data_url, make_course, make_lesson, read_tree
+from builder_to_subjects import (
+    HTML_FRAGMENT_CACHE,
+    HTML_VARIANT_BUILDER,
+    HtmlFragmentCache,
+    _clean_html_for_export_regex,
+    clean_html_for_export,
+    clean_html_fragments,
+    convert_course_data,
+)
+from exporters import base_exporter
+
+IMAGE = data_url(b"fragment-cache" * 20)
+
+
+class CountingCleaner:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, html):
+        self.calls += 1
+        return _clean_html_for_export_regex(html)
+
+
+def make_memo_course():
+    # 차시마다 같은 조각을 반복해서 캐시 적중을 확인
+    lessons = [make_lesson(
+        i,
+        terms=[{"title": "용어", "content": ["<p>공통 용어 설명</p>"]}],
+        learningContents=['<p class="title">공통 내용</p>', f"<h3>소제목 {i}</h3>"],
+        learningObjectives=["<p>공통 목표를 이해한다.</p>"],
+        professorThink=f'<p>생각 <img src="{IMAGE}"></p>',
+        exercises=[{"type": "boolean", "question": "<p>공통 문항</p>", "answer": "1",
+                    "commentary": "<p>공통 <b>해설</b></p>"}],
+        summary=["<p>공통 정리</p>"],
+    ) for i in range(1, 4)]
+    return make_course("25memo", lessons, "2025-standard", courseName="메모")
+
+
+def export_tree(course):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert convert_course_data(course, temp_dir)
+        return read_tree(temp_dir)
+
+
+def test_repeated_fragments_hit():
+    print("Testing repeated fragments are cleaned once...")
+    cache = HtmlFragmentCache()
+    cleaner = CountingCleaner()
+    html = '<p class="title">정리</p><ul class="check-bullet"><li>항목</li></ul>'
+    results = [cache.clean(html, HTML_VARIANT_BUILDER, cleaner) for _ in range(5)]
+    assert results == [_clean_html_for_export_regex(html)] * 5
+    assert cleaner.calls == 1
+    assert cache.stats()["hits"] == 4 and cache.stats()["misses"] == 1
+
+    # variant가 다르면 별도 항목
+    cache.clean(html, "exporter", cleaner)
+    assert cleaner.calls == 2
+    print("  ✅ 5 calls, 1 clean")
+
+
+def test_base64_and_plain_text_bypass():
+    print("\nTesting fragments excluded from the cache...")
+    cache = HtmlFragmentCache()
+    cleaner = CountingCleaner()
+    fragments = [
+        f'<p><img src="{IMAGE}"></p>',
+        "텍스트만 있는 조각",
+        "<p>" + "긴 조각 " * 1000 + "</p>",
+    ]
+    cache.max_fragment_bytes = 4096
+    for html in fragments:
+        cache.clean(html, HTML_VARIANT_BUILDER, cleaner)
+        cache.clean(html, HTML_VARIANT_BUILDER, cleaner)
+    assert cleaner.calls == 6
+    assert cache.stats()["entries"] == 0 and cache.stats()["bypassed"] == 6
+
+    # max_bytes=0이면 캐시 사용 안 함
+    disabled = HtmlFragmentCache(max_bytes=0)
+    disabled.clean("<p>a</p>", HTML_VARIANT_BUILDER, cleaner)
+    assert disabled.stats()["entries"] == 0
+    print(f"  ✅ {len(fragments)} fragments bypassed")
+
+
+def test_byte_bound_evicts_lru():
+    print("\nTesting byte bound and LRU eviction...")
+    cache = HtmlFragmentCache(max_bytes=4096)
+    cleaner = CountingCleaner()
+    fragments = [f'<p class="n{i}">{"내용" * 40}</p>' for i in range(40)]
+    for html in fragments:
+        cache.clean(html, HTML_VARIANT_BUILDER, cleaner)
+        # 첫 조각은 계속 사용하므로 남아 있어야 함
+        cache.clean(fragments[0], HTML_VARIANT_BUILDER, cleaner)
+    stats = cache.stats()
+    assert 0 < stats["bytes"] <= 4096, stats
+    assert stats["evictions"] > 0 and stats["entries"] < len(fragments)
+
+    calls = cleaner.calls
+    cache.clean(fragments[0], HTML_VARIANT_BUILDER, cleaner)
+    assert cleaner.calls == calls
+    cache.clean(fragments[1], HTML_VARIANT_BUILDER, cleaner)
+    assert cleaner.calls == calls + 1
+    print(f"  ✅ {stats['entries']} entries, {stats['bytes']} bytes, {stats['evictions']} evicted")
+
+
+def test_version_in_key():
+    print("\nTesting transform version is part of the key...")
+    cache = HtmlFragmentCache()
+    cleaner = CountingCleaner()
+    version = builder_to_subjects.HTML_CLEAN_VERSION
+    try:
+        cache.clean("<p>a</p>", HTML_VARIANT_BUILDER, cleaner)
+        builder_to_subjects.HTML_CLEAN_VERSION = version + 1
+        cache.clean("<p>a</p>", HTML_VARIANT_BUILDER, cleaner)
+    finally:
+        builder_to_subjects.HTML_CLEAN_VERSION = version
+    assert cleaner.calls == 2
+    print("  ✅ new version cleans again")
+
+
+def test_cache_across_exports():
+    print("\nTesting output with the shared cache across exports...")
+    course = make_memo_course()
+    max_bytes = HTML_FRAGMENT_CACHE.max_bytes
+    try:
+        HTML_FRAGMENT_CACHE.max_bytes = 0
+        expected = export_tree(course)
+        HTML_FRAGMENT_CACHE.max_bytes = max_bytes
+        HTML_FRAGMENT_CACHE.clear()
+        first = export_tree(course)
+        within = HTML_FRAGMENT_CACHE.stats()
+        second = export_tree(course)
+        across = HTML_FRAGMENT_CACHE.stats()
+    finally:
+        HTML_FRAGMENT_CACHE.max_bytes = max_bytes
+    assert first == expected and second == expected
+    # 차시 간 공통 문구는 첫 export에서도 재사용, 두 번째 export는 모두 재사용
+    assert within["hits"] > 0
+    assert across["misses"] == within["misses"] and across["hits"] > within["hits"]
+    # base64 이미지가 있는 조각은 매번 새로 정리되어 이미지 번호가 유지됨
+    assert "25memo/images/25memo_img_001.png" in second
+    print(f"  ✅ identical output, {within['hits']} hits in first export, {across['hits'] - within['hits']} in second")
+
+
+def test_exporter_variant_uses_cache():
+    print("\nTesting exporters.base_exporter shares the cache...")
+    html = "<h1>대제목 캐시</h1><h3 class='x'>소제목</h3>"
+    expected = base_exporter._clean_html_for_export_regex(html)
+    before = HTML_FRAGMENT_CACHE.stats()["hits"]
+    assert base_exporter.clean_html_for_export(html) == expected
+    assert base_exporter.clean_html_for_export(html) == expected
+    assert HTML_FRAGMENT_CACHE.stats()["hits"] == before + 1
+    # builder 정리 결과와 섞이지 않음
+    assert clean_html_for_export(html) == _clean_html_for_export_regex(html) != expected
+    print("  ✅ exporter results cached separately")
+
+
+def test_batch_cleaning():
+    print("\nTesting batched fragment cleaning...")
+    fragments = [
+        '<p class="title">정리</p>', "", None, "텍스트", "<h3>제목</h3><h3>또</h3>",
+        '<p class="title">정리</p>', f'<p><img src="{IMAGE}"></p>',
+        "<ul class='practice'><li><p>실습</p></li></ul>",
+    ]
+    assert clean_html_fragments(fragments) == [clean_html_for_export(html) for html in fragments]
+
+    # 같은 조각은 한 번만 정리 (캐시 제외 대상도 포함)
+    cache = HtmlFragmentCache()
+    cleaner = CountingCleaner()
+    batch = [f for f in fragments if f] * 3
+    assert cache.clean_many(batch, HTML_VARIANT_BUILDER, cleaner) == [_clean_html_for_export_regex(f) for f in batch]
+    assert cleaner.calls == len(set(batch))
+    assert cache.clean_many(batch, HTML_VARIANT_BUILDER, cleaner) == [_clean_html_for_export_regex(f) for f in batch]
+    assert cache.stats()["hits"] == 3 and cleaner.calls == len(set(batch)) + 2
+
+    # 차시 단위로 미리 정리해도 출력(이미지 번호 포함)은 조각마다 정리한 것과 같음
+    course = make_memo_course()
+    lesson_fragments = builder_to_subjects._lesson_fragments
+    try:
+        builder_to_subjects._lesson_fragments = lambda lesson: contextlib.nullcontext()
+        expected = export_tree(course)
+    finally:
+        builder_to_subjects._lesson_fragments = lesson_fragments
+    assert export_tree(course) == expected
+    print(f"  ✅ {len(fragments)} fragments, {len(set(batch))} cleaned once, export identical")
+
+
+def main():
+    print("=" * 60)
+    print("Testing HTML Fragment Cache")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Repeated fragments hit", test_repeated_fragments_hit),
+        ("Base64 and plain text bypass", test_base64_and_plain_text_bypass),
+        ("Byte bound evicts LRU", test_byte_bound_evicts_lru),
+        ("Version in key", test_version_in_key),
+        ("Cache across exports", test_cache_across_exports),
+        ("Exporter variant uses cache", test_exporter_variant_uses_cache),
+        ("Batch cleaning", test_batch_cleaning),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass tokenizer behind clean_html_for_export against the regex implementation.
+"""
+
+import sys
+import os
+import random
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_to_subjects import (
+    HTML_VARIANT_BUILDER,
+    HTML_VARIANT_EXPORTER,
+    _clean_html_for_export_regex,
+    clean_html_for_export,
+    clean_html_single_pass,
+)
+from exporters import base_exporter
+
+PNG = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+
+VARIANTS = [
+    (HTML_VARIANT_BUILDER, _clean_html_for_export_regex, clean_html_for_export),
+    (HTML_VARIANT_EXPORTER, base_exporter._clean_html_for_export_regex, base_exporter.clean_html_for_export),
+]
+
+# test_json_fix.py, test_round_trip_fixes.py의 입력
+EXISTING_TEST_CASES = [
+    '<img src="../images/test.png">',
+    '<p class="title">Test</p>',
+    '<ul class="sub-list"><li>Item</li></ul>',
+    '<div style="color: red;">Text</div>',
+    '<p class="title">Extended ACL</p><ul><li>Test item</li></ul>',
+    "<ul class='practice'><li><p>Item 1</p></li><li><p>Item 2</p></li></ul>",
+    "<ul class='practice'><li><p>First paragraph</p><p>Second paragraph</p></li></ul>",
+    "<ul class='practice'><li><p><p>Nested</p></p></li></ul>",
+    "<ul class='practice'><li><p></p><p>Content</p><p></p></li></ul>",
+    "<ul class='practice'><li><p>Part 1</p> Middle <p>Part 2</p></li></ul>",
+    "<p class='title'>Title</p>",
+    "<p class='main-title'><strong>Main Title</strong></p>",
+    "<div class='practice'><ul><li>Item</li></ul></div>",
+    "<h1>Main Title</h1>",
+    "<h1 class='heading'>Title with class</h1>",
+    "<h1>Main Title</h1><p>Paragraph</p><h1>Another Title</h1>",
+    "<h1><em>Italic Title</em></h1>",
+]
+
+# 에디터(TinyMCE)가 만드는 형태의 조각
+EDITOR_FRAGMENTS = [
+    "<p>학습 내용 1</p>",
+    "<p>목표 <b>2</b></p>",
+    "<p class='title'>정리</p><ul><li>내용</li></ul>",
+    '<p style="text-align: center;"><span style="color: #e03e2d;">강조</span> 문장</p>',
+    '<p><a href="https://example.com/a?b=1&amp;c=2" target="_blank" rel="noopener">링크</a></p>',
+    "<h3>소제목</h3><h3>2) 번호있음</h3><h3>또</h3>",
+    '<h3 class="sub">속성 있는 제목</h3><h3>\n줄바꿈 제목\n</h3>',
+    "<h1>대제목</h1><h3>  1)\t번호 </h3>",
+    '<ul class="check-bullet"><li><p>하나</p></li><li>✓ 둘</li><li>  <p>셋</p>  </li></ul>',
+    "<ul class='check-bullet'></ul><ul class='check-bullet'><li></li></ul>",
+    "<ul class='practice'><li><p>실습 <p>하나</p></p></li><li><p></p></li></ul>",
+    '<ul class="practice" id="p1"><li class="x"> <p>A</p> </li>사이<li><strong>B</strong></li></ul><p>뒤</p>',
+    f'<p>그림 <img class="notion-image" src="data:image/png;base64,{PNG}" alt="그림"></p>',
+    f'<p><img src="data:image/png;base64,{PNG}" data-original-src="../images/25test_img_001.jpg"></p>',
+    f'<img data-original-src="../images/a.png" class="notion-image" src="data:image/png;base64,{PNG}" width="300">',
+    '<img src="" data-original-src=""><img data-src="q" src="r" data-original-src="z.png" alt="t">',
+    '<table style="border-collapse: collapse; width: 100%;" border="1"><tbody><tr><td style="width: 50%;">셀</td></tr></tbody></table>',
+    '<p>줄<br>바꿈<br />끝</p><hr><p>&lt;태그&gt; "따옴표" \'작은\' a > b</p>',
+    '<ol><li>순서</li></ol><blockquote>인용</blockquote><pre>코드</pre>',
+    '<p   data-v1="x"   title="t"  >공백</p><input disabled value="v"><P CLASS="u">대문자</P>',
+    '<em\nclass="m">줄바꿈 속성</em><li\tclass="z">탭</li>',
+    "텍스트만 있는 조각",
+    "",
+]
+
+# 정규식이 태그 경계를 넘어 매칭할 수 있어 정규식 구현으로 넘겨야 하는 조각
+FALLBACK_FRAGMENTS = [
+    "<!-- 주석 --><p>a</p>",
+    "<p>1 <3</p>",
+    '<img src=x.png class="notion-image">',
+    '<p title="it\'s">a</p>',
+    '<img alt="a src=" src="b.png">',
+    '<link href="x"><li>a</li>',
+    '<ul class="practice"><li>a</li><ul class="check-bullet"><li>b</li></ul>',
+]
+
+SOUP = [
+    "<p>x</p>", "<p><p>y</p></p>", "</p>", "<li>", "</li>", '<li class="a">', "<ul>", "</ul>",
+    "<ul class='practice'>", '<ul class="practice">', '<ul class="check-bullet">', "<ul class='check-bullet' id=\"x\">",
+    "<h3>", "</h3>", '<h3 class="t">', "<h1>", "</h1>", '<h1 id="a">',
+    f'<img src="data:image/png;base64,{PNG[:12]}=" data-original-src="../images/a.png">',
+    '<img class="notion-image" src="x.png">', "<img data-original-src='../i/b.png' class=\"notion-image\" src=\"y\">",
+    '<img  src="a"   alt="b"/>', "<br>", "<br />", "text", " ", "\n", "1) ", "✓ ", "12)\tx", "a > b", '"q"', "'",
+    '<span style="color: red;" class=\'c\'>', "</span>", '<p class="title">', '<a href="http://x?a=1&b=2" title="t">', "</a>",
+    '<div   data-v1="x" x="y">', '<input disabled value="v">', '<P CLASS="u">', "<strong>", "</strong>", '<em\nclass="m">',
+]
+
+
+def check_fragment(html, expect_single_pass=True):
+    for variant, regex_clean, public_clean in VARIANTS:
+        expected = regex_clean(html)
+        result = clean_html_single_pass(html, variant) if html else html
+        if expect_single_pass:
+            assert result is not None, (variant, html)
+        if result is not None:
+            assert result == expected, (variant, html, result, expected)
+        assert public_clean(html) == expected, (variant, html)
+
+
+def test_existing_cases_match_regex():
+    print("Testing cases from test_json_fix.py / test_round_trip_fixes.py...")
+    for html in EXISTING_TEST_CASES:
+        check_fragment(html)
+    print(f"  ✅ {len(EXISTING_TEST_CASES)} cases identical for both variants")
+
+
+def test_editor_fragments_match_regex():
+    print("\nTesting editor fragments...")
+    for html in EDITOR_FRAGMENTS:
+        check_fragment(html)
+    print(f"  ✅ {len(EDITOR_FRAGMENTS)} fragments identical for both variants")
+
+
+def test_fallback_fragments():
+    print("\nTesting fragments handled by the regex implementation...")
+    for html in FALLBACK_FRAGMENTS:
+        for variant, _, _ in VARIANTS:
+            assert clean_html_single_pass(html, variant) is None, (variant, html)
+        check_fragment(html, expect_single_pass=False)
+    print(f"  ✅ {len(FALLBACK_FRAGMENTS)} fragments fall back to regex")
+
+
+def test_random_soup_matches_regex():
+    print("\nTesting random tag soup...")
+    rng = random.Random(10)
+    fallbacks = 0
+    for _ in range(3000):
+        html = "".join(rng.choice(SOUP) for _ in range(rng.randint(1, 14)))
+        check_fragment(html, expect_single_pass=False)
+        fallbacks += clean_html_single_pass(html) is None
+    print(f"  ✅ 3000 random fragments identical ({fallbacks} via regex)")
+
+
+def test_unpaired_p_in_practice_list():
+    print("\nTesting unpaired <p> in practice list...")
+    # 정규식 구현은 짝이 없는 <p>에서 무한 반복함: 단일 패스는 그대로 남김
+    html = "<ul class='practice'><li><p>a</li></ul>"
+    assert clean_html_for_export(html) == "<div class='practice'><ul><li><p>a</li></ul></div>"
+    print("  ✅ unpaired <p> left in place")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Single-pass HTML Cleaner")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Existing test cases match regex", test_existing_cases_match_regex),
+        ("Editor fragments match regex", test_editor_fragments_match_regex),
+        ("Fallback fragments", test_fallback_fragments),
+        ("Random soup matches regex", test_random_soup_matches_regex),
+        ("Unpaired <p> in practice list", test_unpaired_p_in_practice_list),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test the HTML transform registry: substring preconditions, hit/skip counters and page-level transforms.
+"""
+
+import sys
+import os
+import io
+import re
+import tempfile
+import contextlib
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import make_course, make_lesson
+from builder_to_subjects import (
+    HTML_FRAGMENT_CACHE,
+    HTML_TRANSFORMS,
+    clean_html_for_export,
+    convert_course_data,
+    format_html_transform_stats,
+    html_transform_stats,
+    join_paragraphs,
+    reset_html_transform_stats,
+    strip_paragraph_tags,
+    strip_week_span,
+)
+
+
+def test_skip_without_needle():
+    print("Testing transforms skipped when the precondition substring is missing...")
+    reset_html_transform_stats()
+    HTML_FRAGMENT_CACHE.clear()
+    html = '<p class="title">정리</p><p>본문</p>'
+    # 단일 패스로 정리한 조각도 정규식 구현과 같은 조건으로 집계
+    assert clean_html_for_export(html) == "<p class='title'>정리</p><p>본문</p>"
+
+    stats = html_transform_stats()
+    for name in ("data_original_src", "notion_image", "practice_list", "check_bullet", "h3_to_ol"):
+        assert stats[name] == {"hits": 0, "skips": 1}, (name, stats[name])
+    assert stats["quote_attributes"] == {"hits": 1, "skips": 0}
+    assert stats["regex_fallback"] == {"hits": 0, "skips": 1}
+
+    # '<'가 없는 조각은 정리 자체를 건너뜀
+    assert clean_html_for_export("텍스트만") == "텍스트만"
+    assert html_transform_stats()["clean_html"] == {"hits": 1, "skips": 1}
+    print("  ✅ only quote_attributes ran")
+
+
+def test_hits_and_reset():
+    print("\nTesting hit counters and reset...")
+    reset_html_transform_stats()
+    HTML_FRAGMENT_CACHE.clear()
+    html = "<h3>제목</h3><ul class='practice'><li><p>실습</p></li></ul>"
+    assert clean_html_for_export(html) == (
+        "<ol style='color:#000;margin-bottom: 4px;'>1) 제목</ol><div class='practice'><ul><li>실습</li></ul></div>"
+    )
+    assert clean_html_for_export(html) == clean_html_for_export(html)
+    stats = html_transform_stats()
+    # 두 번째 호출부터는 정리 결과 캐시에서 반환
+    assert stats["clean_html"]["hits"] == 1
+    assert stats["h3_to_ol"]["hits"] == 1 and stats["practice_list"]["hits"] == 1
+    assert stats["check_bullet"] == {"hits": 0, "skips": 1}
+    assert stats["regex_fallback"] == {"hits": 0, "skips": 1}
+
+    # 따옴표 없는 속성은 정규식 구현으로 처리
+    fragment = '<img src=a.png class="notion-image">'
+    assert clean_html_for_export(fragment) == "<img src=a.png class='notion-image'>"
+    stats = html_transform_stats()
+    assert stats["regex_fallback"] == {"hits": 1, "skips": 1}
+    assert stats["notion_image"] == {"hits": 1, "skips": 1}
+
+    reset_html_transform_stats()
+    assert all(counts == {"hits": 0, "skips": 0} for counts in html_transform_stats().values())
+    assert list(html_transform_stats()) == list(HTML_TRANSFORMS)
+    assert format_html_transform_stats().splitlines()[0].split() == ["transform", "hits", "skips", "skipped"]
+    print(f"  ✅ {len(HTML_TRANSFORMS)} transforms registered")
+
+
+def export_stats(course, lesson_workers):
+    """course를 내보낸 뒤 (변환별 횟수, 정리 결과 캐시 횟수)"""
+    reset_html_transform_stats()
+    HTML_FRAGMENT_CACHE.clear()
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+        assert convert_course_data(course, temp_dir, lesson_workers=lesson_workers)
+    return html_transform_stats(), HTML_FRAGMENT_CACHE.stats()
+
+
+def test_lesson_worker_stats():
+    print("\nTesting counters merged from lesson worker processes...")
+    lessons = [make_lesson(
+        i,
+        learningContents=[f"<h3>소제목 {i}</h3><ul class='practice'><li><p>실습 {i}</p></li></ul>"],
+        summary=[f'<ul class="check-bullet"><li>정리 {i}</li></ul>'],
+    ) for i in range(1, 5)]
+    course = make_course("25stats", lessons, "2025-standard")
+
+    for workers in (1, 2):
+        stats, cache = export_stats(course, workers)
+        # 차시마다 다른 조각은 worker 수와 관계없이 한 번씩 정리됨
+        for name in ("h3_to_ol", "practice_list", "check_bullet"):
+            assert stats[name]["hits"] == len(lessons), (workers, name, stats[name])
+        assert stats["clean_html"]["hits"] > 0 and stats["regex_fallback"]["skips"] > 0, (workers, stats)
+        assert cache["misses"] > 0, (workers, cache)
+    print("  ✅ lesson_workers=2 counts match the sequential export")
+
+
+def test_page_transforms_match_regex():
+    print("\nTesting page-level transforms against inline regex...")
+    reset_html_transform_stats()
+    options = [
+        "<p>내용1</p><p>내용2</p>",
+        "<p>내용1</p>\n  <p>내용2</p>",
+        "선택지",
+        "<strong>강조</strong>",
+        '<p><img src="../images/a.png"></p>',
+    ]
+    for option in options:
+        expected = re.sub(r'</?p>', '', re.sub(r'</p>\s*<p>', '<br />', option))
+        assert strip_paragraph_tags(join_paragraphs(option)) == expected, option
+
+    titles = ['<span class="week">1주</span> 네트워크', "2주 보안", "제목"]
+    for title in titles:
+        assert strip_week_span(title) == re.sub(r'<span[^>]*>.*?</span>\s*', '', title), title
+
+    stats = html_transform_stats()
+    assert stats["join_paragraphs"]["skips"] >= 2 and stats["strip_week_span"]["skips"] == 2
+    print(f"  ✅ {len(options)} options, {len(titles)} titles identical")
+
+
+def main():
+    print("=" * 60)
+    print("Testing HTML Transform Registry")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Skip without needle", test_skip_without_needle),
+        ("Hits and reset", test_hits_and_reset),
+        ("Lesson worker stats", test_lesson_worker_stats),
+        ("Page transforms match regex", test_page_transforms_match_regex),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
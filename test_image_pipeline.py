@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Test the export image pipeline (parallel decode/write pool, persistent image store, dedup index,
+imported image path rewriting).
+"""
+
+import sys
+import os
+import io
+import json
+import base64
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import DEFAULT_PROFESSOR, data_url, make_course, make_lesson, read_tree
+from builder_to_subjects import ImageStore, ImportedPathMapping, convert_builder_to_subjects
+
+
+IMG_A = data_url(b"A" * 4000)
+IMG_B = data_url(b"B" * 3000, "jpeg")
+IMG_C = data_url(b"C" * 100, "gif")
+BROKEN = "data:image/png;base64,abcde"  # 잘못된 길이: 디코딩 실패
+
+
+def make_image_course(lesson_count=4):
+    lessons = [make_lesson(
+        i,
+        terms=[{"title": "용어", "content": [
+            f'<p><img src="{IMG_A}"><img src="{data_url(bytes([i]) * 500)}"><img src="{BROKEN}"></p>'
+        ]}],
+        learningContents=[f'<p><img src="{IMG_B}"> <img src="{BROKEN}"></p>'],
+        professorThink=f'<p><img src="{IMG_C}"></p>',
+        professorThinkImage=data_url(bytes([100 + i]) * 50),
+        exercises=[],
+        summary=[f'<p><img src="{IMG_A}"></p>'],
+    ) for i in range(1, lesson_count + 1)]
+    return make_course("25img", lessons, courseName="이미지",
+                       professor={"name": "교수", "photo": IMG_C, "education": [], "career": []},
+                       importedImages={
+                           f"../images/25img_img_{n:03d}.jpg": data_url(bytes([n]) * 300) for n in range(1, 20)
+                       })
+
+
+def export_tree(course, output_dir, **options):
+    path = Path(output_dir) / "course.json"
+    path.write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert convert_builder_to_subjects(path, Path(output_dir) / "out", **options)
+    return read_tree(Path(output_dir) / "out")
+
+
+def test_parallel_pool_matches_sequential():
+    print("Testing parallel image pool against sequential export...")
+    course = make_image_course()
+    with tempfile.TemporaryDirectory() as seq_dir, tempfile.TemporaryDirectory() as par_dir:
+        sequential = export_tree(course, seq_dir, image_workers=1)
+        parallel = export_tree(course, par_dir, image_workers=8)
+
+    assert sorted(sequential) == sorted(parallel)
+    for rel_path, content in sequential.items():
+        assert parallel[rel_path] == content, rel_path
+
+    images = sorted(p for p in sequential if p.startswith("25img/images/"))
+    # 19 imported + A, B, C(professor), 4 per-lesson, think images
+    assert "25img/images/25img_img_020.png" in images
+    assert "25img/images/professor.png" in images
+    print(f"  ✅ {len(sequential)} files identical ({len(images)} images)")
+
+
+def test_image_store_reuse_and_eviction():
+    print("\nTesting persistent image store...")
+    course = make_image_course()
+    with tempfile.TemporaryDirectory() as store_dir, tempfile.TemporaryDirectory() as plain_dir, \
+            tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+        plain = export_tree(course, plain_dir)
+
+        store = ImageStore(store_dir)
+        first = export_tree(course, first_dir, image_store=store)
+        assert first == plain
+        first_hits = store.hits
+
+        # 두 번째 export는 저장소에서 링크만 함 (디코딩 생략)
+        second = export_tree(course, second_dir, image_store=store)
+        assert second == plain
+        assert store.hits > first_hits
+        print(f"  ✅ output unchanged, {store.hits - first_hits} images reused from store")
+
+        # 저장소와 하드링크된 출력 파일을 다시 export해도 저장소 내용은 바뀌지 않아야 함
+        objects = {p: p.read_bytes() for p in Path(store_dir, "objects").rglob("*") if p.is_file()}
+        other = make_image_course(lesson_count=2)
+        other["importedImages"] = {"../images/25img_img_001.jpg": IMG_C}
+        export_tree(other, second_dir)
+        assert all(p.read_bytes() == data for p, data in objects.items())
+        print("  ✅ overwriting linked output does not modify the store")
+
+        # 크기 제한을 넘으면 오래된 이미지부터 삭제
+        small = ImageStore(store_dir, max_bytes=1000)
+        removed = small.evict()
+        total = sum(p.stat().st_size for p in Path(store_dir, "objects").rglob("*") if p.is_file())
+        assert removed > 0 and total <= 1000
+        print(f"  ✅ eviction removed {removed} images (store now {total} bytes)")
+
+
+def test_unified_dedup_index():
+    print("\nTesting unified dedup index...")
+    payload = b"D" * 2000
+    encoded = base64.b64encode(payload).decode()
+    # 같은 이미지를 줄바꿈/padding만 다르게 인코딩
+    wrapped = "data:image/png;base64," + "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+    unpadded = "data:image/png;base64," + data_url(b"E" * 1000).split(",", 1)[1].rstrip("=")
+
+    lesson = make_lesson(
+        1,
+        terms=[{"title": "용어", "content": [f'<p><img src="{wrapped}"><img src="{unpadded}"></p>']}],
+        learningContents=[f'<p><img src="{IMG_A}"><img src="{BROKEN}"></p>'],
+        professorThink="<p>생각</p>",
+        professorThinkImage=IMG_A,
+        exercises=[],
+    )
+    course = make_course("25img", [lesson], courseName="이미지",
+                         professor=dict(DEFAULT_PROFESSOR, photo=data_url(b"E" * 1000)),
+                         importedImages={"../images/25img_img_001.png": data_url(payload)})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "course.json"
+        path.write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            assert convert_builder_to_subjects(path, Path(temp_dir) / "out")
+        course_dir = Path(temp_dir) / "out" / "25img"
+        images = sorted(p.name for p in (course_dir / "images").iterdir())
+        data = (course_dir / "01" / "assets" / "data" / "data.json").read_text(encoding="utf-8")
+
+    # Import된 이미지, 교수 사진, 본문 이미지가 같으면 한 번만 저장
+    assert images == ["25img_img_001.png", "25img_img_002.png", "professor.png"], images
+    assert "../images/25img_img_001.png" in data
+    assert "../images/professor.png" in data
+    # 교수님 생각 이미지는 본문 이미지 파일을 재사용
+    assert "professor-02.png" not in data
+    assert data.count("../images/25img_img_002.png") == 2
+    # 디코딩 실패한 이미지는 원본 유지
+    assert BROKEN in data
+    assert "중복 이미지 3회 재사용 (6.8KB 절약)" in log.getvalue(), log.getvalue()
+    print(f"  ✅ {len(images)} images written, duplicates reused across sources")
+
+
+def rewrite_sequentially(html, mapping):
+    """매핑마다 str.replace를 반복하던 이전 구현"""
+    for original_path, actual_path in mapping.items():
+        if original_path != actual_path and original_path in html:
+            html = html.replace(f'src="{original_path}"', f'src="{actual_path}"')
+            html = html.replace(f"src='{original_path}'", f"src='{actual_path}'")
+    return html
+
+
+def test_imported_path_rewrite():
+    print("\nTesting imported image path rewriting...")
+    mapping = {f"../images/25img_img_{n:03d}.jpg": f"../images/25img_img_{n:03d}.png" for n in range(1, 1000)}
+    mapping["../images/same.png"] = "../images/same.png"
+    # 교체된 경로가 뒤의 매핑의 원본이면 이어서 교체됨
+    mapping["../images/25img_img_500.png"] = "../images/25img_img_500.gif"
+    html = (
+        '<p><img src="../images/25img_img_003.jpg"> <img src=\'../images/25img_img_999.jpg\'>'
+        ' ../images/25img_img_004.jpg <img src="../images/25img_img_0031.jpg">'
+        '<img src="../images/25img_img_500.jpg"><img src="../images/same.png"></p>'
+    )
+    rewriter = ImportedPathMapping(mapping)
+    assert rewriter.rewrite(html) == rewrite_sequentially(html, mapping)
+    assert "../images/25img_img_500.gif" in rewriter.rewrite("<img src='../images/25img_img_500.jpg'>")
+    assert rewriter.rewritten_paths == 4 and rewriter.rewritten_fragments == 2
+    assert rewriter.rewrite("<p>이미지 없음</p>") == "<p>이미지 없음</p>"
+
+    # 교체한 뒤 매핑을 바꾸면 교체 테이블을 다시 만듦
+    late = ImportedPathMapping()
+    assert late.rewrite('<img src="../images/late.jpg">') == '<img src="../images/late.jpg">'
+    late["../images/late.jpg"] = "../images/late.png"
+    assert late.rewrite('<img src="../images/late.jpg">') == '<img src="../images/late.png">'
+    late.update({"../images/more.jpg": "../images/more.gif"})
+    assert late.rewrite('<img src="../images/more.jpg">') == '<img src="../images/more.gif">'
+    late.setdefault("../images/other.jpg", "../images/other.webp")
+    assert late.rewrite('<img src="../images/other.jpg">') == '<img src="../images/other.webp">'
+    del late["../images/late.jpg"]
+    assert late.rewrite('<img src="../images/late.jpg">') == '<img src="../images/late.jpg">'
+    late |= {"../images/late.jpg": "../images/late.bmp"}
+    assert late.rewrite('<img src="../images/late.jpg">') == '<img src="../images/late.bmp">'
+    late.pop("../images/late.jpg")
+    late.clear()
+    assert late.rewrite('<img src="../images/more.jpg">') == '<img src="../images/more.jpg">'
+
+    # export: importedImages의 .jpg가 실제 타입(png)으로 저장되고 본문 참조가 교체됨
+    course = make_image_course(lesson_count=2)
+    course["lessons"][0]["learningContents"].append(
+        '<p><img src="../images/25img_img_003.jpg"><img src=\'../images/25img_img_004.jpg\'></p>')
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "course.json"
+        path.write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            assert convert_builder_to_subjects(path, Path(temp_dir) / "out")
+        data = (Path(temp_dir) / "out" / "25img" / "01" / "assets" / "data" / "data.json").read_text(encoding="utf-8")
+    assert "25img_img_003.png" in data and "25img_img_004.png" in data
+    assert "25img_img_003.jpg" not in data and "25img_img_004.jpg" not in data
+    # 매핑마다 출력하지 않고 export 끝에 한 번만 집계 출력
+    assert "경로 교체 성공" not in log.getvalue()
+    assert "🔄 Import 이미지 경로 교체: 2개 (1개 조각)" in log.getvalue(), log.getvalue()
+    print(f"  ✅ {len(mapping)} mappings rewritten in one pass")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Image Pipeline")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Parallel pool matches sequential", test_parallel_pool_matches_sequential),
+        ("Image store reuse and eviction", test_image_store_reuse_and_eviction),
+        ("Unified dedup index", test_unified_dedup_index),
+        ("Imported path rewrite", test_imported_path_rewrite),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
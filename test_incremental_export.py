@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test incremental re-export (--incremental) driven by the export manifest.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import data_url, make_course, make_lesson, read_tree
+from builder_to_subjects import EXPORT_MANIFEST_NAME, convert_builder_to_subjects
+
+
+def make_incremental_course():
+    lessons = [make_lesson(i,
+                           terms=[{"title": "용어", "content": [f'<p><img src="{data_url(bytes([i]) * 300)}"></p>']}],
+                           learningContents=[f'<p><img src="{data_url(b"shared" * 50)}"></p>'],
+                           professorThink="<p>생각</p>",
+                           exercises=[])
+               for i in range(1, 5)]
+    return make_course("25inc", lessons, courseName="증분",
+                       professor={"name": "교수", "photo": data_url(b"prof" * 40), "education": [], "career": []},
+                       importedImages={"../images/25inc_img_001.png": data_url(b"imported" * 30)})
+
+
+def export(course, output_dir, **options):
+    path = Path(output_dir) / "course.json"
+    path.write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        assert convert_builder_to_subjects(path, Path(output_dir) / "out", **options)
+    return log.getvalue()
+
+
+def course_tree(output_dir):
+    return read_tree(Path(output_dir) / "out" / "25inc", exclude={EXPORT_MANIFEST_NAME})
+
+
+def lesson_data(output_dir, lesson_num):
+    return (Path(output_dir) / "out" / "25inc" / lesson_num / "assets" / "data" / "data.json").read_text(encoding="utf-8")
+
+
+def test_first_export_matches_full_export():
+    print("Testing first incremental export against a full export...")
+    course = make_incremental_course()
+    with tempfile.TemporaryDirectory() as full_dir, tempfile.TemporaryDirectory() as inc_dir:
+        export(course, full_dir)
+        export(course, inc_dir, incremental=True)
+        assert course_tree(full_dir) == course_tree(inc_dir)
+        assert (Path(inc_dir) / "out" / "25inc" / EXPORT_MANIFEST_NAME).is_file()
+        assert not (Path(full_dir) / "out" / "25inc" / EXPORT_MANIFEST_NAME).exists()
+    print("  ✅ identical output, manifest written")
+
+
+def test_unchanged_lessons_skipped():
+    print("\nTesting re-export of an unchanged course...")
+    course = make_incremental_course()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export(course, temp_dir, incremental=True)
+        before = course_tree(temp_dir)
+        course_dir = Path(temp_dir) / "out" / "25inc"
+        # 차시 출력과 이미지(Import된 이미지 포함)는 다시 쓰지 않아야 함
+        untouched = list(course_dir.glob("*/assets/data/data.json")) + list(course_dir.glob("images/*"))
+        for path in untouched:
+            os.utime(path, (0, 0))
+
+        log = export(course, temp_dir, incremental=True)
+        assert "변경 없는 차시 4개 건너뜀" in log, log
+        assert all(path.stat().st_mtime == 0 for path in untouched)
+        assert course_tree(temp_dir) == before
+    print("  ✅ all 4 lessons and images skipped, output unchanged")
+
+
+def test_changed_lesson_keeps_numbering():
+    print("\nTesting re-export after changing one lesson...")
+    course = make_incremental_course()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        export(course, temp_dir, incremental=True)
+        before = {num: lesson_data(temp_dir, num) for num in ("01", "02", "03", "04")}
+        assert "../images/25inc_img_005.png" in before["03"]
+
+        # 2차시만 수정: 새 이미지 추가, 1차시 이미지 재사용
+        course["lessons"][1]["learningContents"] = [
+            f'<p><img src="{data_url(b"new" * 100)}"><img src="{data_url(bytes([1]) * 300)}"></p>'
+        ]
+        log = export(course, temp_dir, incremental=True)
+        assert "변경 없는 차시 3개 건너뜀" in log, log
+        for num in ("01", "03", "04"):
+            assert lesson_data(temp_dir, num) == before[num]
+
+        lesson2 = lesson_data(temp_dir, "02")
+        # 이전 export의 마지막 번호(6) 다음부터 새 번호 부여, 기존 이미지는 이전 경로 유지
+        assert "../images/25inc_img_007.png" in lesson2
+        assert "../images/25inc_img_002.png" in lesson2
+        images_dir = Path(temp_dir) / "out" / "25inc" / "images"
+        assert (images_dir / "25inc_img_007.png").read_bytes() == b"new" * 100
+        assert (images_dir / "25inc_img_005.png").read_bytes() == bytes([3]) * 300
+
+        # 프리셋이 바뀌면 모든 차시 다시 생성
+        course["templatePreset"] = "2024-standard"
+        log = export(course, temp_dir, incremental=True, stream=True)
+        assert "건너뜀" not in log, log
+        assert "../images/25inc_img_005.png" in lesson_data(temp_dir, "03")
+    print("  ✅ only the changed lesson regenerated, image numbers kept")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Incremental Export")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("First export matches full export", test_first_export_matches_full_export),
+        ("Unchanged lessons skipped", test_unchanged_lessons_skipped),
+        ("Changed lesson keeps numbering", test_changed_lesson_keeps_numbering),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
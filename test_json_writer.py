@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test the streaming JSON writer: byte-identical output for the 2018 (' : ') and 2019+ (': ') formats, file streaming,
+page-by-page data.json writing (DataJsonWriter).
+"""
+
+import sys
+import os
+import io
+import json
+import random
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_to_subjects import DataJsonWriter, legacy_json_dump, legacy_json_dumps
+from exporters.serializers.legacy_serializer import legacy_json_dump as legacy_serializer_dump
+from exporters.serializers.legacy_serializer import legacy_json_dumps as legacy_serializer_dumps
+from exporters.serializers.modern_serializer import modern_json_dump, modern_json_dumps
+
+
+def reference_dumps(obj, separator, inline_list_max, indent='\t'):
+    """이전 구현: 자식 결과를 문자열로 이어 붙이는 재귀 직렬화"""
+    def escape(value):
+        return (value
+                .replace('\\', '\\\\')
+                .replace('"', '\\"')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r')
+                .replace('\t', '\\t'))
+
+    def serialize_value(value, level=0):
+        indent_str = indent * level
+        next_indent = indent * (level + 1)
+        if value is None:
+            return 'null'
+        elif isinstance(value, bool):
+            return 'true' if value else 'false'
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif isinstance(value, str):
+            return f'"{escape(value)}"'
+        elif isinstance(value, list):
+            if all(isinstance(item, str) for item in value) and len(value) <= inline_list_max:
+                items = ', '.join(f'"{escape(item)}"' for item in value)
+                return f'[{items}]'
+            if not value:
+                return '[]'
+            items = [f'{next_indent}{serialize_value(item, level + 1)}' for item in value]
+            return '[\n' + ',\n'.join(items) + f'\n{indent_str}]'
+        elif isinstance(value, dict):
+            if not value:
+                return '{}'
+            items = [f'{next_indent}"{key}"{separator}{serialize_value(val, level + 1)}' for key, val in value.items()]
+            return '{\n' + ',\n'.join(items) + f'\n{indent_str}}}'
+        return 'null'
+
+    return serialize_value(obj)
+
+
+def make_data_json():
+    return {
+        "courseCode": "18test",
+        "sections": ["인트로", "준비하기", "학습하기", "정리하기"],
+        "subjects": [
+            {
+                "title": f"<span class=\"week\">{i}주</span> 제목",
+                "lessonNumber": i,
+                "ratio": i / 3,
+                "completed": i % 2 == 0,
+                "video": None,
+                "pages": [{"path": f"./{i:02d}/{j:02d}.html", "tags": []} for j in range(1, 6)],
+                "words": ["가", "나\t다", "C:\\path", "줄\n바꿈", "\"인용\"", "끝"],
+            }
+            for i in range(1, 16)
+        ],
+        "extra": {},
+        "unknown": object(),
+    }
+
+
+def random_value(rnd, depth=0):
+    alphabet = ["a", "가", '"', "\\", "\n", "\r", "\t", " ", "<p>", "/", "é"]
+    roll = rnd.random()
+    if depth > 4 or roll < 0.4:
+        return rnd.choice([
+            "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 6))),
+            0, -7, 2.5, 10 ** 20, True, False, None,
+        ])
+    if roll < 0.7:
+        return [random_value(rnd, depth + 1) for _ in range(rnd.randint(0, 8))]
+    return {f"k{i}": random_value(rnd, depth + 1) for i in range(rnd.randint(0, 5))}
+
+
+def test_matches_reference():
+    print("Testing output against the previous implementation...")
+    rnd = random.Random(16)
+    values = [make_data_json()] + [random_value(rnd) for _ in range(2000)]
+    for value in values:
+        assert legacy_json_dumps(value) == reference_dumps(value, ' : ', 4)
+        assert legacy_json_dumps(value, use_space_separator=False) == reference_dumps(value, ': ', 4)
+        assert legacy_serializer_dumps(value) == reference_dumps(value, ' : ', 4)
+        assert modern_json_dumps(value) == reference_dumps(value, ': ', 6)
+    print(f"  ✅ {len(values)} values identical in both formats")
+
+
+def test_stream_to_file():
+    print("\nTesting streaming into a file object...")
+    data = make_data_json()
+    data["subjects"] *= 200
+    for dump, dumps in [
+        (lambda obj, fp: legacy_json_dump(obj, fp, use_space_separator=False),
+         lambda obj: legacy_json_dumps(obj, use_space_separator=False)),
+        (legacy_json_dump, legacy_json_dumps),
+        (legacy_serializer_dump, legacy_serializer_dumps),
+        (modern_json_dump, modern_json_dumps),
+    ]:
+        fp = io.StringIO()
+        dump(data, fp)
+        assert fp.getvalue() == dumps(data)
+    print(f"  ✅ {len(fp.getvalue())} chars streamed")
+
+
+def test_control_characters_valid_json():
+    print("\nTesting control characters are escaped...")
+    value = {"text": "a\bb\fc\x01d\u2028", "sections": ["\x1f", "정리"]}
+    for text in (legacy_json_dumps(value), modern_json_dumps(value)):
+        assert json.loads(text.replace(' : ', ': ')) == value
+    print("  ✅ output parses back")
+
+
+def test_data_json_writer():
+    print("\nTesting page-by-page data.json writing...")
+    data = make_data_json()
+    header = {key: data[key] for key in ("courseCode", "sections", "extra")}
+    rnd = random.Random(17)
+    pages_list = [[], [{}], data["subjects"]] + [
+        [{f"k{i}": random_value(rnd) for i in range(rnd.randint(0, 4))} for _ in range(rnd.randint(1, 5))]
+        for _ in range(300)
+    ]
+    for pages in pages_list:
+        expected = dict(header, pages=pages)
+        for legacy, space, text in [
+            (False, True, json.dumps(expected, ensure_ascii=False, indent=2)),
+            (True, True, legacy_json_dumps(expected) + "\n"),
+            (True, False, legacy_json_dumps(expected, use_space_separator=False) + "\n"),
+        ]:
+            fp = io.StringIO()
+            writer = DataJsonWriter(fp, header, legacy=legacy, use_space_separator=space)
+            for page in pages:
+                writer.emit(page)
+            writer.close()
+            assert fp.getvalue() == text, (legacy, space, pages)
+
+    # 페이지는 emit 시점에 직렬화됨 (이후 원본을 바꿔도 출력에 영향 없음)
+    fp = io.StringIO()
+    writer = DataJsonWriter(fp, header)
+    page = {"type": "intro", "title": "처음"}
+    writer.emit(page)
+    page["title"] = "바뀜"
+    writer.close()
+    assert json.loads(fp.getvalue())["pages"] == [{"type": "intro", "title": "처음"}]
+    print(f"  ✅ {len(pages_list)} page lists identical in 3 formats")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Streaming JSON Writer")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Matches reference", test_matches_reference),
+        ("Stream to file", test_stream_to_file),
+        ("Control characters valid JSON", test_control_characters_valid_json),
+        ("DataJsonWriter", test_data_json_writer),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test multi-process lesson export (--lesson-workers): output must not depend on the worker count.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import builder_to_subjects
+from builder_fixtures import data_url, make_course, make_lesson, practice_week, read_tree
+from builder_to_subjects import convert_builder_to_subjects
+
+
+SHARED = data_url(b"shared" * 200)
+THINK_X = data_url(b"think-x" * 30)
+THINK_Y = data_url(b"think-y" * 30)
+BROKEN = "data:image/png;base64,abcde"
+
+
+def make_parallel_course(preset):
+    lessons = []
+    for i in range(1, 8):
+        # 생각 이미지 X, Y를 번갈아 사용하고 본문에도 X를 넣어 professor-02.png 덮어쓰기 순서를 확인
+        think = THINK_X if i % 3 == 1 else (THINK_Y if i % 3 == 2 else "")
+        lessons.append(make_lesson(
+            i, lessons_per_week=2,
+            hasOrientation=i == 1,
+            orientation={"videoUrl": "", "subtitlePath": ""},
+            terms=[{"title": "용어", "content": [
+                f'<p><img src="{data_url(bytes([i]) * 400)}"><img src="{BROKEN}"></p>', "<p>이미지 없음</p>"
+            ]}],
+            learningContents=[
+                f'<p><img class="notion-image" src="{SHARED}"></p>',
+                f'<p><img src="{data_url(bytes([i]) * 90, "jpeg")}" data-original-src="../images/25par_img_001.png"></p>',
+                f'<p><img src="{THINK_X}"></p>' if i % 2 == 0 else "<h3>소제목</h3>",
+            ],
+            professorThink=f'<p><img src="{data_url(bytes([i]) * 70)}"></p>',
+            professorThinkImage=think,
+            exercises=[{"type": "multiple", "question": f'<p><img src="{SHARED}"></p>', "answer": "1",
+                        "commentary": "<p>해설</p>", "options": [f'<p><img src="{BROKEN}"></p>', "b", "c", "d"]}],
+            summary=[f'<p><img src="{data_url(bytes([i + 50]) * 60)}"></p>'],
+        ))
+    lessons.append(practice_week(8, 4))
+    return make_course("25par", lessons, preset, courseName="병렬",
+                       professor={"name": "교수", "photo": THINK_Y, "education": [], "career": []},
+                       importedImages={"../images/25par_img_001.png": data_url(b"imported" * 20)})
+
+
+def export_tree(course, output_dir, **options):
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(output_dir) / "course.json"
+    path.write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert convert_builder_to_subjects(path, Path(output_dir) / "out", **options)
+    return read_tree(Path(output_dir) / "out")
+
+
+def test_output_independent_of_worker_count():
+    print("Testing lesson workers against sequential export...")
+    for preset in ("2025-standard", "2018-standard"):
+        course = make_parallel_course(preset)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sequential = export_tree(course, Path(temp_dir) / "seq")
+            for workers, options in ((2, {}), (3, {"stream": True}), (8, {"image_workers": 1})):
+                parallel = export_tree(course, Path(temp_dir) / f"par{workers}", lesson_workers=workers, **options)
+                assert sorted(parallel) == sorted(sequential), (preset, workers)
+                for rel_path, content in sequential.items():
+                    assert parallel[rel_path] == content, (preset, workers, rel_path)
+        print(f"  ✅ {preset}: {len(sequential)} files identical for 2, 3 and 8 workers")
+
+
+def test_parent_does_not_clean_lessons():
+    print("\nTesting HTML cleaning stays in the lesson workers...")
+    course = make_parallel_course("2025-standard")
+    calls = []
+    original = builder_to_subjects.clean_html_fragments
+
+    def counting_clean(fragments):
+        calls.append(len(fragments))
+        return original(fragments)
+
+    builder_to_subjects.clean_html_fragments = counting_clean
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            export_tree(course, Path(temp_dir) / "seq")
+            sequential_calls = len(calls)
+            calls.clear()
+            # 부모 프로세스는 이미지 번호만 부여하고, 조각 정리는 worker 프로세스에서만 수행
+            export_tree(course, Path(temp_dir) / "par", lesson_workers=2)
+    finally:
+        builder_to_subjects.clean_html_fragments = original
+    assert sequential_calls == 7, sequential_calls
+    assert calls == [], calls
+    print(f"  ✅ parent cleaned 0 lessons (sequential: {sequential_calls})")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Parallel Lesson Export")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Output independent of worker count", test_output_independent_of_worker_count),
+        ("Parent does not clean lessons", test_parent_does_not_clean_lessons),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test the per-course render context: index.html rendered once, compiled page plan, hardlinked index.html (--link-index-html).
+"""
+
+import sys
+import os
+import io
+import zipfile
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import json
+import builder_to_subjects
+from builder_fixtures import make_course, make_lesson, practice_week
+from builder_to_subjects import (ZipTarget, _course_render_context, compile_page_plan, convert_course_data,
+                                 get_index_html_template)
+
+
+def make_render_course(preset="2025-standard", theme="type-1"):
+    lessons = [make_lesson(i, lessons_per_week=2) for i in range(1, 6)] + [practice_week(6, 3)]
+    return make_course("25ctx", lessons, preset, courseName="렌더", templateTheme=theme)
+
+
+def export(course, output_dir, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert convert_course_data(course, output_dir, **kwargs)
+    return Path(output_dir) / course["courseCode"]
+
+
+def index_files(course_dir):
+    return sorted(course_dir.glob("*/index.html"))
+
+
+def test_index_html_rendered_once():
+    print("Testing index.html rendered once per course...")
+    calls = []
+    original = builder_to_subjects.get_index_html_template
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    builder_to_subjects.get_index_html_template = counting
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            course_dir = export(make_render_course(), temp_dir)
+            files = index_files(course_dir)
+    finally:
+        builder_to_subjects.get_index_html_template = original
+    assert calls == [("2025-standard", "type-1")], calls
+    assert len(files) == 6
+    print(f"  ✅ 1 render for {len(files)} lessons")
+
+
+def test_render_context_values():
+    print("\nTesting resolved preset and component plan...")
+    context = _course_render_context("2018-standard", "")
+    assert context["is_2018"] and context["components"][0] == "intro"
+    assert context["index_html"] == get_index_html_template("2018-standard", "")
+
+    # 없는 프리셋은 2025-standard로 대체
+    unknown = _course_render_context("1999-unknown", "type-1")
+    assert unknown["preset"] is builder_to_subjects.export_templates.TEMPLATE_PRESETS["2025-standard"]
+    assert not unknown["is_2018"]
+    print("  ✅ preset, components and index.html resolved")
+
+
+def plan_names(course_type, components):
+    return [name for name, _ in compile_page_plan({"course_type": course_type, "components": components,
+                                                   "images_dir": None, "course_code": "25ctx", "year": "2025",
+                                                   "image_counter": {"count": 0}, "imported_image_path_mapping": {},
+                                                   "image_cache": {}, "is_legacy_template": False, "professor": {},
+                                                   "processed_professor_photo": None, "week_titles_list": [], "is_2018": False})]
+
+
+def test_compiled_page_plan():
+    print("\nTesting compiled page plan...")
+    components = builder_to_subjects.DEFAULT_PAGE_COMPONENTS + ("exercise_pre", "unknown")
+    general = plan_names("general", components)
+    assert general == list(builder_to_subjects.DEFAULT_PAGE_COMPONENTS) + ["exercise_pre"], general
+    # general이 아닌 과정은 용어/평가 페이지를 계획에서 제외
+    other = plan_names("special", components)
+    assert "term" not in other and "exercise" not in other and "exercise_pre" not in other
+    assert other == [name for name in general if name not in ("term", "exercise", "exercise_pre")]
+    print(f"  ✅ {len(general)} steps (general), {len(other)} steps (special)")
+
+
+def test_custom_component_and_stats():
+    print("\nTesting custom component and component timing...")
+    original_presets = dict(builder_to_subjects.export_templates.TEMPLATE_PRESETS)
+    preset = dict(original_presets["2025-standard"])
+    preset["components"] = ("intro", "banner", "next")
+    builder_to_subjects.export_templates.TEMPLATE_PRESETS["2099-custom"] = preset
+
+    @builder_to_subjects._page_component("banner")
+    def _bind_banner(course_ctx):
+        course_code = course_ctx["course_code"]
+        return lambda lesson: {"type": "banner", "text": f"{course_code}-{lesson['lessonNumber']}"}
+
+    builder_to_subjects.reset_page_component_stats()
+    builder_to_subjects.PAGE_COMPONENT_TIMING = True
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            course_dir = export(make_render_course(preset="2099-custom"), temp_dir)
+            data = json.loads((course_dir / "01" / "assets" / "data" / "data.json").read_text(encoding="utf-8"))
+        stats = builder_to_subjects.page_component_stats()
+    finally:
+        builder_to_subjects.PAGE_COMPONENT_TIMING = False
+        del builder_to_subjects.PAGE_COMPONENTS["banner"]
+        builder_to_subjects.export_templates.TEMPLATE_PRESETS.clear()
+        builder_to_subjects.export_templates.TEMPLATE_PRESETS.update(original_presets)
+
+    assert {"type": "banner", "text": "25ctx-1"} in data["pages"], data["pages"]
+    assert stats["banner"]["calls"] == 5 and stats["intro"]["calls"] == 5, stats
+    assert stats["term"]["calls"] == 0  # 현장실습 차시는 계획을 거치지 않음, 프리셋에 없는 컴포넌트는 기록 없음
+    assert "banner" in builder_to_subjects.format_page_component_stats(stats)
+    builder_to_subjects.reset_page_component_stats()
+    print(f"  ✅ banner page emitted, {stats['banner']['calls']} timed calls")
+
+
+def test_hardlinked_index_html():
+    print("\nTesting hardlinked index.html...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        expected = {path.name: path.read_bytes() for path in index_files(export(make_render_course(), Path(temp_dir) / "copy"))}
+        for workers in (None, 2):
+            course_dir = export(make_render_course(), Path(temp_dir) / f"link{workers}", link_index_html=True,
+                                lesson_workers=workers)
+            files = index_files(course_dir)
+            assert {path.name: path.read_bytes() for path in files} == expected
+            inodes = {path.stat().st_ino for path in files}
+            assert len(inodes) == 1 and files[0].stat().st_nlink == len(files), (workers, inodes)
+
+        # 다시 export할 때 테마가 바뀌면 모든 차시가 새 내용 (이전 하드링크로 다른 파일이 바뀌지 않음)
+        course_dir = export(make_render_course(theme="type-2"), Path(temp_dir) / "linkNone", link_index_html=True)
+        new_html = get_index_html_template("2025-standard", "type-2").encode("utf-8")
+        assert all(path.read_bytes() == new_html for path in index_files(course_dir))
+        assert new_html not in expected.values()
+    print(f"  ✅ {len(files)} index.html files share one inode")
+
+
+def test_link_ignored_for_zip():
+    print("\nTesting ZIP output ignores hardlinks...")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert convert_course_data(make_render_course(), target=ZipTarget(zip_file), link_index_html=True)
+    with zipfile.ZipFile(buffer) as zip_file:
+        names = [name for name in zip_file.namelist() if name.endswith("index.html")]
+        contents = {zip_file.read(name) for name in names}
+    assert len(names) == 6 and contents == {get_index_html_template("2025-standard", "type-1").encode("utf-8")}
+    print(f"  ✅ {len(names)} index.html entries written")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Course Render Context")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("index.html rendered once", test_index_html_rendered_once),
+        ("Render context values", test_render_context_values),
+        ("Compiled page plan", test_compiled_page_plan),
+        ("Custom component and stats", test_custom_component_and_stats),
+        ("Hardlinked index.html", test_hardlinked_index_html),
+        ("Link ignored for ZIP", test_link_ignored_for_zip),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test streaming ingest (--stream) of builder JSON.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import PNG_1x1, make_course, make_lesson
+from builder_to_subjects import (
+    _JsonStreamReader,
+    convert_builder_to_subjects,
+    iter_builder_json_member,
+    read_builder_json_header,
+)
+
+def make_stream_course():
+    lessons = [make_lesson(i,
+                           terms=[{"title": "용어", "content": [f'<p>설명 <img src="{PNG_1x1}"></p>']}],
+                           timestamps=["00:10"],
+                           professorThink="<p>생각</p>",
+                           exercises=[{"type": "boolean", "question": "<p>OX</p>", "answer": "1", "commentary": "해설"}],
+                           summary=["<p>정리 \"따옴표\" \\ 1.5e3</p>"])
+               for i in range(1, 4)]
+    # 정수/실수/bool/null 값도 스트리밍 파서가 그대로 읽는지 확인
+    return make_course("25stream", lessons, courseName="스트리밍", year=2025,
+                       professor={"name": "교수", "photo": PNG_1x1, "education": [], "career": []},
+                       importedImages={"../images/25stream_img_001.jpg": PNG_1x1},
+                       ratio=0.125, flags=[True, False, None])
+
+
+def test_reader_chunk_boundaries():
+    """Tiny chunk sizes must decode the same values as json.load."""
+    print("Testing _JsonStreamReader chunk boundaries...")
+    text = json.dumps(make_stream_course(), ensure_ascii=False, indent=1)
+    expected = json.loads(text)
+
+    for chunk_size in (1, 2, 7, 64, 1 << 20):
+        reader = _JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+        result = {}
+        for key in reader.iter_object():
+            if key == "lessons":
+                result[key] = list(reader.iter_array())
+            elif key == "professor":
+                reader.skip_value()
+                result[key] = expected[key]
+            else:
+                result[key] = reader.read_value()
+        assert result == expected, f"chunk_size={chunk_size}"
+        print(f"  ✅ chunk_size={chunk_size} passed")
+
+
+def test_header_and_members():
+    print("\nTesting header / member iteration...")
+    course = make_stream_course()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "course.json"
+        path.write_text(json.dumps(course, ensure_ascii=False), encoding="utf-8")
+
+        header, has_imported_images = read_builder_json_header(path)
+        assert has_imported_images
+        assert "importedImages" not in header
+        assert header["lessons"] == [
+            {"lessonNumber": i, "lessonTitle": f"차시 {i}", "weekNumber": i, "weekTitle": f"주제 {i}"}
+            for i in range(1, 4)
+        ]
+        assert list(iter_builder_json_member(path, "lessons")) == course["lessons"]
+        assert dict(iter_builder_json_member(path, "importedImages")) == course["importedImages"]
+        assert list(iter_builder_json_member(path, "missing")) == []
+    print("  ✅ header and members match json.load")
+
+
+def test_stream_output_identical():
+    """--stream must write exactly the same tree as the in-memory path."""
+    print("\nTesting streamed export output...")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        path = temp_path / "course.json"
+        path.write_text(json.dumps(make_stream_course(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert convert_builder_to_subjects(path, temp_path / "full")
+            assert convert_builder_to_subjects(path, temp_path / "stream", stream=True)
+
+        full = sorted(p.relative_to(temp_path / "full") for p in (temp_path / "full").rglob("*") if p.is_file())
+        streamed = sorted(p.relative_to(temp_path / "stream") for p in (temp_path / "stream").rglob("*") if p.is_file())
+        assert full == streamed
+        for rel in full:
+            assert (temp_path / "full" / rel).read_bytes() == (temp_path / "stream" / rel).read_bytes(), rel
+    print("  ✅ streamed output is byte-identical")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Streaming Ingest")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Reader chunk boundaries", test_reader_chunk_boundaries),
+        ("Header / member iteration", test_header_and_members),
+        ("Streamed output identical", test_stream_output_identical),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
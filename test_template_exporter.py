@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test exporter routing: lazy family imports, sourceTemplateId routing table, shared exporter instances.
+"""
+
+import sys
+import os
+import io
+import tempfile
+import subprocess
+import contextlib
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import export_templates
+from exporters import template_exporter
+from exporters.template_exporter import ROUTES, export_template, get_exporter
+
+
+def model(template_id):
+    return {"_meta": {"sourceTemplateId": template_id, "sourceTheme": "type-1"}, "lessonNumber": 1, "weekNumber": 1,
+            "sectionInWeek": 1, "lessonTitle": "차시", "professor": {"name": "교수", "education": [], "career": []},
+            "exercises": [], "summary": []}
+
+
+def test_import_is_lazy():
+    print("Testing lazy family imports...")
+    code = ("import sys, exporters; "
+            "print(sorted(name for name in sys.modules "
+            "if name == 'builder_to_subjects' or name.startswith('exporters.families.')))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]", result.stdout
+    print("  ✅ import exporters loads no family module")
+
+
+def test_routes_match_priority_scan():
+    print("\nTesting routing table against exporter scan...")
+    exporters = [cls() for cls in template_exporter.EXPORTERS]
+    for template_id in list(export_templates.TEMPLATE_PRESETS) + ["unknown", ""]:
+        content_model = model(template_id)
+        scanned = next((exporter for exporter in exporters if exporter.can_export(content_model)), None)
+        routed = get_exporter(template_id)
+        if scanned is None:
+            assert routed is None, template_id
+        else:
+            assert type(routed) is type(scanned) and routed.can_export(content_model), template_id
+    for cls in template_exporter.EXPORTERS:
+        assert cls.TEMPLATE_IDS == {t for t, route in ROUTES.items() if route[1] == cls.__name__}, cls
+    print(f"  ✅ {len(ROUTES)} template IDs routed")
+
+
+def test_shared_instances():
+    print("\nTesting shared exporter instances...")
+    assert get_exporter("2025-standard") is get_exporter("2018-standard")
+    assert get_exporter("2024-hrd") is get_exporter("2026-hrd")
+    assert get_exporter("2024-hrd") is not get_exporter("2025-standard")
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+        result = export_template(model("2022-legal"), temp_dir)
+    assert result["success"] and result["template_id"] == "2022-legal"
+    print("  ✅ one instance per family")
+
+
+def test_unknown_template():
+    print("\nTesting unknown template...")
+    for content_model, message in [(model("1999-unknown"), "No exporter found"), ({}, "_meta")]:
+        try:
+            export_template(content_model, "/tmp/unused")
+        except ValueError as e:
+            assert message in str(e), e
+        else:
+            raise AssertionError(f"ValueError not raised for {content_model}")
+    print("  ✅ ValueError raised")
+
+
+def main():
+    print("=" * 60)
+    print("Testing Template Exporter Routing")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("Lazy imports", test_import_is_lazy),
+        ("Routes match priority scan", test_routes_match_priority_scan),
+        ("Shared instances", test_shared_instances),
+        ("Unknown template", test_unknown_template),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
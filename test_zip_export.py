@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test exporting straight into a ZIP archive (ZipTarget) and the api/export.py handler.
+"""
+
+import sys
+import os
+import io
+import json
+import zipfile
+import importlib.util
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from builder_fixtures import data_url, make_course, make_lesson, read_tree
+from builder_to_subjects import ZipTarget, convert_course_data
+
+THINK_X = data_url(b"think-x" * 30)
+THINK_Y = data_url(b"think-y" * 30)
+
+
+def make_zip_course(preset="2025-standard"):
+    lessons = [make_lesson(
+        i,
+        terms=[{"title": "용어", "content": [f'<p><img src="{data_url(bytes([i]) * 400)}"></p>']}],
+        learningContents=[f'<p>내용 <img src="{data_url(b"shared" * 100, "jpeg")}"></p>'],
+        professorThink="<p>생각</p>",
+        # professor-02.png에 X, Y를 번갈아 씀: 마지막 내용(Y)만 ZIP에 남아야 함
+        professorThinkImage=THINK_X if i % 2 else THINK_Y,
+        exercises=[],
+    ) for i in range(1, 5)]
+    return make_course("25zip", lessons, preset, courseName="압축",
+                       professor={"name": "교수", "photo": data_url(b"prof" * 40), "education": [], "career": []},
+                       importedImages={"../images/25zip_img_001.png": data_url(b"imported" * 20)},
+                       importedSubtitles={"25zip_01.vtt": "WEBVTT\n\n00:00.000 --> 00:01.000\n안녕"})
+
+
+def directory_tree(course, convert=convert_course_data, **options):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert convert(course, temp_dir, **options)
+        return read_tree(temp_dir)
+
+
+def zip_tree(course, **options):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert convert_course_data(course, target=ZipTarget(zip_file), **options)
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as zip_file:
+        names = zip_file.namelist()
+        assert len(names) == len(set(names)), "duplicate ZIP entries"
+        return {name: zip_file.read(name) for name in names}
+
+
+def test_zip_matches_directory():
+    print("Testing ZIP target against directory export...")
+    for preset in ("2025-standard", "2018-standard"):
+        course = make_zip_course(preset)
+        expected = directory_tree(course)
+        assert expected["25zip/images/professor-02.png"] == b"think-y" * 30
+        for options in ({}, {"image_workers": 1}, {"lesson_workers": 2}):
+            assert zip_tree(course, **options) == expected, (preset, options)
+        print(f"  ✅ {preset}: {len(expected)} entries identical")
+
+
+def load_api_export():
+    spec = importlib.util.spec_from_file_location("api_export", os.path.join(os.path.dirname(__file__), "api", "export.py"))
+    api_export = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(api_export)
+    return api_export
+
+
+def call_handler(api_export, path="/api/export"):
+    handler = api_export.handler
+    body = json.dumps({"courseData": make_zip_course()}, ensure_ascii=False).encode("utf-8")
+    request = handler.__new__(handler)
+    request.rfile = io.BytesIO(body)
+    request.wfile = io.BytesIO()
+    request.headers = {"Content-Length": str(len(body))}
+    request.request_version = "HTTP/1.1"
+    request.requestline = f"POST {path} HTTP/1.1"
+    request.command = "POST"
+    request.path = path
+    request.client_address = ("127.0.0.1", 0)
+    request.log_message = lambda *args: None
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        request.do_POST()
+
+    head, _, payload = request.wfile.getvalue().partition(b"\r\n\r\n")
+    assert head.split(b"\r\n")[0] == b"HTTP/1.1 200 OK", head
+    assert b'filename="25zip.zip"' in head
+    return head, payload
+
+
+def dechunk(payload):
+    """chunked 본문을 (chunk 목록, 종료 chunk 수신 여부)로 분리"""
+    chunks = []
+    while payload:
+        size_line, _, payload = payload.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            assert payload == b"\r\n", payload
+            return chunks, True
+        chunks.append(payload[:size])
+        assert payload[size:size + 2] == b"\r\n"
+        payload = payload[size + 2:]
+    return chunks, False
+
+
+def test_api_handler_returns_zip():
+    print("\nTesting api/export.py handler...")
+    api_export = load_api_export()
+    head, payload = call_handler(api_export)
+    assert b"Content-Length: %d" % len(payload) in head
+    with zipfile.ZipFile(io.BytesIO(payload)) as zip_file:
+        # 핸들러는 api/ 아래의 변환 모듈(프리셋 구성이 다름)을 사용
+        expected = directory_tree(make_zip_course(), api_export.convert_course_data)
+        assert {name: zip_file.read(name) for name in zip_file.namelist()} == expected
+    print(f"  ✅ handler returned {len(payload)} byte ZIP")
+
+
+def test_api_handler_streams_zip():
+    print("\nTesting api/export.py streamed (chunked) response...")
+    api_export = load_api_export()
+    api_export.STREAM_CHUNK_SIZE = 1024  # 작은 과정에서도 여러 chunk로 나뉘도록
+    head, payload = call_handler(api_export, "/api/export?stream=1")
+    assert b"Transfer-Encoding: chunked" in head and b"Content-Length" not in head
+    chunks, complete = dechunk(payload)
+    assert complete and len(chunks) > 1, len(chunks)
+
+    expected = directory_tree(make_zip_course(), api_export.convert_course_data)
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+        assert zip_file.testzip() is None
+        assert {name: zip_file.read(name) for name in zip_file.namelist()} == expected
+    print(f"  ✅ {len(chunks)} chunks, {len(expected)} entries identical")
+
+    # 헤더를 보낸 뒤 실패하면 종료 chunk 없이 끊어야 함 (클라이언트가 불완전한 응답으로 인식)
+    def failing_convert(course_data, target):
+        with target.open_text(target.root / "partial.txt") as f:
+            f.write("x" * 100)
+        raise RuntimeError("boom")
+
+    api_export.convert_course_data = failing_convert
+    head, payload = call_handler(api_export, "/api/export?stream=1")
+    _, complete = dechunk(payload)
+    assert not complete
+    print("  ✅ failure after headers leaves the chunked body unterminated")
+
+
+def main():
+    print("=" * 60)
+    print("Testing ZIP Export")
+    print("=" * 60)
+
+    results = []
+    for name, test in [
+        ("ZIP matches directory export", test_zip_matches_directory),
+        ("API handler returns ZIP", test_api_handler_returns_zip),
+        ("API handler streams ZIP", test_api_handler_streams_zip),
+    ]:
+        try:
+            test()
+            results.append((name, True))
+        except AssertionError as e:
+            print(f"  ❌ {name} failed: {e}")
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+    for test_name, passed in results:
+        status = "✅ PASS" if passed else "❌ FAIL"
+        print(f"{status}: {test_name}")
+
+    all_passed = all(result for _, result in results)
+    print("\n" + ("✅ All tests passed!" if all_passed else "❌ Some tests failed"))
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,113 @@
 import { spawn } from 'node:child_process';
-import { writeFileSync, unlinkSync, existsSync, rmSync, mkdirSync } from 'node:fs';
+import { existsSync, rmSync, mkdirSync } from 'node:fs';
 import { join } from 'node:path';
 import { tmpdir } from 'node:os';
+import { createInterface } from 'node:readline';
 import { createRequire } from 'node:module';
 const require = createRequire(import.meta.url);
 const archiver = require('archiver');
 
+const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
+
+// 상주 Python export worker (builder_to_subjects.py --worker)
+// export마다 Python을 새로 띄우지 않고, 요청/응답을 한 줄에 하나씩 JSON으로 주고받음
+// worker가 종료되면 그 worker에 보낸 요청은 실패 처리하고 다음 요청에서 다시 띄움
+// restart()는 실행 중인 worker가 받은 요청을 마치고 종료하게 하고, 다음 요청부터 새 worker 사용
+// (Python 코드를 수정하면 다음 export부터 반영되도록 플러그인에서 호출)
+function createExportWorker(scriptPath) {
+  let worker = null;
+  let nextId = 1;
+
+  function start() {
+    const child = spawn(pythonCmd, [scriptPath, '--worker'], {
+      cwd: process.cwd(),
+      stdio: ['pipe', 'pipe', 'pipe'],
+      env: {
+        ...process.env,
+        PYTHONIOENCODING: 'utf-8'  // Windows 인코딩 문제 해결
+      }
+    });
+    const current = { child, pending: new Map() };
+
+    let stderr = '';
+    child.stderr.on('data', (data) => {
+      stderr = (stderr + data.toString()).slice(-4000);
+    });
+
+    createInterface({ input: child.stdout }).on('line', (line) => {
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch (e) {
+        return;
+      }
+      // progress 메시지는 result의 log에도 모두 포함되므로 result만 사용
+      const request = current.pending.get(message.id);
+      if (request && message.type === 'result') {
+        current.pending.delete(message.id);
+        request.resolve(message);
+      }
+    });
+
+    const fail = (error) => {
+      if (worker === current) worker = null;
+      for (const request of current.pending.values()) {
+        request.reject(new Error(stderr || error));
+      }
+      current.pending.clear();
+    };
+    child.on('exit', (code) => fail(`Python worker 종료 (code ${code})`));
+    child.on('error', (error) => fail(`Python 스크립트 실행 오류: ${error.message}`));
+    return current;
+  }
+
+  function close() {
+    if (worker) {
+      // stdin을 닫으면 이미 받은 요청을 모두 처리한 뒤 종료
+      worker.child.stdin.end();
+      worker = null;
+    }
+  }
+
+  return {
+    // { success, courseCode, seconds, log, error? } 로 resolve
+    run(request) {
+      if (!worker) worker = start();
+      const current = worker;
+      const id = nextId++;
+      return new Promise((resolve, reject) => {
+        current.pending.set(id, { resolve, reject });
+        current.child.stdin.write(JSON.stringify({ ...request, id }) + '\n');
+      });
+    },
+    restart: close,
+    close
+  };
+}
+
+// worker 결과의 오류 메시지 (오류 요약 + 변환 로그/traceback)
+function workerError(result) {
+  return [result.error, result.log].filter(Boolean).join('\n') || 'Python 스크립트 실행 실패';
+}
+
 export default function exportSubjectsPlugin() {
   return {
     name: 'export-subjects',
     configureServer(server) {
+      const zipWorker = createExportWorker(join(process.cwd(), 'api', 'builder_to_subjects.py'));
+      const subjectsWorker = createExportWorker(join(process.cwd(), 'builder_to_subjects.py'));
+      server.httpServer?.on('close', () => {
+        zipWorker.close();
+        subjectsWorker.close();
+      });
+      // builder_to_subjects.py, export_templates.py 등을 수정하면 다음 export부터 새 worker에서 실행
+      server.watcher.on('change', (file) => {
+        if (file.endsWith('.py')) {
+          zipWorker.restart();
+          subjectsWorker.restart();
+        }
+      });
+
       // /api/export - ZIP 파일 반환 (Vercel api/export.py와 동일한 동작)
       server.middlewares.use('/api/export', async (req, res, next) => {
         if (req.method !== 'POST') {
@@ -37,102 +135,66 @@ export default function exportSubjectsPlugin() {
 
             const courseCode = courseData.courseCode;
 
-            // 임시 디렉토리 생성
+            // 임시 출력 디렉토리 생성 (courseData는 worker에 바로 전달)
             const tempDir = join(tmpdir(), `export_${Date.now()}`);
-            const tempFile = join(tempDir, `${courseCode}_builder.json`);
             const outputDir = join(tempDir, 'output');
-
-            // 디렉토리 생성
-            mkdirSync(tempDir, { recursive: true });
             mkdirSync(outputDir, { recursive: true });
 
-            // JSON 파일 저장
-            writeFileSync(tempFile, JSON.stringify(courseData, null, 2), 'utf-8');
-
-            // Python 스크립트 실행
-            const scriptPath = join(process.cwd(), 'api', 'builder_to_subjects.py');
-            const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
-
-            const pythonProcess = spawn(pythonCmd, [scriptPath, tempFile, outputDir], {
-              cwd: process.cwd(),
-              stdio: 'pipe',
-              env: {
-                ...process.env,
-                PYTHONIOENCODING: 'utf-8'
-              }
-            });
-
-            let stdout = '';
-            let stderr = '';
+            let result;
+            try {
+              result = await zipWorker.run({ courseData, outputDir });
+            } catch (error) {
+              result = { success: false, error: error.message };
+            }
 
-            pythonProcess.stdout.on('data', (data) => {
-              stdout += data.toString();
-            });
+            if (!result.success) {
+              // 임시 파일 정리
+              try { rmSync(tempDir, { recursive: true, force: true }); } catch (e) {}
 
-            pythonProcess.stderr.on('data', (data) => {
-              stderr += data.toString();
-            });
+              res.statusCode = 500;
+              res.setHeader('Content-Type', 'application/json');
+              res.end(JSON.stringify({
+                error: workerError(result)
+              }));
+              return;
+            }
 
-            pythonProcess.on('close', async (code) => {
-              if (code !== 0) {
-                // 임시 파일 정리
-                try { rmSync(tempDir, { recursive: true, force: true }); } catch (e) {}
+            try {
+              // ZIP 파일 생성
+              const courseDir = join(outputDir, courseCode);
 
-                res.statusCode = 500;
-                res.setHeader('Content-Type', 'application/json');
-                res.end(JSON.stringify({
-                  error: stderr || stdout || 'Python 스크립트 실행 실패'
-                }));
-                return;
+              if (!existsSync(courseDir)) {
+                throw new Error(`출력 디렉토리를 찾을 수 없습니다: ${courseDir}`);
               }
 
-              try {
-                // ZIP 파일 생성
-                const courseDir = join(outputDir, courseCode);
-
-                if (!existsSync(courseDir)) {
-                  throw new Error(`출력 디렉토리를 찾을 수 없습니다: ${courseDir}`);
-                }
-
-                res.setHeader('Content-Type', 'application/zip');
-                res.setHeader('Content-Disposition', `attachment; filename="${courseCode}.zip"`);
-
-                const archive = archiver('zip', { zlib: { level: 9 } });
+              res.setHeader('Content-Type', 'application/zip');
+              res.setHeader('Content-Disposition', `attachment; filename="${courseCode}.zip"`);
 
-                archive.on('error', (err) => {
-                  throw err;
-                });
+              const archive = archiver('zip', { zlib: { level: 9 } });
 
-                archive.pipe(res);
+              archive.on('error', (err) => {
+                throw err;
+              });
 
-                // courseCode 폴더를 ZIP의 루트에 포함
-                archive.directory(courseDir, courseCode);
+              archive.pipe(res);
 
-                archive.finalize();
+              // courseCode 폴더를 ZIP의 루트에 포함
+              archive.directory(courseDir, courseCode);
 
-                // ZIP 전송 완료 후 임시 파일 정리
-                archive.on('end', () => {
-                  try { rmSync(tempDir, { recursive: true, force: true }); } catch (e) {}
-                });
+              archive.finalize();
 
-              } catch (err) {
+              // ZIP 전송 완료 후 임시 파일 정리
+              archive.on('end', () => {
                 try { rmSync(tempDir, { recursive: true, force: true }); } catch (e) {}
+              });
 
-                res.statusCode = 500;
-                res.setHeader('Content-Type', 'application/json');
-                res.end(JSON.stringify({ error: err.message }));
-              }
-            });
-
-            pythonProcess.on('error', (error) => {
+            } catch (err) {
               try { rmSync(tempDir, { recursive: true, force: true }); } catch (e) {}
 
               res.statusCode = 500;
               res.setHeader('Content-Type', 'application/json');
-              res.end(JSON.stringify({
-                error: `Python 스크립트 실행 오류: ${error.message}`
-              }));
-            });
+              res.end(JSON.stringify({ error: err.message }));
+            }
 
           } catch (error) {
             res.statusCode = 500;
@@ -166,70 +228,29 @@ export default function exportSubjectsPlugin() {
               return;
             }
 
-            // 임시 JSON 파일 생성
-            const tempFile = join(tmpdir(), `${courseData.courseCode}_builder_${Date.now()}.json`);
-            writeFileSync(tempFile, JSON.stringify(courseData, null, 2), 'utf-8');
-
-            // Python 스크립트 실행
-            const scriptPath = join(process.cwd(), 'builder_to_subjects.py');
-            // Windows는 'python', macOS/Linux는 'python3' 사용
-            const pythonCmd = process.platform === 'win32' ? 'python' : 'python3';
-            const pythonProcess = spawn(pythonCmd, [scriptPath, tempFile, outputPath], {
-              cwd: process.cwd(),
-              stdio: 'pipe',
-              env: {
-                ...process.env,
-                PYTHONIOENCODING: 'utf-8'  // Windows 인코딩 문제 해결
-              }
-            });
-
-            let stdout = '';
-            let stderr = '';
-
-            pythonProcess.stdout.on('data', (data) => {
-              stdout += data.toString();
-            });
-
-            pythonProcess.stderr.on('data', (data) => {
-              stderr += data.toString();
-            });
-
-            pythonProcess.on('close', (code) => {
-              // 임시 파일 삭제
-              try {
-                unlinkSync(tempFile);
-              } catch (e) {
-                // 파일 삭제 실패는 무시
-              }
-
-              if (code === 0) {
-                res.setHeader('Content-Type', 'application/json');
-                res.end(JSON.stringify({
-                  success: true,
-                  outputPath: outputPath,
-                  lessonCount: courseData.lessons.length,
-                  message: stdout
-                }));
-              } else {
-                res.statusCode = 500;
-                res.end(JSON.stringify({
-                  success: false,
-                  error: stderr || stdout || 'Python 스크립트 실행 실패'
-                }));
-              }
-            });
+            // 상주 worker에서 변환 (임시 JSON 파일 없이 courseData를 바로 전달)
+            let result;
+            try {
+              result = await subjectsWorker.run({ courseData, outputDir: outputPath });
+            } catch (error) {
+              result = { success: false, error: error.message };
+            }
 
-            pythonProcess.on('error', (error) => {
-              try {
-                unlinkSync(tempFile);
-              } catch (e) {}
-              
+            if (result.success) {
+              res.setHeader('Content-Type', 'application/json');
+              res.end(JSON.stringify({
+                success: true,
+                outputPath: outputPath,
+                lessonCount: courseData.lessons.length,
+                message: result.log
+              }));
+            } else {
               res.statusCode = 500;
               res.end(JSON.stringify({
                 success: false,
-                error: `Python 스크립트 실행 오류: ${error.message}`
+                error: workerError(result)
               }));
-            });
+            }
 
           } catch (error) {
             res.statusCode = 500;